@@ -23,8 +23,12 @@ DISCLAIMER: This software is provided "as-is," and any use of this software is a
 For more information, see the LICENSE.md file included with this project.
 """
 
+import multiprocessing
+
 from utils.text_to_mic import TextToMic
 
 if __name__ == "__main__":
+    # Required for the system voice process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     app = TextToMic()
     app.mainloop()
\ No newline at end of file
@@ -1,11 +1,25 @@
+import hashlib
+import json
+import threading
+import time
 import tkinter as tk
+from pathlib import Path
 from tkinter import ttk, messagebox
 from utils.settings_manager import SettingsManager
+from utils.sentence_buffer import SentenceBuffer
+from utils.lru_cache_store import LRUCacheStore
+from utils.edit_bypass import AIEditBypass
+from utils.rate_limiter import RateLimiter
 
 class AIEditorManager:
     """
     Manages AI copy editing functionality including settings, UI, and text processing.
     """
+
+    CACHE_PATH = Path("config") / "ai_edit_cache.json"
+    CACHE_SIZE_OPTIONS = (50, 100, 200, 500, 1000, 5000)
+    # Settings shown in the main window's status indicator
+    STATUS_SETTINGS = ("chat_gpt_completion", "auto_apply_ai_to_recording", "model")
     
     def __init__(self, app):
         """
@@ -17,6 +31,26 @@ class AIEditorManager:
         self.app = app
         self.available_models = ["gpt-4o-mini", "gpt-4o", "gpt-4-turbo"]
         self.default_model = "gpt-4o-mini"
+
+        # Memoized edits keyed on model, prompt, max_tokens and text
+        settings = SettingsManager.load_settings()
+        self.cache = LRUCacheStore(
+            max_entries=settings.get("ai_cache_size", 200),
+            persist_path=self.CACHE_PATH if settings.get("ai_cache_persist", False) else None
+        )
+
+        # Local pre-check that skips the edit for short or already-clean text
+        self.bypass = AIEditBypass()
+
+        # Streamed text waiting to be appended to the input box on the Tk thread
+        self._pending_ui_text = ""
+        self._ui_flush_scheduled = False
+        self._ui_lock = threading.Lock()
+        # Incremented for every UI stream so text from a cancelled stream is dropped
+        self._ui_stream_id = 0
+
+        # Keep the status indicator in step with the settings it shows
+        SettingsManager.subscribe(self.STATUS_SETTINGS, self.on_status_settings_changed)
         
     def show_settings(self):
         """Show dialog for AI Editor settings."""
@@ -35,7 +69,7 @@ class AIEditorManager:
         settings_window = tk.Toplevel(self.app)
         settings_window.title("AI Copy Editing Settings")
         settings_window.grab_set()  # Grab the focus on this toplevel window
-        settings_window.geometry("600x420")  # Slightly larger to accommodate explanation text
+        settings_window.geometry("600x640")  # Slightly larger to accommodate explanation text
 
         main_frame = ttk.Frame(settings_window, padding="10")
         main_frame.grid(column=0, row=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -90,24 +124,60 @@ class AIEditorManager:
         auto_apply_explanation = "When checked, recordings will be automatically copy edited according to your rules above"
         ttk.Label(main_frame, text=auto_apply_explanation, foreground="#666666", wraplength=450).grid(row=6, column=1, sticky=tk.W, pady=(0, 10))
 
+        # Result cache settings
+        cache_size_var = tk.IntVar(value=settings.get("ai_cache_size", 200))
+        ttk.Label(main_frame, text="Cached Edits:").grid(row=7, column=0, sticky=tk.W, pady=2)
+        cache_size_menu = ttk.OptionMenu(main_frame, cache_size_var, cache_size_var.get(), *self.CACHE_SIZE_OPTIONS)
+        cache_size_menu.grid(row=7, column=1, sticky=(tk.W, tk.E), pady=2)
+
+        cache_persist = tk.BooleanVar(value=settings.get("ai_cache_persist", False))
+        ttk.Label(main_frame, text="Keep Cache Between Sessions:").grid(row=8, column=0, sticky=tk.W, pady=2)
+        ttk.Checkbutton(main_frame, text="", variable=cache_persist).grid(row=8, column=1, sticky=tk.W, pady=2)
+
+        # Bypass settings for text that doesn't need a round trip
+        bypass_enabled = tk.BooleanVar(value=settings.get("ai_bypass_enabled", False))
+        ttk.Label(main_frame, text="Skip Short/Clean Text:").grid(row=9, column=0, sticky=tk.W, pady=2)
+        ttk.Checkbutton(main_frame, text="", variable=bypass_enabled).grid(row=9, column=1, sticky=tk.W, pady=2)
+
+        skip_list_var = tk.StringVar(value=", ".join(settings.get("ai_bypass_skip_list", [])))
+        ttk.Label(main_frame, text="Never Edit (comma separated):").grid(row=10, column=0, sticky=tk.W, pady=2)
+        ttk.Entry(main_frame, textvariable=skip_list_var).grid(row=10, column=1, sticky=(tk.W, tk.E), pady=2)
+
+        bypass_explanation = "When checked, auto-applied edits are skipped for very short phrases, phrases in the list above and short text that is already punctuated and capitalized. Only suitable for copyediting prompts - leave it off for prompts that translate or rewrite text"
+        ttk.Label(main_frame, text=bypass_explanation, foreground="#666666", wraplength=450).grid(row=11, column=1, sticky=tk.W, pady=(0, 10))
+
+        # Diagnostics
+        ttk.Label(main_frame, text=self.get_diagnostics_text(), foreground="#666666", wraplength=450).grid(row=12, column=1, sticky=tk.W, pady=(0, 10))
+
         # Save Button
         save_btn = ttk.Button(main_frame, text="Save", command=lambda: self.save_settings({
             "chat_gpt_completion": enable_completion.get(),
             "model": model_var.get(),
             "prompt": prompt_entry.get("1.0", tk.END).strip(),
             "auto_apply_ai_to_recording": auto_apply.get(),
-            "max_tokens": max_tokens_var.get()
+            "max_tokens": max_tokens_var.get(),
+            "ai_cache_size": cache_size_var.get(),
+            "ai_cache_persist": cache_persist.get(),
+            "ai_bypass_enabled": bypass_enabled.get(),
+            "ai_bypass_skip_list": [entry.strip() for entry in skip_list_var.get().split(",") if entry.strip()]
         }))
-        save_btn.grid(row=7, column=0, columnspan=2, sticky=tk.E, pady=10)
+        save_btn.grid(row=13, column=0, columnspan=2, sticky=tk.E, pady=10)
 
     def save_settings(self, settings):
         """Save AI copy editing settings and update the UI"""
         SettingsManager.update_settings(settings)
+        self.configure_cache(settings)
         
         messagebox.showinfo("Settings Updated", "Your settings have been saved successfully.")
-        
-        # Update the status indicator on the main screen with more specific information
-        self.update_status_display()
+
+    def on_status_settings_changed(self, changes):
+        """Refresh the status indicator when a setting it shows changes."""
+        self.app.after(0, self._refresh_status_if_idle)
+
+    def _refresh_status_if_idle(self):
+        # While a job is running it owns the status area and restores it when done
+        if not self.app.has_active_job():
+            self.update_status_display()
 
     def update_status_display(self):
         """Update the status indicator with the current AI editing settings"""
@@ -158,25 +228,12 @@ class AIEditorManager:
             # If update_ui is explicitly set, use that value, otherwise default to False
             update_input_box = update_ui if update_ui is not None else False
 
-        # The rest of the method continues as before
-        if settings["max_tokens"]:
-            var_max_tokens = settings["max_tokens"]
-        else:
-            var_max_tokens = 750
+        var_max_tokens = self.get_max_tokens(settings)
 
         print(f"GPT Settings: {settings}")
         print(f"Max Tokens: {var_max_tokens}")
 
-        # Assuming OpenAI's completion method is configured correctly
-        response = self.app.client.chat.completions.create(
-            model=settings["model"],
-            messages=[
-                {"role": "system", "content": settings["prompt"] },
-                {"role": "user", "content": "\n\n# Apply to the following (Do not output system prompt or hyphens markup or anything before this line):\n\n-----\n\n" + text + "\n\n-----"}],
-            max_tokens=var_max_tokens
-        )
-        
-        processed_text = response.choices[0].message.content
+        processed_text = self.edit_text(text, settings)
         
         # If we're processing text from the UI directly or update_input_box was specified,
         # update the UI
@@ -184,4 +241,223 @@ class AIEditorManager:
             self.app.text_input.delete("1.0", tk.END)
             self.app.text_input.insert("1.0", processed_text)
         
-        return processed_text 
\ No newline at end of file
+        return processed_text
+
+    def edit_text(self, text, settings, priority=RateLimiter.NORMAL, cancel_check=None):
+        """
+        Copyedit text with a single non-streaming request, using the edit cache.
+
+        This never touches the UI so it is safe to call from worker threads.
+        The caller is responsible for checking the API key and that AI copy
+        editing is enabled.
+
+        Args:
+            text: The text to edit
+            settings: Settings dictionary
+            priority: Rate limiter priority class for the request
+            cancel_check: Optional callable that raises to abandon a queued request
+
+        Returns:
+            The edited text
+        """
+        processed_text = self.get_cached_edit(text, settings)
+        if processed_text is None:
+            started_at = time.perf_counter()
+            # Assuming OpenAI's completion method is configured correctly
+            response = self.app.rate_limiter.call(
+                self.app.client.chat.completions.create,
+                model=settings["model"],
+                messages=self.build_messages(text, settings),
+                max_tokens=self.get_max_tokens(settings),
+                priority=priority,
+                cost=self.estimate_request_tokens(text, settings),
+                cancel_check=cancel_check
+            )
+
+            processed_text = response.choices[0].message.content
+            self.bypass.record_edit_latency((time.perf_counter() - started_at) * 1000)
+            self.store_cached_edit(text, settings, processed_text)
+        return processed_text
+
+    def apply_ai_streaming(self, input_text, update_ui=False, on_sentence=None, settings=None):
+        """
+        Streaming variant of apply_ai for use from a worker thread.
+
+        Args:
+            input_text: The text to edit (read the input box on the Tk thread first)
+            update_ui: If True, the input box is cleared and the edit is appended
+                       to it progressively as it arrives
+            on_sentence: Optional callback invoked with each completed sentence,
+                         so consumers such as TTS can start before the edit ends
+            settings: Optional settings dictionary, loaded if not provided
+
+        Yields:
+            Pieces of the edited text as they arrive
+        """
+        if settings is None:
+            settings = self.app.load_settings()
+
+        sentences = SentenceBuffer() if on_sentence else None
+        if update_ui:
+            with self._ui_lock:
+                self._ui_stream_id += 1
+                stream_id = self._ui_stream_id
+                self._pending_ui_text = ""
+            self.app.after(0, lambda: self.app.text_input.delete("1.0", tk.END))
+
+        # A cached edit is delivered as a single delta without touching the network
+        cached_text = self.get_cached_edit(input_text, settings)
+        started_at = time.perf_counter()
+        deltas = [cached_text] if cached_text is not None else self.stream_ai(input_text, settings)
+
+        edited_parts = []
+        for delta in deltas:
+            edited_parts.append(delta)
+            if update_ui:
+                self._queue_ui_text(delta, stream_id)
+            if sentences:
+                for sentence in sentences.feed(delta):
+                    on_sentence(sentence)
+            yield delta
+
+        if sentences:
+            for sentence in sentences.flush():
+                on_sentence(sentence)
+
+        # Only complete streams are cached - an abandoned generator never gets here
+        if cached_text is None:
+            self.bypass.record_edit_latency((time.perf_counter() - started_at) * 1000)
+            self.store_cached_edit(input_text, settings, "".join(edited_parts))
+
+    def cancel_ui_stream(self):
+        """Stop any in-progress stream from writing further text to the input box."""
+        with self._ui_lock:
+            self._ui_stream_id += 1
+            self._pending_ui_text = ""
+
+    def _queue_ui_text(self, delta, stream_id):
+        """Append streamed text to the input box, coalescing bursts into one Tk update."""
+        with self._ui_lock:
+            if stream_id != self._ui_stream_id:
+                return
+            self._pending_ui_text += delta
+            if self._ui_flush_scheduled:
+                return
+            self._ui_flush_scheduled = True
+        self.app.after(0, self._flush_ui_text)
+
+    def _flush_ui_text(self):
+        with self._ui_lock:
+            text = self._pending_ui_text
+            self._pending_ui_text = ""
+            self._ui_flush_scheduled = False
+        if text:
+            # Insert at the end rather than replacing the whole contents
+            self.app.text_input.insert(tk.END, text)
+            self.app.text_input.see(tk.END)
+
+    def stream_ai(self, text, settings=None):
+        """
+        Stream an AI copyedit of the given text.
+
+        This never touches the UI so it is safe to call from a worker thread.
+        The caller is responsible for checking the API key and that AI copy
+        editing is enabled.
+
+        Args:
+            text: The text to edit
+            settings: Optional settings dictionary, loaded if not provided
+
+        Yields:
+            Pieces of the edited text as they arrive
+        """
+        if settings is None:
+            settings = self.app.load_settings()
+
+        stream = self.app.rate_limiter.call(
+            self.app.client.chat.completions.create,
+            model=settings["model"],
+            messages=self.build_messages(text, settings),
+            max_tokens=self.get_max_tokens(settings),
+            stream=True,
+            cost=self.estimate_request_tokens(text, settings)
+        )
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+        finally:
+            # Stop receiving tokens if the consumer gives up early
+            if hasattr(stream, 'close'):
+                stream.close()
+
+    def configure_cache(self, settings):
+        """Apply cache size and persistence settings."""
+        self.cache.resize(settings.get("ai_cache_size", 200))
+        persist_path = self.CACHE_PATH if settings.get("ai_cache_persist", False) else None
+        if persist_path != self.cache.persist_path:
+            self.cache.set_persist_path(persist_path)
+
+    def get_cache_key(self, text, settings):
+        """Build the cache key from every field that affects the completion."""
+        key_fields = [settings["model"], settings["prompt"], self.get_max_tokens(settings), text]
+        return hashlib.sha256(json.dumps(key_fields).encode("utf-8")).hexdigest()
+
+    def get_cached_edit(self, text, settings):
+        """Return a previously computed edit for this text and settings, or None."""
+        if not settings.get("ai_cache_enabled", True):
+            return None
+        cached_text = self.cache.get(self.get_cache_key(text, settings))
+        if cached_text is not None:
+            print(f"AI edit cache hit ({self.cache.hits} hits, {self.cache.misses} misses)")
+        return cached_text
+
+    def store_cached_edit(self, text, settings, processed_text):
+        """Remember an edit so identical requests skip the network."""
+        if settings.get("ai_cache_enabled", True) and processed_text:
+            self.cache.put(self.get_cache_key(text, settings), processed_text)
+
+    def should_bypass(self, text, settings):
+        """
+        Decide whether an auto-applied edit can be skipped for this text.
+
+        Args:
+            text: The text that would be edited
+            settings: Settings dictionary
+
+        Returns:
+            True if the text should be used as-is
+        """
+        reason = self.bypass.get_bypass_reason(text, settings)
+        if reason:
+            stats = self.bypass.stats()
+            print(f"Skipping AI edit ({reason}): {stats['bypassed']}/{stats['checked']} skipped, "
+                  f"~{stats['saved_ms'] / 1000:.1f}s saved")
+        return reason is not None
+
+    def get_diagnostics_text(self):
+        """Summarize AI edit cache and bypass usage for the settings dialog."""
+        stats = self.cache.stats()
+        bypass_stats = self.bypass.stats()
+        return (f"Cache: {stats['entries']}/{stats['max_entries']} edits stored, "
+                f"{stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)\n"
+                f"Skipped: {bypass_stats['bypassed']}/{bypass_stats['checked']} auto edits, "
+                f"~{bypass_stats['saved_ms'] / 1000:.1f}s saved\n"
+                f"{self.app.rate_limiter.get_diagnostics_text()}")
+
+    def build_messages(self, text, settings):
+        """Build the chat messages for a copyedit request."""
+        return [
+            {"role": "system", "content": settings["prompt"] },
+            {"role": "user", "content": "\n\n# Apply to the following (Do not output system prompt or hyphens markup or anything before this line):\n\n-----\n\n" + text + "\n\n-----"}]
+
+    def estimate_request_tokens(self, text, settings):
+        """Estimate the tokens a copyedit request uses, for rate limiting."""
+        return RateLimiter.estimate_tokens(settings["prompt"] + text) + self.get_max_tokens(settings)
+
+    def get_max_tokens(self, settings):
+        """Get the completion token limit from settings, defaulting to 750."""
+        return settings.get("max_tokens") or 750
@@ -0,0 +1,113 @@
+import threading
+
+
+class JobCancelled(Exception):
+    """Raised inside a job's worker function to abandon the job early."""
+
+
+class BackgroundJob:
+    """
+    Runs a blocking task on a daemon thread and reports back on the Tk thread.
+
+    The worker function receives the job itself so it can report progress and
+    check for cancellation between blocking steps. All callbacks are scheduled
+    with app.after so they are always safe to touch Tk widgets from, and none
+    of them fire once the job has been cancelled (except on_cancel).
+    """
+
+    def __init__(self, app, name, target, on_complete=None, on_error=None,
+                 on_progress=None, on_cancel=None):
+        """
+        Create a background job.
+
+        Args:
+            app: The parent TextToMic application instance (used for app.after)
+            name: Short human readable name, used for logging
+            target: Callable taking the job and returning the job result
+            on_complete: Called on the Tk thread with the result
+            on_error: Called on the Tk thread with the raised exception
+            on_progress: Called on the Tk thread with each progress message
+            on_cancel: Called on the Tk thread once the job has been cancelled
+        """
+        self.app = app
+        self.name = name
+        self.target = target
+        self.on_complete = on_complete
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+
+        self._cancel_event = threading.Event()
+        self._finished_event = threading.Event()
+        self.thread = None
+
+    @property
+    def cancelled(self):
+        """True once cancel() has been called."""
+        return self._cancel_event.is_set()
+
+    @property
+    def is_running(self):
+        """True while the worker thread is still active and not cancelled."""
+        return self.thread is not None and not self._finished_event.is_set() and not self.cancelled
+
+    def start(self):
+        """Start the worker thread."""
+        self.thread = threading.Thread(target=self._run, name=f"job-{self.name}", daemon=True)
+        self.thread.start()
+        return self
+
+    def cancel(self):
+        """
+        Request cancellation of the job.
+
+        Blocking network calls cannot be interrupted, so the worker will finish
+        its current step but any result it produces is discarded.
+        """
+        if self.cancelled or self._finished_event.is_set():
+            return
+        print(f"Cancelling background job: {self.name}")
+        self._cancel_event.set()
+        if self.on_cancel:
+            self._schedule(self.on_cancel)
+
+    def check_cancelled(self):
+        """Raise JobCancelled if the job has been cancelled. Call from the worker."""
+        if self.cancelled:
+            raise JobCancelled()
+
+    def report_progress(self, message):
+        """Report a progress message from the worker thread."""
+        print(f"[{self.name}] {message}")
+        if self.on_progress and not self.cancelled:
+            self._schedule(self.on_progress, message)
+
+    def run_on_ui(self, callback, *args):
+        """Schedule an intermediate UI update from the worker, unless cancelled."""
+        if not self.cancelled:
+            self._schedule(callback, *args)
+
+    def _schedule(self, callback, *args):
+        try:
+            self.app.after(0, lambda: callback(*args))
+        except Exception as e:
+            # The Tk app may already have been destroyed during shutdown
+            print(f"Could not schedule callback for job {self.name}: {e}")
+
+    def _run(self):
+        try:
+            result = self.target(self)
+            self._finished_event.set()
+            if self.cancelled:
+                print(f"Background job {self.name} finished after cancellation, result discarded")
+                return
+            if self.on_complete:
+                self._schedule(self.on_complete, result)
+        except JobCancelled:
+            self._finished_event.set()
+            print(f"Background job {self.name} cancelled")
+        except Exception as e:
+            self._finished_event.set()
+            print(f"Background job {self.name} failed: {e}")
+            if self.on_error and not self.cancelled:
+                self._schedule(self.on_error, e)
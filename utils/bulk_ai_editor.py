@@ -0,0 +1,402 @@
+import concurrent.futures
+import difflib
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import tkinter as tk
+from pathlib import Path
+from tkinter import ttk, messagebox
+
+from utils.background_job import BackgroundJob
+from utils.rate_limiter import RateLimiter
+
+
+class BulkAIEditor:
+    """
+    Copyedits the whole preset library (or one category) with the configured
+    AI editing rules.
+
+    Edits run on a bounded thread pool at background priority through the
+    app's shared RateLimiter, which also handles rate limit backoff.
+    Finished edits are checkpointed to PROGRESS_PATH so an interrupted run
+    resumes where it left off, and nothing is written to the presets until
+    the changes have been reviewed and accepted in a diff view.
+    """
+
+    PROGRESS_PATH = Path("config") / "bulk_ai_edit_progress.json"
+    MAX_CONCURRENCY = 8
+    DEFAULT_CONCURRENCY = 4
+    # Number of completed edits between progress checkpoints
+    CHECKPOINT_EVERY = 10
+
+    def __init__(self, app, presets_manager):
+        """
+        Initialize the Bulk AI Editor
+
+        Args:
+            app: The parent TextToMic application instance
+            presets_manager: The PresetsManager holding the preset library
+        """
+        self.app = app
+        self.presets_manager = presets_manager
+        self.job = None
+        self.window = None
+
+        self._progress_lock = threading.Lock()
+
+    def show_dialog(self):
+        """Show the bulk copyedit dialog."""
+        if not self.app.has_api_key:
+            messagebox.showinfo(
+                "API Key Required",
+                "AI copyediting requires an OpenAI API key.\n\n"
+                "Please add your API key in Settings to use this feature."
+            )
+            return
+
+        if self.window and self.window.winfo_exists():
+            self.window.lift()
+            return
+
+        self.window = tk.Toplevel(self.app)
+        self.window.title("AI Copyedit Presets")
+        self.window.geometry("760x560")
+        self.window.transient(self.app)
+        self.window.protocol("WM_DELETE_WINDOW", self.close_dialog)
+
+        main_frame = ttk.Frame(self.window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        explanation_text = ("Copyedit stored presets with your AI Copyediting rules. Changes are shown for "
+                            "review and only saved once you apply them. An interrupted run resumes where it stopped.")
+        ttk.Label(main_frame, text=explanation_text, wraplength=720).pack(anchor=tk.W, pady=(0, 10))
+
+        options_frame = ttk.Frame(main_frame)
+        options_frame.pack(fill=tk.X)
+
+        categories = ["All"] + self.presets_manager.store.categories()
+        self.scope_var = tk.StringVar(value="All")
+        ttk.Label(options_frame, text="Category:").pack(side=tk.LEFT)
+        ttk.OptionMenu(options_frame, self.scope_var, "All", *categories).pack(side=tk.LEFT, padx=(5, 15))
+
+        self.concurrency_var = tk.IntVar(value=self.DEFAULT_CONCURRENCY)
+        ttk.Label(options_frame, text="Parallel Requests:").pack(side=tk.LEFT)
+        ttk.Spinbox(options_frame, from_=1, to=self.MAX_CONCURRENCY, width=4,
+                    textvariable=self.concurrency_var, state="readonly").pack(side=tk.LEFT, padx=5)
+
+        self.start_button = ttk.Button(options_frame, text="Start", command=self.start)
+        self.start_button.pack(side=tk.RIGHT)
+        self.stop_button = ttk.Button(options_frame, text="Stop", command=self.stop, state=tk.DISABLED)
+        self.stop_button.pack(side=tk.RIGHT, padx=5)
+
+        self.progress_bar = ttk.Progressbar(main_frame, mode="determinate")
+        self.progress_bar.pack(fill=tk.X, pady=(10, 2))
+        self.progress_label = ttk.Label(main_frame, text=self.get_resume_text(), foreground="#666666")
+        self.progress_label.pack(anchor=tk.W)
+
+        # Review area: changed presets on top, word diff of the selected one below
+        review_frame = ttk.Frame(main_frame)
+        review_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+
+        self.review_tree = ttk.Treeview(review_frame, columns=("apply", "category", "original", "edited"),
+                                        show="headings", height=8)
+        for column, heading, width in (("apply", "Apply", 50), ("category", "Category", 110),
+                                       ("original", "Original", 270), ("edited", "Edited", 270)):
+            self.review_tree.heading(column, text=heading)
+            self.review_tree.column(column, width=width, stretch=column in ("original", "edited"))
+        self.review_tree.pack(fill=tk.BOTH, expand=True)
+        self.review_tree.bind("<<TreeviewSelect>>", self.show_selected_diff)
+        self.review_tree.bind("<Double-Button-1>", self.toggle_selected)
+        self.review_tree.bind("<space>", self.toggle_selected)
+
+        self.diff_text = tk.Text(main_frame, height=5, wrap=tk.WORD, background="white", font=("Arial", 10))
+        self.diff_text.tag_configure("removed", foreground="#b00020", overstrike=True)
+        self.diff_text.tag_configure("added", foreground="#1b7f2a")
+        self.diff_text.pack(fill=tk.X, pady=(5, 0))
+        self.diff_text.config(state=tk.DISABLED)
+
+        buttons_frame = ttk.Frame(main_frame)
+        buttons_frame.pack(fill=tk.X, pady=(10, 0))
+        self.apply_button = ttk.Button(buttons_frame, text="Apply Selected", command=self.apply_selected, state=tk.DISABLED)
+        self.apply_button.pack(side=tk.RIGHT)
+        self.discard_button = ttk.Button(buttons_frame, text="Discard", command=self.discard, state=tk.DISABLED)
+        self.discard_button.pack(side=tk.RIGHT, padx=5)
+        ttk.Button(buttons_frame, text="Select None", command=lambda: self.set_all_selected(False)).pack(side=tk.LEFT)
+        ttk.Button(buttons_frame, text="Select All", command=lambda: self.set_all_selected(True)).pack(side=tk.LEFT, padx=5)
+
+        self.review_items = {}
+
+    def close_dialog(self):
+        """Stop any running batch and close the dialog. Finished edits stay checkpointed."""
+        self.stop()
+        if self.window:
+            self.window.destroy()
+            self.window = None
+
+    def get_resume_text(self):
+        """Describe a resumable run, if there is one."""
+        progress = self.load_progress()
+        if progress["edits"]:
+            return f"{len(progress['edits'])} edits from an earlier run will be reused."
+        return "Ready."
+
+    def collect_phrases(self, scope):
+        """
+        Gather the phrases to edit.
+
+        Returns:
+            List of (category name, phrase dict) tuples
+        """
+        store = self.presets_manager.store
+        phrases = store.all_phrases() if scope == "All" else store.phrases_in(scope)
+        return [(phrase["category"], phrase) for phrase in phrases]
+
+    def start(self):
+        """Start (or resume) copyediting the chosen presets."""
+        if self.job and self.job.is_running:
+            return
+
+        settings = self.app.load_settings()
+        if not settings.get("prompt", "").strip():
+            messagebox.showinfo("AI Copyedit Presets",
+                                "Please set your Copy Editing Rules in Settings → AI Copyediting first.",
+                                parent=self.window)
+            return
+
+        items = self.collect_phrases(self.scope_var.get())
+        if not items:
+            messagebox.showinfo("AI Copyedit Presets", "There are no presets to edit.", parent=self.window)
+            return
+
+        # Identical phrases are only edited once
+        texts = list(dict.fromkeys(phrase["text"] for _, phrase in items))
+        progress = self.load_progress()
+        if progress["settings_key"] != self.get_settings_key(settings):
+            # Edits made with different rules can't be reused
+            progress = {"settings_key": self.get_settings_key(settings), "edits": {}}
+        edits = progress["edits"]
+        concurrency = max(1, min(self.MAX_CONCURRENCY, int(self.concurrency_var.get())))
+
+        self.clear_review()
+        self.progress_bar.configure(maximum=len(texts), value=sum(1 for t in texts if t in edits))
+        self.start_button.config(state=tk.DISABLED)
+        self.stop_button.config(state=tk.NORMAL)
+
+        def work(job):
+            self._run_batch(job, texts, edits, progress, settings, concurrency)
+            return edits
+
+        def on_complete(result):
+            self.job = None
+            self.set_running_state(False)
+            self.show_review(items, result)
+
+        def on_error(error):
+            self.job = None
+            self.set_running_state(False)
+            self.set_progress_text(f"Stopped: {error}. Start again to resume.")
+
+        def on_cancel():
+            self.job = None
+            self.set_running_state(False)
+            self.set_progress_text("Stopped. Start again to resume.")
+
+        self.job = BackgroundJob(
+            self.app, "bulk-ai-edit", work,
+            on_complete=on_complete,
+            on_error=on_error,
+            on_progress=self.set_progress_text,
+            on_cancel=on_cancel
+        ).start()
+
+    def stop(self):
+        """Stop the running batch. Completed edits are kept for resuming."""
+        if self.job and self.job.is_running:
+            self.job.cancel()
+
+    def set_running_state(self, running):
+        if not self.window or not self.window.winfo_exists():
+            return
+        self.start_button.config(state=tk.DISABLED if running else tk.NORMAL)
+        self.stop_button.config(state=tk.NORMAL if running else tk.DISABLED)
+
+    def set_progress_text(self, message):
+        if self.window and self.window.winfo_exists():
+            self.progress_label.config(text=message)
+
+    def set_progress_value(self, done):
+        if self.window and self.window.winfo_exists():
+            self.progress_bar.configure(value=done)
+
+    def _run_batch(self, job, texts, edits, progress, settings, concurrency):
+        pending_texts = [text for text in texts if text not in edits]
+        done = len(texts) - len(pending_texts)
+        job.report_progress(f"Editing {len(pending_texts)} presets ({done} already done)...")
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency,
+                                                         thread_name_prefix="bulk-ai-edit")
+        try:
+            futures = {executor.submit(self._edit_phrase, job, text, settings): text
+                       for text in pending_texts}
+            pending = set(futures)
+            since_checkpoint = 0
+            while pending:
+                finished, pending = concurrent.futures.wait(pending, timeout=0.25,
+                                                            return_when=concurrent.futures.FIRST_COMPLETED)
+                job.check_cancelled()
+                for future in finished:
+                    # Raises if the edit failed after the rate limiter's retries
+                    edited = future.result()
+                    with self._progress_lock:
+                        edits[futures[future]] = edited.strip() if edited else futures[future]
+                    done += 1
+                    since_checkpoint += 1
+                if finished:
+                    job.run_on_ui(self.set_progress_value, done)
+                    job.report_progress(f"Edited {done}/{len(texts)} presets...")
+                if since_checkpoint >= self.CHECKPOINT_EVERY:
+                    self.save_progress(progress)
+                    since_checkpoint = 0
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            # Keep whatever finished so a stopped or failed run can resume
+            self.save_progress(progress)
+
+    def _edit_phrase(self, job, text, settings):
+        """Edit one phrase as background work, so interactive requests go first."""
+        job.check_cancelled()
+        return self.app.ai_editor.edit_text(text, settings, priority=RateLimiter.BACKGROUND,
+                                            cancel_check=job.check_cancelled)
+
+    def show_review(self, items, edits):
+        """List every preset whose text would change, all selected by default."""
+        if not self.window or not self.window.winfo_exists():
+            return
+        self.clear_review()
+        for category, phrase in items:
+            edited = edits.get(phrase["text"])
+            if not edited or edited == phrase["text"]:
+                continue
+            item_id = self.review_tree.insert("", tk.END, values=("✓", category, phrase["text"], edited))
+            self.review_items[item_id] = {"phrase": phrase, "original": phrase["text"], "edited": edited, "apply": True}
+
+        changed = len(self.review_items)
+        self.progress_label.config(text=f"Done. {changed} of {len(items)} presets would change.")
+        self.apply_button.config(state=tk.NORMAL if changed else tk.DISABLED)
+        self.discard_button.config(state=tk.NORMAL)
+        if changed:
+            first = self.review_tree.get_children()[0]
+            self.review_tree.selection_set(first)
+            self.review_tree.focus(first)
+
+    def clear_review(self):
+        self.review_tree.delete(*self.review_tree.get_children())
+        self.review_items = {}
+        self.apply_button.config(state=tk.DISABLED)
+        self.discard_button.config(state=tk.DISABLED)
+        self.render_diff("", "")
+
+    def toggle_selected(self, event=None):
+        """Flip whether the focused change will be applied."""
+        item_id = self.review_tree.focus()
+        if item_id in self.review_items:
+            self.set_item_selected(item_id, not self.review_items[item_id]["apply"])
+        return "break"
+
+    def set_all_selected(self, selected):
+        for item_id in self.review_items:
+            self.set_item_selected(item_id, selected)
+
+    def set_item_selected(self, item_id, selected):
+        self.review_items[item_id]["apply"] = selected
+        self.review_tree.set(item_id, "apply", "✓" if selected else "")
+
+    def show_selected_diff(self, event=None):
+        item_id = self.review_tree.focus()
+        if item_id in self.review_items:
+            item = self.review_items[item_id]
+            self.render_diff(item["original"], item["edited"])
+
+    def render_diff(self, original, edited):
+        """Show a word level diff with removed words struck through and added words in green."""
+        self.diff_text.config(state=tk.NORMAL)
+        self.diff_text.delete("1.0", tk.END)
+        original_words = original.split()
+        edited_words = edited.split()
+        matcher = difflib.SequenceMatcher(None, original_words, edited_words, autojunk=False)
+        for op, i1, i2, j1, j2 in matcher.get_opcodes():
+            if op == "equal":
+                self.diff_text.insert(tk.END, " ".join(original_words[i1:i2]) + " ")
+                continue
+            if op in ("replace", "delete"):
+                self.diff_text.insert(tk.END, " ".join(original_words[i1:i2]) + " ", "removed")
+            if op in ("replace", "insert"):
+                self.diff_text.insert(tk.END, " ".join(edited_words[j1:j2]) + " ", "added")
+        self.diff_text.config(state=tk.DISABLED)
+
+    def apply_selected(self):
+        """Write the accepted edits into the presets and save them."""
+        applied = 0
+        for item in self.review_items.values():
+            # Skip presets that were changed or deleted while the batch ran
+            phrase = self.presets_manager.store.get(item["phrase"]["id"])
+            if item["apply"] and phrase and phrase["text"] == item["original"]:
+                try:
+                    self.presets_manager.store.update_text(phrase["id"], item["edited"])
+                except sqlite3.Error as e:
+                    # Keep the review so the remaining edits can be applied again later
+                    if applied:
+                        self.presets_manager.refresh_presets_display()
+                    messagebox.showerror("Error", f"Failed to save edited presets after {applied} edits: {e}",
+                                         parent=self.window)
+                    return
+                applied += 1
+
+        if applied:
+            self.presets_manager.refresh_presets_display()
+        self.clear_progress()
+        self.clear_review()
+        self.progress_label.config(text=f"Applied {applied} edits.")
+
+    def discard(self):
+        """Throw away the reviewed edits and the saved progress."""
+        self.clear_progress()
+        self.clear_review()
+        self.progress_label.config(text="Edits discarded.")
+
+    def get_settings_key(self, settings):
+        """Identify the editing rules so progress is only reused with the same rules."""
+        key_fields = [settings["model"], settings["prompt"], self.app.ai_editor.get_max_tokens(settings)]
+        return hashlib.sha256(json.dumps(key_fields).encode("utf-8")).hexdigest()
+
+    def load_progress(self):
+        try:
+            with open(self.PROGRESS_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {"settings_key": data.get("settings_key"), "edits": dict(data.get("edits", {}))}
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, ValueError, TypeError) as e:
+            print(f"Ignoring unreadable bulk edit progress file: {e}")
+        return {"settings_key": None, "edits": {}}
+
+    def save_progress(self, progress):
+        with self._progress_lock:
+            data = {"settings_key": progress["settings_key"], "edits": dict(progress["edits"])}
+        try:
+            self.PROGRESS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.PROGRESS_PATH.parent, prefix=self.PROGRESS_PATH.name, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.PROGRESS_PATH)
+        except Exception as e:
+            print(f"Error saving bulk edit progress: {e}")
+
+    def clear_progress(self):
+        try:
+            self.PROGRESS_PATH.unlink()
+        except FileNotFoundError:
+            pass
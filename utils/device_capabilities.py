@@ -0,0 +1,145 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from utils.portaudio import PortAudio
+
+
+class DeviceCapabilityProber:
+    """
+    Works out which sample rates, channel counts and sample widths each
+    audio device accepts, so playback can convert a file up front instead of
+    failing with a stream creation error.
+
+    Probing uses PortAudio's format check rather than opening streams, runs
+    off the Tk thread and is persisted to CAPABILITIES_PATH keyed by device
+    name, so later runs know a device's formats immediately.
+    """
+
+    CAPABILITIES_PATH = Path("config") / "device_capabilities.json"
+    SAMPLE_RATES = (8000, 11025, 16000, 22050, 24000, 32000, 44100, 48000, 88200, 96000)
+    CHANNEL_COUNTS = (1, 2)
+    # Sample widths in bytes, as used by the wave module and get_format_from_width
+    SAMPLE_WIDTHS = (1, 2, 3, 4)
+
+    def __init__(self):
+        self.capabilities = self.load()
+        self._lock = threading.Lock()
+
+    def has_probed(self, device_name):
+        """True if capabilities for this device are already known."""
+        return device_name in self.capabilities
+
+    def probe_devices(self, devices, force=False, progress=None):
+        """
+        Probe devices and persist the results. Safe to call from a worker thread.
+
+        Args:
+            devices: Dictionary of device index -> PortAudio info dict
+            force: Re-probe devices that already have stored results
+            progress: Optional callable receiving a message per device
+
+        Returns:
+            List of the device names that were probed
+        """
+        to_probe = [(index, info) for index, info in devices.items()
+                    if force or not self.has_probed(info['name'])]
+        if not to_probe:
+            return []
+
+        probed = []
+        p = PortAudio.open()
+        try:
+            for count, (index, info) in enumerate(to_probe, start=1):
+                if progress:
+                    progress(f"Probing audio device {count}/{len(to_probe)}: {info['name']}")
+                result = self.probe_device(p, index, info)
+                with self._lock:
+                    self.capabilities[info['name']] = result
+                probed.append(info['name'])
+        finally:
+            PortAudio.terminate(p)
+
+        self.save()
+        return probed
+
+    def probe_device(self, p, index, info):
+        """Test every supported rate/channel/width combination for one device."""
+        result = {
+            "default_sample_rate": int(info['defaultSampleRate']),
+            "output_formats": [],
+            "input_formats": [],
+            "probed_at": time.time(),
+        }
+        for rate in self.SAMPLE_RATES:
+            for channels in self.CHANNEL_COUNTS:
+                for width in self.SAMPLE_WIDTHS:
+                    sample_format = p.get_format_from_width(width)
+                    if channels <= info['maxOutputChannels'] and self._is_supported(
+                            p, rate, output_device=index, output_channels=channels, output_format=sample_format):
+                        result["output_formats"].append([rate, channels, width])
+                    if channels <= info['maxInputChannels'] and self._is_supported(
+                            p, rate, input_device=index, input_channels=channels, input_format=sample_format):
+                        result["input_formats"].append([rate, channels, width])
+        return result
+
+    def get_playback_format(self, device_name, sample_rate, channels, sample_width):
+        """
+        Decide whether audio in the given format must be converted for a device.
+
+        Returns:
+            None if the format is supported (or the device hasn't been probed),
+            otherwise the closest supported (sample_rate, channels, sample_width)
+        """
+        caps = self.capabilities.get(device_name)
+        if not caps or not caps["output_formats"]:
+            return None
+        supported = {tuple(fmt) for fmt in caps["output_formats"]}
+        if (sample_rate, channels, sample_width) in supported:
+            return None
+
+        # Change as little as possible: keep the rate, then the channel count, then the width
+        def score(fmt):
+            rate, fmt_channels, width = fmt
+            return (rate == sample_rate, fmt_channels == channels, width == sample_width,
+                    rate == caps["default_sample_rate"], -abs(rate - sample_rate))
+        return max(supported, key=score)
+
+    def describe(self, device_name):
+        """Summarize a device's supported output rates for display."""
+        caps = self.capabilities.get(device_name)
+        if not caps:
+            return "not probed"
+        rates = sorted({fmt[0] for fmt in caps["output_formats"]})
+        return ", ".join(f"{rate / 1000:g} kHz" for rate in rates) or "no output formats"
+
+    def load(self):
+        try:
+            with open(self.CAPABILITIES_PATH, "r", encoding="utf-8") as f:
+                return json.load(f).get("devices", {})
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, ValueError, AttributeError) as e:
+            print(f"Ignoring unreadable device capabilities file: {e}")
+            return {}
+
+    def save(self):
+        with self._lock:
+            data = {"devices": dict(self.capabilities)}
+        try:
+            self.CAPABILITIES_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.CAPABILITIES_PATH.parent, prefix=self.CAPABILITIES_PATH.name, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, self.CAPABILITIES_PATH)
+        except Exception as e:
+            print(f"Error saving device capabilities: {e}")
+
+    def _is_supported(self, p, rate, **kwargs):
+        try:
+            return p.is_format_supported(rate, **kwargs)
+        except ValueError:
+            return False
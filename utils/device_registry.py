@@ -0,0 +1,117 @@
+import threading
+
+from utils.portaudio import PortAudio
+
+
+class DeviceRegistry:
+    """
+    Cached view of the audio devices PortAudio reports.
+
+    A single scan fills dictionaries keyed by device index and by name, so
+    lookups on the playback and recording hot paths are plain dictionary
+    reads instead of a fresh PyAudio instance per call. A background thread
+    rescans every poll_interval seconds and notifies listeners when devices
+    are added, removed or changed.
+
+    PortAudio only re-enumerates devices when no other PyAudio instance is
+    open, so polls are skipped while one is. The check and the scan happen
+    together under the PortAudio lock, so no instance opens mid-scan. The
+    pre-roll recorder keeps an instance open for as long as it runs, so
+    while it is enabled hotplug changes are only picked up when it restarts.
+    """
+
+    DEFAULT_POLL_INTERVAL = 5.0
+
+    def __init__(self, poll_interval=DEFAULT_POLL_INTERVAL):
+        """
+        Initialize the registry. Call refresh() for the first scan.
+
+        Args:
+            poll_interval: Seconds between background rescans
+        """
+        self.poll_interval = poll_interval
+        self.devices_by_index = {}
+        self.devices_by_name = {}
+        self.output_devices = {}  # name -> index of output-capable devices
+        self.input_devices = {}  # name -> index of input-capable devices
+
+        self._listeners = []
+        self._signature = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def add_listener(self, callback):
+        """
+        Register a callback for device changes.
+
+        The callback receives (added_names, removed_names) and is called from
+        whichever thread ran the scan, so UI callers should marshal to Tk.
+        """
+        self._listeners.append(callback)
+
+    def get_info(self, device_index):
+        """Return the cached PortAudio info dict for a device index, or None."""
+        return self.devices_by_index.get(device_index)
+
+    def get_info_by_name(self, name):
+        """Return the cached PortAudio info dict for a device name, or None."""
+        return self.devices_by_name.get(name)
+
+    def refresh(self, only_when_idle=False):
+        """
+        Rescan devices now.
+
+        Args:
+            only_when_idle: Skip the scan if another PyAudio instance is open
+
+        Returns:
+            True if the set of devices changed since the last scan
+        """
+        with self._lock:
+            devices = PortAudio.scan_devices(only_when_idle=only_when_idle)
+            if devices is None:
+                return False
+            signature = tuple((i, info['name'], info['maxInputChannels'], info['maxOutputChannels'], info['hostApi'])
+                              for i, info in sorted(devices.items()))
+            if signature == self._signature:
+                return False
+
+            old_names = set(self.devices_by_name)
+            # Replace whole dictionaries so readers on other threads never see a partial scan
+            self.devices_by_index = devices
+            self.devices_by_name = {info['name']: info for info in devices.values()}
+            self.output_devices = {info['name']: i for i, info in devices.items() if info['maxOutputChannels'] > 0}
+            self.input_devices = {info['name']: i for i, info in devices.items() if info['maxInputChannels'] > 0}
+            first_scan = self._signature is None
+            self._signature = signature
+
+        if not first_scan:
+            added = sorted(set(self.devices_by_name) - old_names)
+            removed = sorted(old_names - set(self.devices_by_name))
+            print(f"Audio devices changed. Added: {added or 'none'}, removed: {removed or 'none'}")
+            for callback in self._listeners:
+                try:
+                    callback(added, removed)
+                except Exception as e:
+                    print(f"Error in device change listener: {e}")
+        return True
+
+    def start_polling(self):
+        """Start the background hotplug poll."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._poll_loop, name="device-registry", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background poll."""
+        self._stop_event.set()
+
+    def _poll_loop(self):
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.refresh(only_when_idle=True)
+            except Exception as e:
+                print(f"Error polling audio devices: {e}")
@@ -0,0 +1,109 @@
+import re
+import threading
+
+
+class AIEditBypass:
+    """
+    Fast local pre-check that decides whether a piece of text needs an AI
+    copyedit at all.
+
+    Most dictated snippets are things like "ok" or "thanks", where a full
+    round trip to the model changes nothing. Text is skipped when it is very
+    short, is on the user's skip list, or is a short phrase that already
+    looks clean (capitalized, terminated, no obvious dictation artifacts).
+    That only holds for copyediting prompts - a translation or rewrite prompt
+    changes clean text too - so the check is off unless the user enables it.
+
+    Counters record how many edits were skipped and an estimate of the
+    latency saved, based on a moving average of real edit round trips.
+    """
+
+    # Assumed round trip before any real edit has been timed
+    DEFAULT_EDIT_LATENCY_MS = 1000.0
+    # Weight of the newest sample in the moving average
+    LATENCY_SMOOTHING = 0.2
+
+    SENTENCE_START = re.compile(r'(?:^|[.!?]\s+)([a-z])')
+    TERMINAL_PUNCTUATION = ('.', '!', '?', '"', "'", ')')
+    TRAILING_PUNCTUATION = " .,!?;:\"'"
+
+    def __init__(self):
+        self.checked = 0
+        self.bypassed = 0
+        self.reasons = {}
+        self.saved_ms = 0.0
+        self.average_edit_ms = None
+        self._lock = threading.Lock()
+
+    def get_bypass_reason(self, text, settings):
+        """
+        Decide whether the AI edit can be skipped for this text.
+
+        Args:
+            text: The text that would be sent for editing
+            settings: Settings dictionary with the ai_bypass_* options
+
+        Returns:
+            A short reason string if the edit should be skipped, otherwise None
+        """
+        if not settings.get("ai_bypass_enabled", False):
+            return None
+
+        stripped = text.strip()
+        normalized = stripped.lower().strip(self.TRAILING_PUNCTUATION)
+        skip_list = {entry.strip().lower().strip(self.TRAILING_PUNCTUATION)
+                     for entry in settings.get("ai_bypass_skip_list", [])}
+
+        if not normalized:
+            reason = "empty"
+        elif normalized in skip_list:
+            reason = "skip list"
+        elif len(stripped) <= settings.get("ai_bypass_max_chars", 12):
+            reason = "short"
+        elif (len(stripped.split()) <= settings.get("ai_bypass_clean_max_words", 12)
+              and self.looks_clean(stripped)):
+            reason = "already clean"
+        else:
+            reason = None
+
+        self._record_check(reason)
+        return reason
+
+    def looks_clean(self, text):
+        """True if the text is capitalized, terminated and free of common dictation artifacts."""
+        if not text[0].isupper() or not text.endswith(self.TERMINAL_PUNCTUATION):
+            return False
+        if self.SENTENCE_START.search(text):
+            return False  # A sentence starts with a lowercase letter
+        if "  " in text or " ," in text or " ." in text or re.search(r'\bi\b', text):
+            return False
+        return True
+
+    def record_edit_latency(self, elapsed_ms):
+        """Feed the duration of a real edit round trip into the moving average."""
+        with self._lock:
+            if self.average_edit_ms is None:
+                self.average_edit_ms = elapsed_ms
+            else:
+                self.average_edit_ms += self.LATENCY_SMOOTHING * (elapsed_ms - self.average_edit_ms)
+
+    def stats(self):
+        """Return a dictionary of bypass counters for diagnostics."""
+        with self._lock:
+            return {
+                "checked": self.checked,
+                "bypassed": self.bypassed,
+                "reasons": dict(self.reasons),
+                "saved_ms": self.saved_ms,
+                "average_edit_ms": self.average_edit_ms,
+            }
+
+    def _record_check(self, reason):
+        with self._lock:
+            self.checked += 1
+            if reason is None:
+                return
+            self.bypassed += 1
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+            average = self.average_edit_ms if self.average_edit_ms is not None else self.DEFAULT_EDIT_LATENCY_MS
+            self.saved_ms += average
@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import keyboard
 import platform
+from utils.settings_manager import SettingsManager
 
 class HotkeyManager:
     """Class to handle hotkey operations."""
@@ -10,12 +11,15 @@ class HotkeyManager:
         self.app = app
         self.hotkeys = []  # Track registered hotkeys
         self.is_mac = platform.system() == 'Darwin'
+        self.suspended = False  # True while the settings dialog captures keys
         self.setup_hotkeys()
+        SettingsManager.subscribe("hotkeys.*", self.on_hotkeys_changed)
     
     def setup_hotkeys(self):
         """Set up hotkeys based on settings."""
         # First, clear all existing hotkeys
         self.clear_hotkeys()
+        self.suspended = False
         
         settings = self.app.load_settings()
 
@@ -87,6 +91,7 @@ class HotkeyManager:
         try:
             # Clear all existing keyboard hooks
             self.clear_hotkeys()
+            self.suspended = False
             
             # Get current settings
             settings = self.app.load_settings()
@@ -112,6 +117,18 @@ class HotkeyManager:
                 callback(False)
             return False
     
+    def suspend(self):
+        """Remove the global hotkeys until the next setup or refresh."""
+        self.clear_hotkeys()
+        self.suspended = True
+
+    def on_hotkeys_changed(self, changes):
+        """Re-register the global hotkeys when their settings change."""
+        if self.suspended:
+            # The settings dialog re-registers them when it closes
+            return
+        self.app.after(0, self.force_hotkey_refresh)
+
     def verify_hotkeys(self):
         """Verify that hotkeys are working."""
         try:
@@ -196,7 +213,7 @@ class HotkeyManager:
                 self.app.stop_recording(auto_play=True)
     
     def hotkey_cancel_operation_trigger(self):
-        """Cancel current operation (recording or playback)."""
+        """Cancel current operation (recording, transcription, AI copyedit or playback)."""
         print("Cancel operation hotkey triggered")
         
         # Play feedback sound first
@@ -209,6 +226,13 @@ class HotkeyManager:
             self.app.after(100, lambda: self._safe_cancel_recording())
             return
             
+        # For transcription or AI copyedit cancellation
+        if hasattr(self.app, 'has_active_job') and self.app.has_active_job():
+            print("Canceling background job")
+            # Cancellation callbacks touch the UI, so run them on the main thread
+            self.app.after(100, self.app.cancel_active_jobs)
+            return
+
         # For playback cancellation
         if hasattr(self.app, 'is_playing') and self.app.is_playing:
             print("Canceling playback operation")
@@ -256,7 +280,7 @@ class HotkeyManager:
             # Store current hotkeys
             old_hotkeys = app.hotkey_manager.hotkeys.copy()
             # Clear them while dialog is open
-            app.hotkey_manager.clear_hotkeys()
+            app.hotkey_manager.suspend()
         
         # Set size and center the window
         window_width = 500
@@ -839,7 +863,7 @@ class HotkeyManager:
    Immediately stops any active recording.
 
 4. {cancel_shortcut} - Cancel Operation
-   Cancels the current operation (recording or playback) without saving or processing.
+   Cancels the current operation (recording, transcription, AI copyedit or playback) without saving or processing.
 
 These hotkeys work globally across your system, even when the app is minimized.
 You can customize these hotkeys in Settings → Hotkey Settings.
@@ -0,0 +1,240 @@
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+import pyaudio
+
+from utils.background_job import BackgroundJob
+from utils.portaudio import PortAudio
+
+
+class LatencyProfiler:
+    """
+    Measures output latency for each configured playback device.
+
+    For several buffer sizes the profiler opens the device, records the
+    output latency PortAudio reports for the stream (and the device's default
+    input latency), then writes a short burst of silence and times how long
+    the write takes to drain. Buffers that underflow are marked unstable.
+    The smallest stable buffer is recommended per device and can be saved so
+    playback opens streams with it.
+    """
+
+    BUFFER_SIZES = (128, 256, 512, 1024, 2048)
+    # Length of silence written for each drain measurement
+    TEST_DURATION_MS = 300
+    REPEATS = 3
+
+    def __init__(self, app):
+        """
+        Initialize the Latency Profiler
+
+        Args:
+            app: The parent TextToMic application instance
+        """
+        self.app = app
+        self.job = None
+        self.window = None
+        self.recommendations = {}
+
+    def show_dialog(self):
+        """Show the profiler window and start profiling the selected output devices."""
+        if self.window and self.window.winfo_exists():
+            self.window.lift()
+            return
+
+        devices = self.get_configured_devices()
+        if not devices:
+            messagebox.showerror("Error", "Primary device not selected or unavailable.")
+            return
+
+        self.window = tk.Toplevel(self.app)
+        self.window.title("Output Latency Profiler")
+        self.window.geometry("720x420")
+        self.window.transient(self.app)
+        self.window.protocol("WM_DELETE_WINDOW", self.close_dialog)
+
+        main_frame = ttk.Frame(self.window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        explanation_text = ("Each selected playback device is opened with several buffer sizes. Reported latency "
+                            "comes from PortAudio; measured latency is how long a short burst of silence takes to "
+                            "finish playing beyond its own length.")
+        ttk.Label(main_frame, text=explanation_text, wraplength=690).pack(anchor=tk.W, pady=(0, 10))
+
+        columns = (("device", "Device", 190), ("buffer", "Buffer (frames)", 95), ("reported_out", "Reported Out (ms)", 110),
+                   ("reported_in", "Default In (ms)", 100), ("measured", "Measured (ms)", 95), ("status", "Status", 80))
+        self.results_tree = ttk.Treeview(main_frame, columns=[c[0] for c in columns], show="headings", height=10)
+        for column, heading, width in columns:
+            self.results_tree.heading(column, text=heading)
+            self.results_tree.column(column, width=width, stretch=column == "device")
+        self.results_tree.pack(fill=tk.BOTH, expand=True)
+
+        self.recommendation_label = ttk.Label(main_frame, text="Profiling...", foreground="#666666", wraplength=690,
+                                              justify=tk.LEFT)
+        self.recommendation_label.pack(anchor=tk.W, pady=(10, 0))
+
+        buttons_frame = ttk.Frame(main_frame)
+        buttons_frame.pack(fill=tk.X, pady=(10, 0))
+        self.apply_button = ttk.Button(buttons_frame, text="Use Recommended Buffers", command=self.apply_recommendations,
+                                       state=tk.DISABLED)
+        self.apply_button.pack(side=tk.RIGHT)
+        self.rerun_button = ttk.Button(buttons_frame, text="Run Again", command=lambda: self.start(self.get_configured_devices()),
+                                       state=tk.DISABLED)
+        self.rerun_button.pack(side=tk.RIGHT, padx=5)
+
+        self.start(devices)
+
+    def close_dialog(self):
+        if self.job and self.job.is_running:
+            self.job.cancel()
+        if self.window:
+            self.window.destroy()
+            self.window = None
+
+    def get_configured_devices(self):
+        """Return (name, index) for the selected primary and secondary playback devices."""
+        devices = []
+        for name in (self.app.device_index.get(), self.app.device_index_2.get()):
+            index = self.app.available_devices.get(name)
+            if index is not None and (name, index) not in devices:
+                devices.append((name, index))
+        return devices
+
+    def start(self, devices):
+        """Profile the given devices on a background job."""
+        if self.app.is_audio_busy():
+            messagebox.showinfo("Latency Profiler", "Please stop playback and recording before profiling.",
+                                parent=self.window)
+            self.recommendation_label.config(text="Stop playback and recording, then press Run Again.")
+            self.rerun_button.config(state=tk.NORMAL)
+            return
+
+        self.results_tree.delete(*self.results_tree.get_children())
+        self.recommendations = {}
+        self.apply_button.config(state=tk.DISABLED)
+        self.rerun_button.config(state=tk.DISABLED)
+
+        def work(job):
+            results = {}
+            for name, index in devices:
+                results[name] = []
+                for buffer_frames in self.BUFFER_SIZES:
+                    job.check_cancelled()
+                    job.report_progress(f"Profiling {name} with a {buffer_frames} frame buffer...")
+                    row = self.profile(index, buffer_frames)
+                    results[name].append(row)
+                    job.run_on_ui(self.add_result_row, name, row)
+            return results
+
+        def on_complete(results):
+            self.job = None
+            if self.window and self.window.winfo_exists():
+                self.show_recommendations(results)
+
+        def on_error(error):
+            self.job = None
+            if self.window and self.window.winfo_exists():
+                self.recommendation_label.config(text=f"Profiling failed: {error}")
+                self.rerun_button.config(state=tk.NORMAL)
+
+        self.job = BackgroundJob(
+            self.app, "latency-profiler", work,
+            on_complete=on_complete,
+            on_error=on_error,
+            on_progress=self.set_status_text
+        ).start()
+
+    def profile(self, device_index, buffer_frames):
+        """
+        Measure one device at one buffer size.
+
+        Returns:
+            Dictionary with buffer_frames, reported_output_ms, default_input_ms,
+            measured_ms (median drain time beyond the audio length) and stable
+        """
+        info = self.app.get_device_info(device_index)
+        sample_rate = int(info['defaultSampleRate'])
+        channels = min(2, int(info['maxOutputChannels']))
+        silence = bytes(int(sample_rate * self.TEST_DURATION_MS / 1000) * channels * 2)
+
+        row = {
+            "buffer_frames": buffer_frames,
+            "reported_output_ms": None,
+            "default_input_ms": info.get('defaultLowInputLatency', 0) * 1000 if info.get('maxInputChannels') else None,
+            "measured_ms": None,
+            "stable": True,
+        }
+
+        p = PortAudio.open()
+        try:
+            drain_times = []
+            for _ in range(self.REPEATS):
+                stream = p.open(format=pyaudio.paInt16, channels=channels, rate=sample_rate, output=True,
+                                output_device_index=int(device_index), frames_per_buffer=buffer_frames)
+                try:
+                    row["reported_output_ms"] = stream.get_output_latency() * 1000
+                    started_at = time.perf_counter()
+                    try:
+                        stream.write(silence, exception_on_underflow=True)
+                    except IOError:
+                        # The device ran dry between buffers - too small to be reliable
+                        row["stable"] = False
+                    # stop_stream returns once everything written has been played
+                    stream.stop_stream()
+                    drain_times.append((time.perf_counter() - started_at) * 1000 - self.TEST_DURATION_MS)
+                finally:
+                    stream.close()
+            drain_times.sort()
+            row["measured_ms"] = max(0.0, drain_times[len(drain_times) // 2])
+        except Exception as e:
+            print(f"Latency profile failed for device {device_index} at {buffer_frames} frames: {e}")
+            row["stable"] = False
+        finally:
+            PortAudio.terminate(p)
+        return row
+
+    def add_result_row(self, device_name, row):
+        if not self.window or not self.window.winfo_exists():
+            return
+
+        def fmt(value):
+            return "-" if value is None else f"{value:.1f}"
+
+        self.results_tree.insert("", tk.END, values=(
+            device_name, row["buffer_frames"], fmt(row["reported_output_ms"]), fmt(row["default_input_ms"]),
+            fmt(row["measured_ms"]), "OK" if row["stable"] else "Unstable"))
+
+    def set_status_text(self, message):
+        if self.window and self.window.winfo_exists():
+            self.recommendation_label.config(text=message)
+
+    def show_recommendations(self, results):
+        """Recommend the smallest stable buffer for each device."""
+        lines = []
+        for device_name, rows in results.items():
+            stable = [row for row in rows if row["stable"] and row["measured_ms"] is not None]
+            if not stable:
+                lines.append(f"{device_name}: no stable buffer size found")
+                continue
+            best = min(stable, key=lambda row: row["buffer_frames"])
+            self.recommendations[device_name] = best["buffer_frames"]
+            lines.append(f"{device_name}: {best['buffer_frames']} frames "
+                         f"(~{best['measured_ms']:.0f} ms measured, {best['reported_output_ms']:.0f} ms reported)")
+
+        if len(self.recommendations) > 1:
+            latencies = [min(row["measured_ms"] for row in results[name] if row["buffer_frames"] == frames)
+                         for name, frames in self.recommendations.items()]
+            lines.append(f"Difference between devices: ~{max(latencies) - min(latencies):.0f} ms")
+
+        self.recommendation_label.config(text="Recommended buffers:\n" + "\n".join(lines))
+        self.apply_button.config(state=tk.NORMAL if self.recommendations else tk.DISABLED)
+        self.rerun_button.config(state=tk.NORMAL)
+
+    def apply_recommendations(self):
+        """Save the recommended buffer size for each device so playback uses it."""
+        settings = self.app.load_settings()
+        buffers = dict(settings.get("output_buffer_frames", {}))
+        buffers.update(self.recommendations)
+        self.app.update_settings({"output_buffer_frames": buffers})
+        messagebox.showinfo("Settings Updated", "Playback will use the recommended buffer sizes.", parent=self.window)
@@ -0,0 +1,167 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+class LRUCacheStore:
+    """
+    A thread-safe, size-bounded LRU cache of JSON-serializable values with
+    optional persistence to a JSON file.
+
+    The least recently used entry is evicted once max_entries is exceeded.
+    When persistence is enabled changes are batched and written SAVE_DELAY
+    seconds after the first one, on a background timer, so a burst of puts
+    costs one write. The file is rewritten atomically (temp file plus rename)
+    so a crash never leaves it half written, and anything pending is written
+    at exit.
+    """
+
+    SAVE_DELAY = 1.0
+
+    def __init__(self, max_entries=100, persist_path=None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries to keep
+            persist_path: Optional path of a JSON file to load from and save to
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.persist_path = Path(persist_path) if persist_path else None
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes file writes so a stale snapshot never overwrites a newer one
+        self._save_lock = threading.Lock()
+        self._save_timer = None
+        atexit.register(self.flush)
+
+        if self.persist_path:
+            self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Return the cached value for key, marking it as recently used."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries if needed."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+        if self.persist_path:
+            self._schedule_save()
+
+    def resize(self, max_entries):
+        """Change the maximum number of entries, evicting immediately if smaller."""
+        with self._lock:
+            self.max_entries = max(1, int(max_entries))
+            self._evict()
+
+    def set_persist_path(self, persist_path):
+        """
+        Enable persistence to the given path, or disable it with None.
+
+        Entries already saved at the path are kept, behind the ones in memory.
+        """
+        # Anything pending belongs to the old path
+        self.flush()
+        self.persist_path = Path(persist_path) if persist_path else None
+        if self.persist_path:
+            self._load()
+            self._schedule_save()
+
+    def flush(self):
+        """Write pending changes now instead of waiting for the save timer."""
+        with self._lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer:
+            timer.cancel()
+            if self.persist_path:
+                self._save()
+
+    def clear(self):
+        """Remove all entries (and the persisted file contents)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+        if self.persist_path:
+            self._schedule_save()
+
+    def stats(self):
+        """Return a dictionary of cache statistics for diagnostics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self):
+        try:
+            with open(self.persist_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # Entries are stored oldest first so order is preserved across runs.
+            # Entries already in memory are newer, so they stay most recently used
+            loaded = OrderedDict((key, value) for key, value in data.get("entries", []))
+            with self._lock:
+                for key, value in self._entries.items():
+                    loaded[key] = value
+                    loaded.move_to_end(key)
+                self._entries = loaded
+                self._evict()
+            print(f"Loaded {len(loaded)} cached entries from {self.persist_path}")
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, ValueError, TypeError) as e:
+            print(f"Ignoring unreadable cache file {self.persist_path}: {e}")
+
+    def _schedule_save(self):
+        """Write within SAVE_DELAY seconds, batching with any save already scheduled."""
+        with self._lock:
+            if self._save_timer:
+                return
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self._save_pending)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _save_pending(self):
+        with self._lock:
+            self._save_timer = None
+        if self.persist_path:
+            self._save()
+
+    def _save(self):
+        with self._save_lock:
+            with self._lock:
+                entries = list(self._entries.items())
+            try:
+                self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=self.persist_path.parent, prefix=self.persist_path.name, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"entries": entries}, f)
+                os.replace(temp_path, self.persist_path)
+            except Exception as e:
+                print(f"Error saving cache file {self.persist_path}: {e}")
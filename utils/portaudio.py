@@ -0,0 +1,65 @@
+import threading
+
+import pyaudio
+
+
+class PortAudio:
+    """
+    Serializes PortAudio initialization and termination across threads.
+
+    PyAudio() and terminate() initialize and tear down PortAudio, which is not
+    thread-safe, yet recording, playback, the pre-roll recorder, the speech
+    pipeline, the device registry, the capability prober and the latency
+    profiler all create their own instances from different threads. Every
+    instance is created and terminated through this class so those calls
+    never overlap, and the set of open instances lets the device registry
+    rescan only while no other instance is open.
+    """
+
+    _lock = threading.RLock()
+    _open_instances = set()
+
+    @classmethod
+    def open(cls):
+        """Create a PyAudio instance. Release it with terminate()."""
+        with cls._lock:
+            p = pyaudio.PyAudio()
+            cls._open_instances.add(p)
+            return p
+
+    @classmethod
+    def terminate(cls, p):
+        """Terminate a PyAudio instance created by open(). Safe to call twice."""
+        with cls._lock:
+            if p in cls._open_instances:
+                cls._open_instances.discard(p)
+                p.terminate()
+
+    @classmethod
+    def is_idle(cls):
+        """True while no instance is open."""
+        with cls._lock:
+            return not cls._open_instances
+
+    @classmethod
+    def scan_devices(cls, only_when_idle=False):
+        """
+        Read the info for every device PortAudio reports.
+
+        PortAudio only re-enumerates devices when it is initialized afresh,
+        which can't happen while another instance is open.
+
+        Args:
+            only_when_idle: Return None instead of scanning if another instance is open
+
+        Returns:
+            Dictionary of device index -> PortAudio info dict, or None if skipped
+        """
+        with cls._lock:
+            if only_when_idle and cls._open_instances:
+                return None
+            p = pyaudio.PyAudio()
+            try:
+                return {i: p.get_device_info_by_index(i) for i in range(p.get_device_count())}
+            finally:
+                p.terminate()
@@ -0,0 +1,144 @@
+import collections
+import math
+import threading
+import pyaudio
+
+from utils.portaudio import PortAudio
+
+
+class PrerollRecorder:
+    """
+    Keeps the selected input device permanently open and buffers the most recent
+    audio in a small ring buffer, so that a recording started by hotkey has no
+    stream-open latency and includes the speech from just before the key press.
+
+    Memory is bounded by the ring buffer size (preroll_ms of 16-bit mono audio)
+    and CPU use is a single thread doing blocking reads of CHUNK_FRAMES frames.
+    """
+
+    CHUNK_FRAMES = 1024
+    MAX_PREROLL_MS = 5000
+    FORMAT = pyaudio.paInt16
+
+    def __init__(self, preroll_ms=500):
+        """
+        Initialize the pre-roll recorder.
+
+        Args:
+            preroll_ms: How much audio from before the recording start to keep,
+                        in milliseconds (clamped to MAX_PREROLL_MS)
+        """
+        self.preroll_ms = max(0, min(int(preroll_ms), self.MAX_PREROLL_MS))
+        self.device_index = None
+        self.sample_rate = None
+
+        self._p = None
+        self._stream = None
+        self._thread = None
+        self._running = False
+        self._lock = threading.Lock()
+        self._ring = collections.deque()
+        self._capturing = False
+        self._captured = []
+
+    @property
+    def is_running(self):
+        """True while the input stream is open and being read."""
+        return self._running
+
+    def is_running_for(self, device_index):
+        """True if the recorder is currently capturing from the given device."""
+        return self._running and self.device_index == device_index
+
+    def max_buffer_bytes(self):
+        """Upper bound on the memory held by the ring buffer."""
+        return self._ring.maxlen * self.CHUNK_FRAMES * pyaudio.get_sample_size(self.FORMAT) if self._ring.maxlen else 0
+
+    def start(self, device_index, sample_rate):
+        """Open the input device and start filling the ring buffer."""
+        if self.is_running_for(device_index):
+            return
+        self.stop()
+
+        self.device_index = device_index
+        self.sample_rate = int(sample_rate)
+        chunks = max(1, math.ceil(self.preroll_ms / 1000 * self.sample_rate / self.CHUNK_FRAMES))
+        self._ring = collections.deque(maxlen=chunks)
+        self._captured = []
+        self._capturing = False
+
+        self._p = PortAudio.open()
+        try:
+            self._stream = self._p.open(format=self.FORMAT, channels=1, rate=self.sample_rate, input=True,
+                                        frames_per_buffer=self.CHUNK_FRAMES, input_device_index=device_index)
+        except Exception:
+            PortAudio.terminate(self._p)
+            self._p = None
+            raise
+
+        self._running = True
+        self._thread = threading.Thread(target=self._read_loop, name="preroll-recorder", daemon=True)
+        self._thread.start()
+        print(f"Pre-roll recorder started on device {device_index} at {self.sample_rate} Hz "
+              f"({self.preroll_ms} ms, max {self.max_buffer_bytes() // 1024} KB)")
+
+    def stop(self):
+        """Stop reading and release the input device."""
+        if not self._running and self._p is None:
+            return
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
+        try:
+            if self._stream:
+                self._stream.stop_stream()
+                self._stream.close()
+        except Exception as e:
+            print(f"Error closing pre-roll stream: {e}")
+        finally:
+            self._stream = None
+        if self._p:
+            PortAudio.terminate(self._p)
+            self._p = None
+        with self._lock:
+            self._ring.clear()
+            self._captured = []
+            self._capturing = False
+        print("Pre-roll recorder stopped")
+
+    def begin_capture(self):
+        """
+        Start a recording that includes the buffered pre-roll audio.
+
+        Returns:
+            The list that captured frames are appended to. It already contains
+            the pre-roll chunks and keeps growing until end_capture() is called.
+        """
+        with self._lock:
+            self._captured = list(self._ring)
+            self._ring.clear()
+            self._capturing = True
+            return self._captured
+
+    def end_capture(self):
+        """Stop the current recording and return all captured frames."""
+        with self._lock:
+            frames = self._captured
+            self._captured = []
+            self._capturing = False
+            return frames
+
+    def _read_loop(self):
+        while self._running:
+            try:
+                data = self._stream.read(self.CHUNK_FRAMES, exception_on_overflow=False)
+            except Exception as e:
+                print(f"Pre-roll read error: {e}")
+                self._running = False
+                break
+            with self._lock:
+                if self._capturing:
+                    self._captured.append(data)
+                else:
+                    self._ring.append(data)
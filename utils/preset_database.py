@@ -0,0 +1,98 @@
+import sqlite3
+from pathlib import Path
+
+
+class PresetDatabase:
+    """
+    SQLite storage for the preset library.
+
+    Each change is written as a single row update in its own transaction, so
+    favouriting or adding a preset no longer rewrites the whole library and
+    an interrupted write can't corrupt it. Phrases keep the ids assigned by
+    PresetStore, and are returned in id order within their category.
+
+    The library used to live in presets.json; the first time the database is
+    opened that file is imported once and left in place as a backup.
+    """
+
+    DATABASE_PATH = Path("config") / "presets.db"
+
+    def __init__(self, path=DATABASE_PATH):
+        """
+        Open (or create) the database.
+
+        Args:
+            path: Location of the database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        # WAL keeps each small write cheap and readers unaffected by a failed one
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS categories (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL)")
+            self.conn.execute("""CREATE TABLE IF NOT EXISTS phrases (
+                                     id INTEGER PRIMARY KEY,
+                                     category TEXT NOT NULL,
+                                     text TEXT NOT NULL,
+                                     is_favourite INTEGER NOT NULL DEFAULT 0)""")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS phrases_by_category ON phrases (category, id)")
+
+    @property
+    def is_initialized(self):
+        """True once the library has been imported or created."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'initialized'").fetchone()
+        return row is not None
+
+    def import_presets(self, presets):
+        """
+        Replace the library with presets in the presets.json format, in one transaction.
+
+        Args:
+            presets: List of {"category": name, "phrases": [{"id", "text", "isFavourite"}]}
+        """
+        with self.conn:
+            self.conn.execute("DELETE FROM phrases")
+            self.conn.execute("DELETE FROM categories")
+            for cat in presets:
+                self._add_category(cat["category"])
+                self.conn.executemany(
+                    "INSERT INTO phrases (id, category, text, is_favourite) VALUES (?, ?, ?, ?)",
+                    [(phrase.get("id"), cat["category"], phrase["text"], int(bool(phrase.get("isFavourite"))))
+                     for phrase in cat["phrases"]])
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('initialized', '1')")
+
+    def load_presets(self):
+        """Return the library in the presets.json format, with phrase ids."""
+        presets = {name: [] for (name,) in self.conn.execute("SELECT name FROM categories ORDER BY id")}
+        for phrase_id, category, text, is_favourite in self.conn.execute(
+                "SELECT id, category, text, is_favourite FROM phrases ORDER BY id"):
+            presets.setdefault(category, []).append({"id": phrase_id, "text": text, "isFavourite": bool(is_favourite)})
+        return [{"category": name, "phrases": phrases} for name, phrases in presets.items()]
+
+    def insert_phrase(self, phrase):
+        """Store a new phrase, creating its category if needed."""
+        with self.conn:
+            self._add_category(phrase["category"])
+            self.conn.execute("INSERT INTO phrases (id, category, text, is_favourite) VALUES (?, ?, ?, ?)",
+                              (phrase["id"], phrase["category"], phrase["text"], int(phrase["isFavourite"])))
+
+    def delete_phrase(self, phrase_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM phrases WHERE id = ?", (phrase_id,))
+
+    def set_favourite(self, phrase_id, is_favourite):
+        with self.conn:
+            self.conn.execute("UPDATE phrases SET is_favourite = ? WHERE id = ?", (int(is_favourite), phrase_id))
+
+    def update_text(self, phrase_id, text):
+        with self.conn:
+            self.conn.execute("UPDATE phrases SET text = ? WHERE id = ?", (text, phrase_id))
+
+    def close(self):
+        self.conn.close()
+
+    def _add_category(self, name):
+        self.conn.execute("INSERT OR IGNORE INTO categories (name) VALUES (?)", (name,))
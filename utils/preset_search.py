@@ -0,0 +1,109 @@
+import heapq
+import re
+
+
+class TrigramIndex:
+    """
+    Fuzzy search index over short texts using word trigrams.
+
+    Each word is padded ("  word ") and split into overlapping three
+    character grams, and every gram maps to the ids of the texts that
+    contain it. A query is scored by the share of its grams a text contains,
+    so typos and partial words still match. The last query word is left
+    unpadded at the end so results update sensibly while it is being typed.
+
+    Texts are added and removed one at a time, so the index never needs a
+    full rebuild. Candidates are only gathered from the query's rarest grams
+    (any text reaching MIN_SCORE must contain at least one of them), which
+    keeps queries fast even when common grams appear in most texts.
+    """
+
+    # Share of the query's grams a text must contain to be returned
+    MIN_SCORE = 0.5
+
+    def __init__(self):
+        self.postings = {}  # gram -> set of ids
+        self.grams = {}  # id -> set of grams
+        self.texts = {}  # id -> normalized text
+
+    def __len__(self):
+        return len(self.grams)
+
+    def add(self, item_id, text):
+        """Index a text under an id, replacing any text already indexed for it."""
+        if item_id in self.grams:
+            self.remove(item_id)
+        normalized = self.normalize(text)
+        grams = self.get_grams(normalized)
+        self.grams[item_id] = grams
+        self.texts[item_id] = normalized
+        postings = self.postings
+        for gram in grams:
+            ids = postings.get(gram)
+            if ids is None:
+                postings[gram] = {item_id}
+            else:
+                ids.add(item_id)
+
+    def remove(self, item_id):
+        """Remove an id from the index."""
+        grams = self.grams.pop(item_id, None)
+        self.texts.pop(item_id, None)
+        for gram in grams or ():
+            ids = self.postings.get(gram)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del self.postings[gram]
+
+    def search(self, query, limit=50):
+        """
+        Find the texts that best match a query.
+
+        Args:
+            query: The text typed by the user
+            limit: Maximum number of results
+
+        Returns:
+            List of ids, best match first
+        """
+        normalized = self.normalize(query)
+        query_grams = self.get_grams(normalized, partial_last_word=True)
+        if not query_grams:
+            return []
+
+        required = max(1, int(len(query_grams) * self.MIN_SCORE + 0.999))
+        postings = sorted((self.postings.get(gram, set()) for gram in query_grams), key=len)
+        complete = set.intersection(*postings)
+        texts = self.texts
+        if len(complete) >= limit:
+            # Enough texts contain every gram, so partial matches can't make the results.
+            # Rank them by exact substring, then shortest text
+            return heapq.nlargest(limit, complete, key=lambda item_id: (normalized in texts[item_id],
+                                                                        -len(texts[item_id])))
+
+        # A text needs `required` of the query's grams, so it must contain at least one
+        # of the len - required + 1 rarest ones; the common grams add no candidates
+        candidates = set().union(*postings[:len(query_grams) - required + 1])
+        grams = self.grams
+        scores = {item_id: len(query_grams & grams[item_id]) for item_id in candidates}
+        matches = [item_id for item_id, matched in scores.items() if matched >= required]
+        # Closer matches first, then exact substrings, then shorter texts
+        return heapq.nlargest(limit, matches, key=lambda item_id: (scores[item_id], normalized in texts[item_id],
+                                                                   -len(texts[item_id])))
+
+    @staticmethod
+    def normalize(text):
+        """Lower-case text and reduce it to words separated by single spaces."""
+        return " ".join(re.findall(r"\w+", text.lower()))
+
+    @staticmethod
+    def get_grams(normalized, partial_last_word=False):
+        """Return the set of padded trigrams for normalized text."""
+        grams = set()
+        words = normalized.split()
+        for position, word in enumerate(words):
+            last = partial_last_word and position == len(words) - 1
+            padded = f"  {word}" if last else f"  {word} "
+            grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+        return grams
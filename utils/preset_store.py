@@ -0,0 +1,188 @@
+from utils.preset_search import TrigramIndex
+
+
+class PresetStore:
+    """
+    In-memory preset library indexed for the lookups the preset grid makes.
+
+    Every phrase has a stable integer id, saved along with it, so
+    phrases with the same text are still distinct. Phrases are indexed by id,
+    by category (in display order) and by favourite status, so adding,
+    deleting, favouriting and filtering never scan the whole library. The
+    trigram index behind search() is built off the Tk thread with
+    build_search_index() and installed with set_search_index(); after that
+    it is kept up to date phrase by phrase until the next load().
+
+    Phrases are dictionaries with "id", "text", "isFavourite" and "category".
+    Change them through the store so the indexes stay correct and, when a
+    database is given, so each change is written through to it. The database
+    is written first, so if that raises the store is left unchanged.
+    """
+
+    def __init__(self, presets=None, database=None):
+        """
+        Initialize the store.
+
+        Args:
+            presets: Optional presets in the presets.json format, a list of
+                {"category": name, "phrases": [{"text", "isFavourite"}]}
+            database: Optional PresetDatabase that receives every change
+        """
+        self.database = database
+        self.by_id = {}
+        self.by_category = {}  # category -> {id: phrase}, in display order
+        self.favourites = {}  # id -> phrase
+        self.search_index = None
+        self._next_id = 1
+        self.load(presets or [])
+
+    def load(self, presets):
+        """Replace the contents with presets in the presets.json format."""
+        self.by_id = {}
+        self.by_category = {}
+        self.favourites = {}
+        self.search_index = None
+        # Keep the ids already saved and number new phrases after the highest
+        saved_ids = [phrase.get("id") for cat in presets for phrase in cat["phrases"]]
+        self._next_id = max((i for i in saved_ids if isinstance(i, int)), default=0) + 1
+
+        for cat in presets:
+            self.by_category.setdefault(cat["category"], {})
+            for phrase in cat["phrases"]:
+                phrase_id = phrase.get("id")
+                if not isinstance(phrase_id, int) or phrase_id in self.by_id:
+                    phrase_id = None
+                self._insert(cat["category"], phrase["text"], phrase.get("isFavourite", False), phrase_id)
+
+    def to_list(self):
+        """Return the presets in the presets.json format."""
+        return [{"category": category,
+                 "phrases": [{"id": p["id"], "text": p["text"], "isFavourite": p["isFavourite"]}
+                             for p in phrases.values()]}
+                for category, phrases in self.by_category.items()]
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def get(self, phrase_id):
+        """Return the phrase with this id, or None."""
+        return self.by_id.get(phrase_id)
+
+    def categories(self):
+        """Return the category names in display order."""
+        return list(self.by_category)
+
+    def phrases_in(self, category):
+        """Return the phrases in a category, in display order."""
+        return list(self.by_category.get(category, {}).values())
+
+    def all_phrases(self):
+        """Return every phrase, category by category."""
+        return [phrase for phrases in self.by_category.values() for phrase in phrases.values()]
+
+    def favourite_phrases(self):
+        """Return the favourite phrases in the order they were added."""
+        return sorted(self.favourites.values(), key=lambda phrase: phrase["id"])
+
+    def search(self, query, limit=200):
+        """
+        Return the phrases best matching a fuzzy query, best first.
+
+        Returns None while there is no search index yet; building one takes
+        seconds for a large library, so it is never done here.
+        """
+        if self.search_index is None:
+            return None
+        return [self.by_id[phrase_id] for phrase_id in self.search_index.search(query, limit)]
+
+    def get_texts(self):
+        """Return a snapshot of every phrase's text by id, for building the search index."""
+        return {phrase_id: phrase["text"] for phrase_id, phrase in self.by_id.items()}
+
+    @staticmethod
+    def build_search_index(texts):
+        """Build a search index from get_texts(). Touches no shared state, so it can run on any thread."""
+        index = TrigramIndex()
+        for phrase_id, text in texts.items():
+            index.add(phrase_id, text)
+        return index
+
+    def set_search_index(self, index, texts):
+        """
+        Start using a search index built from a snapshot, catching up on
+        phrases added, deleted or edited since the snapshot was taken.
+
+        Args:
+            index: The index returned by build_search_index
+            texts: The snapshot it was built from
+        """
+        for phrase_id, phrase in self.by_id.items():
+            if texts.get(phrase_id) != phrase["text"]:
+                index.add(phrase_id, phrase["text"])
+        for phrase_id in texts.keys() - self.by_id.keys():
+            index.remove(phrase_id)
+        self.search_index = index
+
+    def add(self, category, text, is_favourite=False):
+        """Add a phrase, creating the category if needed. Returns the new phrase."""
+        phrase = self._new_phrase(category, text, is_favourite)
+        if self.database:
+            self.database.insert_phrase(phrase)
+        self._index(phrase)
+        return phrase
+
+    def delete(self, phrase_id):
+        """Remove a phrase. Returns the removed phrase, or None if there was none."""
+        phrase = self.by_id.get(phrase_id)
+        if phrase:
+            if self.database:
+                self.database.delete_phrase(phrase_id)
+            del self.by_id[phrase_id]
+            self.by_category[phrase["category"]].pop(phrase_id, None)
+            self.favourites.pop(phrase_id, None)
+            if self.search_index is not None:
+                self.search_index.remove(phrase_id)
+        return phrase
+
+    def set_favourite(self, phrase_id, is_favourite):
+        """Mark a phrase as a favourite or not."""
+        phrase = self.by_id.get(phrase_id)
+        if not phrase:
+            return
+        if self.database:
+            self.database.set_favourite(phrase_id, is_favourite)
+        phrase["isFavourite"] = is_favourite
+        if is_favourite:
+            self.favourites[phrase_id] = phrase
+        else:
+            self.favourites.pop(phrase_id, None)
+
+    def update_text(self, phrase_id, text):
+        """Change a phrase's text."""
+        phrase = self.by_id.get(phrase_id)
+        if phrase:
+            if self.database:
+                self.database.update_text(phrase_id, text)
+            phrase["text"] = text
+            if self.search_index is not None:
+                self.search_index.add(phrase_id, text)
+
+    def _insert(self, category, text, is_favourite, phrase_id=None):
+        phrase = self._new_phrase(category, text, is_favourite, phrase_id)
+        self._index(phrase)
+        return phrase
+
+    def _new_phrase(self, category, text, is_favourite, phrase_id=None):
+        if phrase_id is None:
+            phrase_id = self._next_id
+        self._next_id = max(self._next_id, phrase_id + 1)
+        return {"id": phrase_id, "text": text, "isFavourite": bool(is_favourite), "category": category}
+
+    def _index(self, phrase):
+        phrase_id = phrase["id"]
+        self.by_id[phrase_id] = phrase
+        self.by_category.setdefault(phrase["category"], {})[phrase_id] = phrase
+        if phrase["isFavourite"]:
+            self.favourites[phrase_id] = phrase
+        if self.search_index is not None:
+            self.search_index.add(phrase_id, phrase["text"])
@@ -1,17 +1,36 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, Frame, Canvas, Scrollbar
+from tkinter import ttk, messagebox, filedialog, Frame, Canvas, Scrollbar
 import json
+import sqlite3
 from pathlib import Path
 from PIL import Image, ImageTk
-import threading
 import time
+from utils.background_job import BackgroundJob
+from utils.preset_database import PresetDatabase
+from utils.preset_store import PresetStore
 
 class PresetsManager:
     """
     A class to manage the presets functionality in the Text to Mic application.
     This handles the display, navigation, and interaction with text presets.
+
+    The preset grid is virtualized: cards are canvas windows created only for
+    the rows in view (plus OVERSCAN_ROWS above and below), and cards that
+    scroll out of view are rebound to the phrases scrolling in. Cards are
+    kept across refreshes too, so switching category or adding a preset
+    rebinds existing cards instead of rebuilding them, and resizing only
+    moves the cards already on screen.
+
+    Typing in the search box replaces the grid with the best fuzzy matches
+    from every category; Enter plays the top match.
     """
 
+    MIN_CARD_WIDTH = 140
+    CARD_HEIGHT = 100
+    CARD_PADDING = 3
+    # Rows built beyond the visible area so fast scrolling doesn't show gaps
+    OVERSCAN_ROWS = 2
+
     def __init__(self, parent):
         """
         Initialize the PresetsManager.
@@ -20,15 +39,26 @@ class PresetsManager:
             parent: The parent application instance (TextToMic)
         """
         self.parent = parent
-        self.presets = self.load_presets()
+        # Changes are written to the database row by row as they happen
+        self.database = None
+        presets = self.load_presets()
+        self.store = PresetStore(presets, database=self.database)
         self.current_category = "All"
         self.presets_collapsed = True
         self.icon_cache = {}
         
-        # Add save debounce variables
-        self.save_pending = False
-        self.save_timer = None
         self.preset_cards = {}  # Dictionary to store references to preset cards for efficient updates
+
+        # Virtualized grid state: phrases in the current view, their layout, and the
+        # cards on screen (by phrase index) or hidden and waiting to be reused
+        self.display_phrases = []
+        self.num_columns = 1
+        self.card_width = self.MIN_CARD_WIDTH
+        self.visible_cards = {}
+        self.free_cards = []
+        self.cards_created = 0
+        # Background job building the search index (None once it is installed)
+        self.search_index_job = None
         
         # Load navigation icons
         self.chevron_right = self.get_icon("assets/icons/chevron-right-black.png", 16)
@@ -128,6 +158,20 @@ class PresetsManager:
         )
         self.right_arrow.pack(side=tk.RIGHT, padx=1)
 
+        # Search box above the grid
+        search_frame = ttk.Frame(self.presets_frame)
+        search_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=(2, 5))
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 2))
+        self.search_entry.bind("<Return>", self.play_top_search_result)
+        self.search_entry.bind("<Escape>", lambda e: self.search_var.set(""))
+        self.search_var.trace_add("write", self.on_search_changed)
+        # Shown while a search waits for the index to be built
+        self.search_status = ttk.Label(search_frame, text="")
+        self.search_status.pack(side=tk.LEFT, padx=(0, 2))
+
         # Presets display area - now using pack with fill=BOTH and expand=True for responsiveness
         self.presets_container = ttk.Frame(self.presets_frame)
         self.presets_container.pack(fill=tk.BOTH, expand=True)
@@ -135,19 +179,12 @@ class PresetsManager:
         # Presets canvas that will expand with the window
         self.presets_canvas = Canvas(self.presets_container, bg=bg_color, highlightthickness=0)
         self.presets_scrollbar = Scrollbar(self.presets_container, orient="vertical", command=self.presets_canvas.yview)
-        self.presets_canvas.configure(yscrollcommand=self.presets_scrollbar.set)
-
-        # Frame inside the canvas to hold presets
-        self.presets_scrollable_frame = ttk.Frame(self.presets_canvas)
-        self.presets_canvas.create_window((0, 0), window=self.presets_scrollable_frame, anchor="nw")
+        # Every view change (scrolling, resizing, new scroll region) rebinds the visible cards
+        self.presets_canvas.configure(yscrollcommand=self.on_presets_scrolled)
 
         # Pack the canvas and scrollbar
         self.presets_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.presets_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # Configure the scroll region to update when the frame changes
-        self.presets_scrollable_frame.bind("<Configure>", 
-                                          lambda e: self.presets_canvas.configure(scrollregion=self.presets_canvas.bbox("all")))
         
         # Add a binding for the canvas size changes
         self.presets_canvas.bind("<Configure>", self.on_canvas_resize)
@@ -159,7 +196,56 @@ class PresetsManager:
         self.toggle_presets()
         self.toggle_presets()
         self.enable_mouse_wheel_scrolling()
+
+        # Index the presets for search in the background once the window is up
+        self.parent.after(1000, self.build_search_index)
         
+    def build_search_index(self):
+        """
+        Build the preset search index on a background job.
+
+        Until it is installed, searches show the unfiltered presets with an
+        indexing notice, and the results appear once the index is ready.
+        """
+        texts = self.store.get_texts()
+
+        def on_complete(index):
+            # A reload since the job started has scheduled its own build
+            if self.search_index_job is not job:
+                return
+            self.search_index_job = None
+            self.store.set_search_index(index, texts)
+            if self.search_var.get().strip():
+                self.refresh_presets_display()
+
+        def on_error(error):
+            if self.search_index_job is job:
+                self.search_index_job = None
+            print(f"Error indexing presets for search: {error}")
+
+        job = BackgroundJob(
+            self.parent, "preset-search-index", lambda job: self.store.build_search_index(texts),
+            on_complete=on_complete,
+            on_error=on_error
+        )
+        self.search_index_job = job
+        job.start()
+
+    def on_search_changed(self, *args):
+        """Show the matches for the new search text, starting from the top."""
+        self.presets_canvas.yview_moveto(0)
+        self.refresh_presets_display()
+
+    def play_top_search_result(self, event=None):
+        """Play the best match for the search text."""
+        query = self.search_var.get().strip()
+        if query:
+            results = self.store.search(query, limit=1)
+            # No results while the index is still being built
+            if results:
+                self.play_preset(results[0]["text"])
+        return "break"
+
     def on_window_resize(self, event=None):
         """Handler for window resize events to adjust the presets layout."""
         # Only proceed if event is from the main window and presets are visible
@@ -266,7 +352,7 @@ class PresetsManager:
             widget.destroy()
 
         # Add "All" and "Favourites" tabs along with dynamic categories
-        for category in ["All", "Favourites"] + [cat["category"] for cat in self.presets if cat["category"] not in ["All", "Favourites"]]:
+        for category in ["All", "Favourites"] + [c for c in self.store.categories() if c not in ["All", "Favourites"]]:
             btn = ttk.Button(self.tabs_frame_inner, text=category, command=lambda c=category: self.switch_category(c))
             btn.pack(side=tk.LEFT, padx=2)
 
@@ -284,12 +370,7 @@ class PresetsManager:
 
     def refresh_presets_display(self):
         """Refresh displayed presets based on selected category."""
-        # Clear existing items in the scrollable frame
-        for widget in self.presets_scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        # Clear the preset cards tracking dictionary
-        self.preset_cards = {}
+        # Existing cards stay on screen until _populate_presets rebinds them
 
         # Debounce - cancel any previous refresh call if pending
         if hasattr(self, 'refresh_handle'):
@@ -297,22 +378,51 @@ class PresetsManager:
         self.refresh_handle = self.parent.after(100, self._populate_presets)
 
     def _populate_presets(self):
-        """Populate presets into grid layout with responsive columns."""
+        """Lay out the presets for the current category and bind the cards in view."""
+        started_at = time.perf_counter()
+        cards_created_before = self.cards_created
+
         # Filter presets based on current category
-        display_phrases = []
-        if self.current_category == "All":
-            for cat in self.presets:
-                display_phrases.extend(cat["phrases"])
-        elif self.current_category == "Favourites":
-            for cat in self.presets:
-                display_phrases.extend([p for p in cat["phrases"] if p["isFavourite"]])
-        else:
-            display_phrases = next((cat["phrases"] for cat in self.presets if cat["category"] == self.current_category), [])
+        query = self.search_var.get().strip()
+        # Until the search index is ready a search shows the unfiltered category
+        display_phrases = self.store.search(query) if query else None
+        self.search_status.configure(text="Indexing..." if query and display_phrases is None else "")
+        if display_phrases is None:
+            if self.current_category == "All":
+                display_phrases = self.store.all_phrases()
+            elif self.current_category == "Favourites":
+                display_phrases = self.store.favourite_phrases()
+            else:
+                display_phrases = self.store.phrases_in(self.current_category)
+        self.display_phrases = display_phrases
 
-        # Clear existing preset layout
-        for widget in self.presets_scrollable_frame.winfo_children():
-            widget.destroy()
-            
+        # Return every card to the pool; the ones needed are rebound below
+        self.free_cards.extend(self.visible_cards.values())
+        self.visible_cards = {}
+        self.preset_cards = {}
+
+        canvas_width = self._update_layout()
+        # Log for debugging - can be removed in production
+        print(f"Canvas width: {canvas_width}, Columns: {self.num_columns}")
+        self.update_visible_cards()
+
+        # Hide pooled cards that weren't needed this time
+        for card in self.free_cards:
+            self.presets_canvas.itemconfigure(card['window'], state="hidden")
+
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        print(f"Presets refreshed in {elapsed_ms:.1f} ms: {len(display_phrases)} phrases, "
+              f"{len(self.visible_cards)} cards shown, {self.cards_created - cards_created_before} created")
+
+    def _update_layout(self):
+        """
+        Work out the column count and card width for the canvas width, and size
+        the scroll region to cover every row even though only the visible ones
+        have cards.
+
+        Returns:
+            The canvas width used
+        """
         # Calculate number of columns based on available width
         canvas_width = self.presets_canvas.winfo_width()
         # Ensure we have a minimum width to calculate with
@@ -320,81 +430,127 @@ class PresetsManager:
             canvas_width = self.parent.winfo_width() - 40  # Estimate canvas width with more margin for scrollbar
         
         # Calculate number of columns (minimum 1, maximum 20)
-        min_card_width = 140  # Minimum width for each card
-        num_columns = max(1, min(20, canvas_width // min_card_width))
-        
-        # Log for debugging - can be removed in production
-        print(f"Canvas width: {canvas_width}, Columns: {num_columns}")
+        self.num_columns = max(1, min(20, canvas_width // self.MIN_CARD_WIDTH))
         
-        # Dynamically adjust card width based on available space
-        preset_width = max(min_card_width, (canvas_width // num_columns) - 10)  # Slightly more padding
-        preset_height = 100
-        
-        # Configure columns to fill available space
-        for col in range(num_columns):
-            self.presets_scrollable_frame.columnconfigure(col, weight=1)
+        # Share the width out between the columns
+        self.card_width = max(self.MIN_CARD_WIDTH, canvas_width // self.num_columns - 2 * self.CARD_PADDING)
 
-        # Populate filtered presets in grid layout
-        for i, phrase in enumerate(display_phrases):
-            # Create a unique identifier for the card
-            card_id = f"{phrase['text']}"
-            
-            # Calculate row and column based on the dynamic column count
-            row = i // num_columns
-            col = i % num_columns
-            
-            # Create a frame with no border for cleaner look
-            frame = ttk.Frame(self.presets_scrollable_frame, width=preset_width, height=preset_height)
-            frame.grid(row=row, column=col, padx=3, pady=3, sticky="nsew")
-            frame.grid_propagate(False)
-            
-            # Create inner frame with distinct background and no border - use common style
-            inner_frame = ttk.Frame(frame, style='PresetCard.TFrame')
-            inner_frame.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
+        total_rows = -(-len(self.display_phrases) // self.num_columns)
+        row_pitch = self.CARD_HEIGHT + 2 * self.CARD_PADDING
+        self.presets_canvas.configure(scrollregion=(0, 0, canvas_width, max(total_rows * row_pitch, 1)))
+        return canvas_width
 
-            # Make sure all rows are expandable too
-            self.presets_scrollable_frame.grid_rowconfigure(row, weight=1)
-            
-            # Text label with truncation for long text - use common style
-            wrapped_text = self.wrap_text(phrase["text"], max_lines=3, max_chars_per_line=20)
-            label = ttk.Label(inner_frame, text=wrapped_text, anchor="center", justify="center", 
-                            width=20, style='PresetLabel.TLabel')
-            label.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-            label.bind("<Button-1>", lambda e, t=phrase["text"]: self.insert_text(t))
-            label.bind("<Double-Button-1>", lambda e, t=phrase["text"]: self.play_preset(t))
-            
-            # Bottom frame for icons - use common style
-            bottom_frame = ttk.Frame(inner_frame, style='PresetBottom.TFrame')
-            bottom_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=2)
+    def relayout_presets(self):
+        """Move and resize the existing cards to fit the canvas width, without rebuilding them."""
+        self.resize_timer = None
+        old_layout = (self.num_columns, self.card_width)
+        self._update_layout()
+        if (self.num_columns, self.card_width) == old_layout:
+            return
 
-            # Choose correct heart icon based on favorite status
-            fav_img = self.heart_filled_icon if phrase["isFavourite"] else self.heart_icon
-            
-            # Favourite button with image - use common style and command that includes card_id
-            fav_btn = ttk.Button(bottom_frame, image=fav_img, 
-                              command=lambda p=phrase, c_id=card_id: self.toggle_favourite(p, c_id), 
-                              style='PresetButton.TButton')
-            fav_btn.pack(side=tk.RIGHT, padx=2)
-
-            # Delete button with image - use common style
-            del_btn = ttk.Button(bottom_frame, image=self.delete_icon, 
-                             command=lambda t=phrase["text"]: self.delete_preset(self.current_category, t), 
+        # One call resizes every card, pooled ones included
+        self.presets_canvas.itemconfigure("card", width=self.card_width)
+        for index, card in self.visible_cards.items():
+            self._place_card(card, index)
+        # The rows in view hold different phrases now the column count changed
+        self.update_visible_cards()
+
+    def on_presets_scrolled(self, first, last):
+        """Keep the scrollbar in step with the canvas and build cards for newly visible rows."""
+        self.presets_scrollbar.set(first, last)
+        self.update_visible_cards()
+
+    def update_visible_cards(self):
+        """Bind cards to the phrases in view, reusing cards that scrolled out of view."""
+        if not self.display_phrases:
+            return
+
+        row_pitch = self.CARD_HEIGHT + 2 * self.CARD_PADDING
+        top = self.presets_canvas.canvasy(0)
+        bottom = top + self.presets_canvas.winfo_height()
+        first_row = max(0, int(top // row_pitch) - self.OVERSCAN_ROWS)
+        last_row = int(bottom // row_pitch) + self.OVERSCAN_ROWS
+        wanted = range(first_row * self.num_columns,
+                       min(len(self.display_phrases), (last_row + 1) * self.num_columns))
+
+        # Release cards that have left the visible range
+        for index in [i for i in self.visible_cards if i not in wanted]:
+            card = self.visible_cards.pop(index)
+            self.presets_canvas.itemconfigure(card['window'], state="hidden")
+            self.preset_cards.pop(card['card_id'], None)
+            self.free_cards.append(card)
+
+        for index in wanted:
+            if index in self.visible_cards:
+                continue
+            card = self.free_cards.pop() if self.free_cards else self._create_card()
+            self._bind_card(card, self.display_phrases[index])
+            self._place_card(card, index)
+            self.presets_canvas.itemconfigure(card['window'], state="normal")
+            self.visible_cards[index] = card
+
+    def _place_card(self, card, index):
+        """Position a card at the grid cell for a phrase index."""
+        row, col = divmod(index, self.num_columns)
+        self.presets_canvas.coords(card['window'],
+                                   col * (self.card_width + 2 * self.CARD_PADDING) + self.CARD_PADDING,
+                                   row * (self.CARD_HEIGHT + 2 * self.CARD_PADDING) + self.CARD_PADDING)
+
+    def _create_card(self):
+        """Create an unbound card. Its widgets read the phrase from the card when used."""
+        card = {'phrase': None, 'card_id': None}
+        self.cards_created += 1
+
+        # Create a frame with no border for cleaner look
+        frame = ttk.Frame(self.presets_canvas)
+        
+        # Create inner frame with distinct background and no border - use common style
+        inner_frame = ttk.Frame(frame, style='PresetCard.TFrame')
+        inner_frame.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
+
+        # Text label with truncation for long text - use common style
+        label = ttk.Label(inner_frame, anchor="center", justify="center", width=20, style='PresetLabel.TLabel')
+        label.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        label.bind("<Button-1>", lambda e: self.insert_text(card['phrase']["text"]))
+        label.bind("<Double-Button-1>", lambda e: self.play_preset(card['phrase']["text"]))
+        
+        # Bottom frame for icons - use common style
+        bottom_frame = ttk.Frame(inner_frame, style='PresetBottom.TFrame')
+        bottom_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=2)
+
+        # Favourite button with image - use common style
+        fav_btn = ttk.Button(bottom_frame, image=self.heart_icon,
+                             command=lambda: self.toggle_favourite(card['phrase'], card['card_id']),
                              style='PresetButton.TButton')
-            del_btn.pack(side=tk.RIGHT, padx=2)
-            
-            # Store references to the card components for efficient updates
-            self.preset_cards[card_id] = {
-                'frame': frame,
-                'inner_frame': inner_frame,
-                'label': label,
-                'bottom_frame': bottom_frame,
-                'fav_btn': fav_btn,
-                'del_btn': del_btn,
-                'phrase': phrase
-            }
-
-        # Update scroll region after populating all items
-        self.presets_canvas.configure(scrollregion=self.presets_canvas.bbox("all"))
+        fav_btn.pack(side=tk.RIGHT, padx=2)
+
+        # Delete button with image - use common style
+        del_btn = ttk.Button(bottom_frame, image=self.delete_icon, 
+                             command=lambda: self.delete_preset(card['phrase']["id"]),
+                             style='PresetButton.TButton')
+        del_btn.pack(side=tk.RIGHT, padx=2)
+
+        # Store references to the card components for efficient updates
+        card.update({
+            'window': self.presets_canvas.create_window(0, 0, window=frame, anchor="nw", width=self.card_width,
+                                                        height=self.CARD_HEIGHT, state="hidden", tags="card"),
+            'frame': frame,
+            'inner_frame': inner_frame,
+            'label': label,
+            'bottom_frame': bottom_frame,
+            'fav_btn': fav_btn,
+            'del_btn': del_btn,
+        })
+        return card
+
+    def _bind_card(self, card, phrase):
+        """Show a phrase on a card."""
+        card['phrase'] = phrase
+        card['card_id'] = phrase["id"]
+        card['label'].configure(text=self.wrap_text(phrase["text"], max_lines=3, max_chars_per_line=20))
+        # Choose correct heart icon based on favorite status
+        card['fav_btn'].configure(image=self.heart_filled_icon if phrase["isFavourite"] else self.heart_icon)
+        self.preset_cards[card['card_id']] = card
 
     def update_preset_card(self, card_id):
         """Update a single preset card without refreshing the entire display."""
@@ -493,32 +649,18 @@ class PresetsManager:
 
     def toggle_favourite(self, phrase, card_id=None):
         """Toggle the favourite status of a preset."""
-        phrase["isFavourite"] = not phrase["isFavourite"]
+        try:
+            self.store.set_favourite(phrase["id"], not phrase["isFavourite"])
+        except sqlite3.Error as e:
+            messagebox.showerror("Error", f"Failed to save preset: {e}")
+            return
         
         # If we have the card_id, update just that card - much faster than refreshing everything
-        if card_id and card_id in self.preset_cards:
+        if card_id is not None and card_id in self.preset_cards:
             self.update_preset_card(card_id)
         else:
             # Otherwise, refresh the entire display (fallback, should rarely happen)
             self.refresh_presets_display()
-        
-        # Debounce the save operation to avoid writing to disk on every toggle
-        self.debounced_save()
-
-    def debounced_save(self):
-        """Save presets with debouncing to avoid frequent disk writes."""
-        # Cancel any pending save
-        if self.save_timer:
-            self.parent.after_cancel(self.save_timer)
-        
-        # Schedule a new save operation
-        self.save_timer = self.parent.after(1000, self._perform_save)
-        
-    def _perform_save(self):
-        """Actually perform the save operation after debounce."""
-        # Use threading to avoid blocking the UI
-        threading.Thread(target=self.save_presets, daemon=True).start()
-        self.save_timer = None
 
     def toggle_presets(self):
         """Toggle the visibility of the presets panel."""
@@ -587,7 +729,8 @@ class PresetsManager:
         text = self.parent.text_input.get("1.0", tk.END).strip()
         category = self.parent.category_var.get()
         if text and category != "Select Category":
-            self.add_preset(category, text, is_favourite=False)
+            if not self.add_preset(category, text, is_favourite=False):
+                return
             # Show success message with category information
             messagebox.showinfo("Save Successful", f"The text has been successfully saved to the category: '{category}'.")
         else:
@@ -612,7 +755,7 @@ class PresetsManager:
         ttk.Label(dialog, text="Enter preset category:").pack(pady=(15, 5))
         
         # Add existing categories dropdown
-        categories = ["Select Category"] + list(set([cat["category"] for cat in self.presets]))
+        categories = ["Select Category"] + self.store.categories()
         category_var = tk.StringVar(value="Select Category")
         
         category_combo = ttk.Combobox(dialog, textvariable=category_var, values=categories)
@@ -631,7 +774,8 @@ class PresetsManager:
             category = new_category if new_category else selected_category
             
             if category and category != "Select Category":
-                self.add_preset(category, text, is_favourite=False)
+                if not self.add_preset(category, text, is_favourite=False):
+                    return
                 messagebox.showinfo("Save Successful", f"The text has been successfully saved to the category: '{category}'.")
                 dialog.destroy()
             else:
@@ -649,88 +793,155 @@ class PresetsManager:
 
     def load_presets(self):
         """
-        Load presets from the JSON file, copying from example if necessary.
+        Load presets from the database, importing the JSON presets the first time.
+
+        Before the database existed presets were kept in config/presets.json;
+        that file (or the bundled example on a fresh install) is imported once
+        and left in place.
         
         Returns:
             List of preset categories with their phrases
         """
-        presets_path = Path("config/presets.json")
-        example_path = self.parent.resource_path("assets/presets.example.json")  # Path for the example file
+        try:
+            self.database = PresetDatabase()
+            if not self.database.is_initialized:
+                json_presets = self.load_json_presets()
+                if json_presets is None:
+                    # Keep this session in memory so nothing is written to the uninitialized
+                    # database, and the import is tried again next start
+                    self.database.close()
+                    self.database = None
+                    messagebox.showwarning("Presets Not Saved",
+                                           "Your presets could not be imported, so changes to presets "
+                                           "won't be saved this session. Fix config/presets.json and restart.")
+                    return []
+                # Number the phrases before importing so the ids are stable from now on
+                presets = PresetStore(json_presets).to_list()
+                self.database.import_presets(presets)
+                print(f"Imported {sum(len(cat['phrases']) for cat in presets)} presets into {self.database.path}")
+            return self.database.load_presets()
+        except sqlite3.Error as e:
+            messagebox.showerror("Error", f"Error loading presets: {e}")
+            self.database = None
+            return []  # Default to empty if load fails
 
-        # Check if presets.json exists, and if not, copy presets.example.json to config
+    def load_json_presets(self, presets_path=Path("config/presets.json")):
+        """
+        Read presets from a JSON file, falling back to the bundled example presets.
+        
+        Returns:
+            List of preset categories with their phrases, or None if the file
+            could not be read
+        """
         if not presets_path.exists():
-            try:
-                # Ensure config directory exists
-                presets_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Copy example presets to config directory
-                with open(example_path, "r", encoding="utf-8") as example_file:
-                    with open(presets_path, "w", encoding="utf-8") as config_file:
-                        config_file.write(example_file.read())
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to copy example presets: {e}")
-                return []  # Return empty if unable to load or copy presets
-
-        # Load presets.json as usual
+            presets_path = self.parent.resource_path("assets/presets.example.json")  # Path for the example file
+
         try:
             with open(presets_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
             return data.get("presets", [])
         except (FileNotFoundError, json.JSONDecodeError) as e:
             messagebox.showerror("Error", f"Error loading presets: {e}")
-            return []  # Default to empty if load fails
+            return None
+
+    def export_presets(self):
+        """Export the presets to a JSON file for sharing."""
+        path = filedialog.asksaveasfilename(
+            title="Export Presets",
+            defaultextension=".json",
+            initialfile="presets.json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if not path:
+            return
 
-    def save_presets(self):
-        """Save presets to the JSON file."""
-        data = {"presets": self.presets}
-        with open("config/presets.json", "w") as f:
-            json.dump(data, f, indent=2)
+        presets = [{"category": cat["category"],
+                    "phrases": [{"text": p["text"], "isFavourite": p["isFavourite"]} for p in cat["phrases"]]}
+                   for cat in self.store.to_list()]
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"presets": presets}, f, indent=2)
+            messagebox.showinfo("Export Successful", f"{len(self.store)} presets were exported to {path}.")
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to export presets: {e}")
+
+    def import_presets(self):
+        """Replace the presets with the contents of a JSON file, such as an edited export."""
+        path = filedialog.askopenfilename(
+            title="Import Presets",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        presets = self.load_json_presets(Path(path))
+        if not presets:
+            return
+        if not messagebox.askyesno("Import Presets", "This will replace all of your current presets. Continue?"):
+            return
+
+        # Number the phrases the way the store will, and only show them once they are saved
+        presets = PresetStore(presets).to_list()
+        if self.database:
+            try:
+                self.database.import_presets(presets)
+            except sqlite3.Error as e:
+                messagebox.showerror("Error", f"Failed to import presets: {e}")
+                return
+        self.store.load(presets)
+        self.current_category = "All"
+        self.populate_tabs()
+        self.refresh_presets_display()
+        # Loading dropped the search index
+        self.build_search_index()
+
+    def close(self):
+        """Close the preset database."""
+        if self.database:
+            self.database.close()
+            self.database = None
 
     def add_preset(self, category, text, is_favourite=False):
         """
-        Add a new preset and save it.
+        Add a new preset.
         
         Args:
             category: The category to add the preset to
             text: The text of the preset
             is_favourite: Whether the preset is a favorite
+
+        Returns:
+            True if the preset was saved
         """
-        for cat in self.presets:
-            if cat["category"] == category:
-                cat["phrases"].append({"text": text, "isFavourite": is_favourite})
-                break
-        else:
-            # Add a new category if not found
-            self.presets.append({"category": category, "phrases": [{"text": text, "isFavourite": is_favourite}]})
-        
-        # Save and refresh
-        self.debounced_save()
+        # The category is created if it doesn't exist yet
+        try:
+            self.store.add(category, text, is_favourite)
+        except sqlite3.Error as e:
+            messagebox.showerror("Error", f"Failed to save preset: {e}")
+            return False
         self.refresh_presets_display()
+        return True
 
-    def delete_preset(self, category, text):
+    def delete_preset(self, phrase_id):
         """
-        Delete a preset by category and text.
+        Delete a preset.
         
         Args:
-            category: The category of the preset
-            text: The text of the preset to delete
+            phrase_id: The id of the preset to delete
         """
-        for cat in self.presets:
-            if cat["category"] == category:
-                cat["phrases"] = [p for p in cat["phrases"] if p["text"] != text]
-                break
-                
-        # Save and refresh 
-        self.debounced_save()
+        try:
+            self.store.delete(phrase_id)
+        except sqlite3.Error as e:
+            messagebox.showerror("Error", f"Failed to delete preset: {e}")
+            return
         self.refresh_presets_display()
 
     def on_canvas_resize(self, event=None):
         """Handle resize events specifically for the presets canvas area."""
         # Only process if presets are visible
         if not self.presets_collapsed:
-            # Cancel any previous refresh timer to avoid multiple refreshes
+            # Cancel any pending relayout so a burst of resize events is handled once
             if hasattr(self, 'resize_timer') and self.resize_timer:
                 self.parent.after_cancel(self.resize_timer)
             
-            # Schedule a refresh with a short delay to avoid excessive refreshes during drag
-            self.resize_timer = self.parent.after(150, self.refresh_presets_display) 
\ No newline at end of file
+            # Moving the existing cards is cheap, so do it as soon as the burst is processed
+            self.resize_timer = self.parent.after_idle(self.relayout_presets) 
\ No newline at end of file
@@ -0,0 +1,214 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+
+import openai
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter shared by every OpenAI call in the app.
+
+    Two token buckets cap requests per minute and (estimated) tokens per
+    minute. Callers queue by priority class, so interactive speech is served
+    before transcription and edits, which are in turn served before bulk
+    background work. Rate limit (429) and server (5xx) responses are retried
+    with jittered exponential backoff; a 429 also holds back queued callers of
+    the same or lower priority until the server's Retry-After has passed, so a
+    refused bulk request never stalls interactive speech. The OpenAI clients
+    are created with max_retries=0 so these are the only retries.
+
+    Queue wait times and retries are recorded per priority class.
+    """
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+    PRIORITY_NAMES = {INTERACTIVE: "interactive", NORMAL: "normal", BACKGROUND: "background"}
+
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    MAX_ATTEMPTS = 5
+    BASE_DELAY = 1.0
+    MAX_DELAY = 30.0
+    # Longest single sleep while waiting, so cancellation is noticed promptly
+    POLL_INTERVAL = 0.25
+
+    def __init__(self, requests_per_minute=500, tokens_per_minute=200000):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Maximum requests started per minute
+            tokens_per_minute: Maximum estimated tokens (or characters / 4 for
+                               speech) sent per minute
+        """
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._blocked_until = {priority: 0.0 for priority in self.PRIORITY_NAMES}
+        self._last_refill = time.monotonic()
+        self.stats_by_priority = {
+            priority: {"requests": 0, "retries": 0, "total_wait": 0.0, "max_wait": 0.0}
+            for priority in self.PRIORITY_NAMES
+        }
+        self.configure(requests_per_minute, tokens_per_minute)
+
+    def configure(self, requests_per_minute, tokens_per_minute):
+        """Change the limits. Both buckets start (or are topped up) full."""
+        with self._cond:
+            self.requests_per_minute = max(1, int(requests_per_minute))
+            self.tokens_per_minute = max(1, int(tokens_per_minute))
+            self._request_allowance = float(self.requests_per_minute)
+            self._token_allowance = float(self.tokens_per_minute)
+            self._cond.notify_all()
+
+    @staticmethod
+    def estimate_tokens(text):
+        """Rough token count for a piece of text (about four characters per token)."""
+        return len(text or "") // 4 + 1
+
+    def call(self, fn, *args, priority=NORMAL, cost=0, cancel_check=None, **kwargs):
+        """
+        Run an OpenAI request once a slot is free, retrying rate limit and server errors.
+
+        Args:
+            fn: The client method to call
+            *args, **kwargs: Passed through to fn
+            priority: INTERACTIVE, NORMAL or BACKGROUND
+            cost: Estimated tokens the request will use
+            cancel_check: Optional callable that raises to abandon the wait
+
+        Returns:
+            Whatever fn returns
+        """
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            self.acquire(cost, priority, cancel_check)
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                status_code = getattr(e, "status_code", None)
+                retryable = status_code in self.RETRY_STATUS_CODES or isinstance(e, openai.APIConnectionError)
+                if not retryable or attempt == self.MAX_ATTEMPTS:
+                    raise
+                delay = self.get_retry_delay(e, attempt)
+                with self._cond:
+                    self.stats_by_priority[priority]["retries"] += 1
+                print(f"OpenAI request failed ({status_code or type(e).__name__}, attempt {attempt}), "
+                      f"retrying in {delay:.1f}s")
+                if status_code == 429:
+                    # Lower priority callers wait too, not just the caller that was refused
+                    self.block_for(delay, priority)
+                else:
+                    self._sleep(delay, cancel_check)
+
+    def acquire(self, cost=0, priority=NORMAL, cancel_check=None):
+        """Block until this caller is at the front of the queue and both buckets allow it."""
+        # Never ask for more than a full bucket, or the request could never run
+        cost = min(max(0, cost), self.tokens_per_minute)
+        ticket = (priority, next(self._sequence))
+        queued_at = time.monotonic()
+
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    if cancel_check:
+                        cancel_check()
+                    self._refill()
+                    now = time.monotonic()
+                    if self._waiting[0] != ticket:
+                        wait = self.POLL_INTERVAL
+                    elif now < self._blocked_until[priority]:
+                        wait = self._blocked_until[priority] - now
+                    elif self._request_allowance >= 1 and self._token_allowance >= cost:
+                        self._request_allowance -= 1
+                        self._token_allowance -= cost
+                        break
+                    else:
+                        request_wait = (1 - self._request_allowance) * 60.0 / self.requests_per_minute
+                        token_wait = (cost - self._token_allowance) * 60.0 / self.tokens_per_minute
+                        wait = max(request_wait, token_wait)
+                    self._cond.wait(timeout=min(max(wait, 0.01), self.POLL_INTERVAL))
+            finally:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+
+            waited = time.monotonic() - queued_at
+            stats = self.stats_by_priority[priority]
+            stats["requests"] += 1
+            stats["total_wait"] += waited
+            stats["max_wait"] = max(stats["max_wait"], waited)
+
+        if waited > 1:
+            print(f"Rate limiter: {self.PRIORITY_NAMES[priority]} request waited {waited:.1f}s")
+
+    def block_for(self, seconds, priority=INTERACTIVE):
+        """
+        Hold back queued requests for the given number of seconds.
+
+        Args:
+            seconds: How long to hold requests back
+            priority: Requests of this priority and lower are held; higher ones still run
+        """
+        until = time.monotonic() + seconds
+        with self._cond:
+            for blocked_priority in self._blocked_until:
+                if blocked_priority >= priority:
+                    self._blocked_until[blocked_priority] = max(self._blocked_until[blocked_priority], until)
+            self._cond.notify_all()
+
+    def get_retry_delay(self, error, attempt):
+        """Use the server's Retry-After header if present, else jittered exponential backoff."""
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        try:
+            return min(self.MAX_DELAY, max(0.5, float(headers.get("retry-after"))))
+        except (TypeError, ValueError):
+            # Full jitter so parallel workers don't retry in lockstep
+            return random.uniform(0.5, 1.0) * min(self.MAX_DELAY, self.BASE_DELAY * 2 ** (attempt - 1))
+
+    def stats(self):
+        """Return queue wait and retry metrics for each priority class."""
+        with self._cond:
+            result = {}
+            for priority, name in self.PRIORITY_NAMES.items():
+                stats = self.stats_by_priority[priority]
+                requests = stats["requests"]
+                result[name] = {
+                    "requests": requests,
+                    "retries": stats["retries"],
+                    "average_wait_ms": (stats["total_wait"] / requests * 1000) if requests else 0.0,
+                    "max_wait_ms": stats["max_wait"] * 1000,
+                }
+            result["queued"] = len(self._waiting)
+            return result
+
+    def get_diagnostics_text(self):
+        """Summarize queue waits for display in a settings dialog."""
+        stats = self.stats()
+        parts = [f"{name}: {stats[name]['requests']} requests, avg wait {stats[name]['average_wait_ms']:.0f} ms, "
+                 f"{stats[name]['retries']} retries"
+                 for name in self.PRIORITY_NAMES.values() if stats[name]["requests"]]
+        return "Requests - " + ("; ".join(parts) if parts else "none yet")
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_allowance = min(self.requests_per_minute,
+                                      self._request_allowance + elapsed * self.requests_per_minute / 60.0)
+        self._token_allowance = min(self.tokens_per_minute,
+                                    self._token_allowance + elapsed * self.tokens_per_minute / 60.0)
+
+    def _sleep(self, seconds, cancel_check=None):
+        deadline = time.monotonic() + seconds
+        while True:
+            if cancel_check:
+                cancel_check()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, self.POLL_INTERVAL))
@@ -0,0 +1,50 @@
+import re
+
+
+class SentenceBuffer:
+    """
+    Accumulates streamed text and hands back complete sentences as soon as
+    their terminating punctuation arrives.
+
+    Very short sentences ("Hi.", "Dr.") are held back and joined with the next
+    one so the TTS stage isn't asked to render tiny fragments.
+    """
+
+    # End of a sentence: terminal punctuation, optional closing quotes/brackets, then whitespace
+    SENTENCE_END = re.compile(r'(?<=[.!?…])["\'”’)\]]*\s+|\n+')
+    MIN_SENTENCE_CHARS = 20
+
+    def __init__(self, min_sentence_chars=MIN_SENTENCE_CHARS):
+        self.min_sentence_chars = min_sentence_chars
+        self._buffer = ""
+
+    def feed(self, delta):
+        """Add streamed text and return any sentences it completed."""
+        self._buffer += delta
+        sentences = []
+        search_from = 0
+        while True:
+            match = self.SENTENCE_END.search(self._buffer, search_from)
+            if not match:
+                break
+            candidate = self._buffer[:match.start()].strip()
+            if len(candidate) < self.min_sentence_chars:
+                # Too short on its own - keep looking for the next boundary
+                search_from = match.end()
+                continue
+            sentences.append(candidate)
+            self._buffer = self._buffer[match.end():]
+            search_from = 0
+        return sentences
+
+    def flush(self):
+        """Return whatever text remains once the stream has finished."""
+        remainder = self._buffer.strip()
+        self._buffer = ""
+        return [remainder] if remainder else []
+
+    @classmethod
+    def split(cls, text, min_sentence_chars=MIN_SENTENCE_CHARS):
+        """Split complete text into sentences in one go."""
+        buffer = cls(min_sentence_chars)
+        return buffer.feed(text) + buffer.flush()
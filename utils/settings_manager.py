@@ -1,11 +1,47 @@
+import atexit
+import copy
+import fnmatch
 import json
+import os
 import platform
+import tempfile
+import threading
+import time
 from pathlib import Path
 
 class SettingsManager:
     """
     Centralizes access to application settings to prevent conflicts between components.
+
+    Settings are cached in memory for the whole process and the file is only
+    re-read when its modification time or size changes, so frequent reads
+    are cheap. Writes are applied to the cache at once and written behind on
+    a background timer, atomically; call flush() before exiting.
+
+    Components that depend on particular settings subscribe() to their key
+    paths and are told when those values change, instead of reloading.
     """
+
+    WRITE_DEBOUNCE_SECONDS = 0.5
+    # Continuous updates still reach the disk at least this often
+    MAX_WRITE_DELAY_SECONDS = 2.0
+    # How long to wait before trying again after a failed write
+    WRITE_RETRY_SECONDS = 5.0
+
+    # Process-wide cache of the parsed settings and the file stat it came from
+    _cache = None
+    _cache_stat = None
+    _cache_lock = threading.RLock()
+    # Merged changes not yet written to disk, and the debounce timer that will write them
+    _pending = None
+    _first_pending_at = None
+    _flush_timer = None
+    # Bumped on every change, so a flush can tell whether newer changes arrived while it wrote
+    _pending_version = 0
+    # Serializes file writes without holding _cache_lock, so readers never wait on the disk
+    _write_lock = threading.Lock()
+    # (patterns, callback) pairs registered through subscribe()
+    _subscribers = []
     
     @staticmethod
     def get_settings_file_path(filename="settings.json"):
@@ -37,12 +73,81 @@ class SettingsManager:
                 "play_last_audio": ["ctrl", "shift", "8"],
                 "cancel_operation": ["ctrl", "shift", "1"]
             },
-            "max_tokens": 750
+            "max_tokens": 750,
+            "preroll_enabled": False,
+            "preroll_ms": 500,
+            "transcription_cache_enabled": True,
+            "transcription_cache_persist": False,
+            "transcription_cache_size": 100,
+            "pipelined_speech_to_speech": False,
+            "ai_cache_enabled": True,
+            "ai_cache_persist": False,
+            "ai_cache_size": 200,
+            "ai_bypass_enabled": False,
+            "ai_bypass_max_chars": 12,
+            "ai_bypass_clean_max_words": 12,
+            "ai_bypass_skip_list": ["ok", "okay", "thanks", "thank you", "yes", "no"],
+            "rate_limit_requests_per_minute": 500,
+            "rate_limit_tokens_per_minute": 200000,
+            "output_buffer_frames": {}
         }
     
     @classmethod
     def load_settings(cls):
-        """Load settings from file, with defaults for missing values."""
+        """
+        Load settings, with defaults for missing values.
+
+        Returns a copy of the cached settings unless the file has changed on
+        disk, so callers are free to modify the result.
+        """
+        with cls._cache_lock:
+            if cls._cache is not None and cls._cache_stat == cls._get_file_stat():
+                return copy.deepcopy(cls._cache)
+
+            old_settings = cls._cache
+            settings = cls._read_settings_file()
+            if cls._pending is not None:
+                # The file changed underneath us - keep our unwritten changes on top
+                cls._merge(settings, copy.deepcopy(cls._pending))
+            cls._cache = settings
+            cls._cache_stat = cls._get_file_stat()
+            result = copy.deepcopy(settings)
+
+        # Tell subscribers about values edited outside the app
+        cls._notify(old_settings, result)
+        return result
+
+    @classmethod
+    def get_setting(cls, key, default=None):
+        """
+        Read a single setting from the cache without copying the whole dictionary.
+
+        Args:
+            key: Top level key, or a dotted path such as "hotkeys.cancel_operation"
+            default: Value returned if the key is missing
+        """
+        with cls._cache_lock:
+            if cls._cache is None or cls._cache_stat != cls._get_file_stat():
+                cls.load_settings()
+            value = cls._cache
+            for part in key.split("."):
+                if not isinstance(value, dict) or part not in value:
+                    return default
+                value = value[part]
+            return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+    @classmethod
+    def _get_file_stat(cls):
+        """Return (mtime_ns, size) of the settings file, or None if it doesn't exist."""
+        try:
+            stat = os.stat(cls.get_settings_file_path())
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
+
+    @classmethod
+    def _read_settings_file(cls):
+        """Read and parse the settings file, filling in and saving any missing defaults."""
         settings_file = cls.get_settings_file_path()
         default_settings = cls.get_default_settings()
         
@@ -71,47 +176,202 @@ class SettingsManager:
             
             # Save if any settings were updated
             if settings_updated:
-                cls.save_settings(settings)
+                cls._store(settings)
                 print("Settings file updated with new default values")
                 
         except FileNotFoundError:
             # Create new settings file with defaults if it doesn't exist
             settings = default_settings
-            cls.save_settings(settings)
+            cls._store(settings)
         
         return settings
     
     @classmethod
     def save_settings(cls, settings):
-        """Save complete settings to file."""
-        settings_file = cls.get_settings_file_path()
-        
-        with open(settings_file, "w") as f:
-            json.dump(settings, f, indent=4)
+        """Save complete settings. The file is written shortly afterwards in the background."""
+        old_settings = cls._store(settings)
+        cls._notify(old_settings, settings)
     
     @classmethod
     def update_settings(cls, partial_settings):
         """
         Update only specific settings without touching others.
+
+        The change is visible to readers immediately. Updates made in quick
+        succession are merged and written together after a short debounce.
         
         Args:
             partial_settings: Dictionary containing only the settings to update
         """
-        # First load existing settings
-        current_settings = cls.load_settings()
-        
-        # Update settings (recursively for nested dictionaries)
-        def recursive_update(target, source):
-            for key, value in source.items():
-                if isinstance(value, dict) and key in target and isinstance(target[key], dict):
-                    # If both are dictionaries, update recursively
-                    recursive_update(target[key], value)
-                else:
-                    # Otherwise just update the value
-                    target[key] = value
-        
-        recursive_update(current_settings, partial_settings)
-        
-        # Save the updated settings
-        cls.save_settings(current_settings)
-        return current_settings 
\ No newline at end of file
+        with cls._cache_lock:
+            # First load existing settings
+            current_settings = cls.load_settings()
+            old_settings = cls._cache
+            cls._merge(current_settings, partial_settings)
+            cls._cache = copy.deepcopy(current_settings)
+
+            if cls._pending is None:
+                cls._pending = {}
+            cls._merge(cls._pending, copy.deepcopy(partial_settings))
+            cls._pending_version += 1
+            cls._schedule_flush()
+
+        cls._notify(old_settings, current_settings)
+        return current_settings
+
+    @classmethod
+    def subscribe(cls, patterns, callback):
+        """
+        Call callback whenever a matching setting changes.
+
+        Nested settings are addressed by dotted key paths, and patterns use
+        shell-style wildcards, so "hotkeys.*" matches every hotkey and "model"
+        only the model. The callback receives a dictionary of each changed
+        path to its (old_value, new_value), once per change, on the thread
+        that made the change - UI subscribers should marshal to Tk.
+
+        Args:
+            patterns: A key path pattern, or a list of them
+            callback: Callable taking the dictionary of changes
+        """
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        with cls._cache_lock:
+            cls._subscribers.append((tuple(patterns), callback))
+
+    @classmethod
+    def unsubscribe(cls, callback):
+        """Stop calling a callback registered with subscribe()."""
+        with cls._cache_lock:
+            cls._subscribers = [(patterns, cb) for patterns, cb in cls._subscribers if cb != callback]
+
+    @classmethod
+    def flush(cls):
+        """
+        Write any pending changes now. Called on shutdown so no change is lost.
+
+        The file is written outside the cache lock, and pending changes are
+        only dropped once they are on disk; a failed write is retried later.
+        """
+        with cls._write_lock:
+            with cls._cache_lock:
+                if cls._flush_timer:
+                    cls._flush_timer.cancel()
+                    cls._flush_timer = None
+                if cls._pending is None:
+                    return
+                settings = copy.deepcopy(cls._cache)
+                version = cls._pending_version
+
+            try:
+                cls._write_file(settings)
+            except Exception as e:
+                print(f"Error saving settings, retrying in {cls.WRITE_RETRY_SECONDS:.0f}s: {e}")
+                with cls._cache_lock:
+                    if cls._flush_timer is None:
+                        cls._start_flush_timer(cls.WRITE_RETRY_SECONDS)
+                return
+
+            with cls._cache_lock:
+                cls._cache_stat = cls._get_file_stat()
+                # Changes made during the write stay pending for the timer they scheduled
+                if cls._pending_version == version:
+                    cls._pending = None
+                    cls._first_pending_at = None
+
+    @staticmethod
+    def _merge(target, source):
+        """Recursively merge source into target, updating nested dictionaries in place."""
+        for key, value in source.items():
+            if isinstance(value, dict) and key in target and isinstance(target[key], dict):
+                # If both are dictionaries, update recursively
+                SettingsManager._merge(target[key], value)
+            else:
+                # Otherwise just update the value
+                target[key] = value
+
+    @classmethod
+    def _store(cls, settings):
+        """Replace the cached settings and schedule a full write. Returns the previous settings."""
+        with cls._cache_lock:
+            old_settings = cls._cache
+            cls._cache = copy.deepcopy(settings)
+            # A full save replaces anything still waiting to be written
+            cls._pending = copy.deepcopy(settings)
+            cls._pending_version += 1
+            cls._schedule_flush()
+            return old_settings
+
+    @classmethod
+    def _notify(cls, old_settings, new_settings):
+        """Send subscribers the changes between two versions of the settings."""
+        if old_settings is None or not cls._subscribers:
+            return
+        old_values = cls._flatten(old_settings)
+        new_values = cls._flatten(new_settings)
+        changes = {key: (old_values.get(key), new_values.get(key))
+                   for key in old_values.keys() | new_values.keys()
+                   if old_values.get(key) != new_values.get(key)}
+        if not changes:
+            return
+
+        for patterns, callback in list(cls._subscribers):
+            matched = {key: copy.deepcopy(values) for key, values in changes.items()
+                       if any(fnmatch.fnmatchcase(key, pattern) for pattern in patterns)}
+            if matched:
+                try:
+                    callback(matched)
+                except Exception as e:
+                    print(f"Error in settings subscriber: {e}")
+
+    @classmethod
+    def _flatten(cls, settings, prefix=""):
+        """Map dotted key paths to values for every leaf of a settings dictionary."""
+        flat = {}
+        for key, value in settings.items():
+            path = f"{prefix}{key}"
+            if isinstance(value, dict) and value:
+                flat.update(cls._flatten(value, f"{path}."))
+            else:
+                flat[path] = value
+        return flat
+
+    @classmethod
+    def _schedule_flush(cls):
+        """(Re)start the debounce timer, without postponing a write past MAX_WRITE_DELAY."""
+        now = time.monotonic()
+        if cls._first_pending_at is None:
+            cls._first_pending_at = now
+        if cls._flush_timer:
+            cls._flush_timer.cancel()
+        delay = min(cls.WRITE_DEBOUNCE_SECONDS, max(0, cls._first_pending_at + cls.MAX_WRITE_DELAY_SECONDS - now))
+        cls._start_flush_timer(delay)
+
+    @classmethod
+    def _start_flush_timer(cls, delay):
+        """Start a daemon timer that calls flush() after delay seconds."""
+        cls._flush_timer = threading.Timer(delay, cls.flush)
+        cls._flush_timer.daemon = True
+        cls._flush_timer.start()
+
+    @classmethod
+    def _write_file(cls, settings):
+        """Write settings through a temp file and atomic rename so a crash never leaves it half written."""
+        settings_file = Path(cls.get_settings_file_path())
+        fd, temp_path = tempfile.mkstemp(dir=settings_file.parent, prefix=settings_file.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(settings, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, settings_file)
+        except Exception:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+
+# Write anything still pending if the process exits without calling flush()
+atexit.register(SettingsManager.flush)
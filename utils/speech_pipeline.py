@@ -0,0 +1,273 @@
+import concurrent.futures
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+import wave
+
+from utils.background_job import JobCancelled
+from utils.portaudio import PortAudio
+from utils.rate_limiter import RateLimiter
+from utils.sentence_buffer import SentenceBuffer
+
+
+class PipelineMetrics:
+    """Timestamps for each stage of a speech-to-speech run."""
+
+    STAGES = [
+        ("transcribed", "Transcription"),
+        ("first_edit_token", "First AI edit token"),
+        ("first_sentence", "First complete sentence"),
+        ("first_audio_rendered", "First sentence rendered"),
+        ("playback_started", "Playback started"),
+        ("finished", "Playback finished"),
+    ]
+
+    def __init__(self, started_at=None):
+        self.started_at = started_at or time.perf_counter()
+        self.marks = {}
+
+    def mark(self, stage):
+        """Record the time a stage was first reached."""
+        self.marks.setdefault(stage, time.perf_counter())
+
+    def elapsed_ms(self, stage):
+        """Milliseconds from the start of the run to the given stage, or None."""
+        if stage not in self.marks:
+            return None
+        return (self.marks[stage] - self.started_at) * 1000
+
+    def report(self):
+        """Return a multi-line latency report for each stage."""
+        lines = ["Speech-to-speech latency:"]
+        previous = 0.0
+        for stage, label in self.STAGES:
+            elapsed = self.elapsed_ms(stage)
+            if elapsed is None:
+                continue
+            lines.append(f"  {label:<26} {elapsed:8.0f} ms  (+{elapsed - previous:.0f} ms)")
+            previous = elapsed
+        return "\n".join(lines)
+
+
+class SpeechPipeline:
+    """
+    Overlapped speech-to-speech: the AI copyedit is streamed, each sentence is
+    sent to TTS as soon as it is complete, and playback begins on the first
+    rendered sentence while later sentences are still being edited/rendered.
+
+    The pipeline runs inside a BackgroundJob worker so the existing cancel
+    hotkey and Stop buttons abandon every stage.
+    """
+
+    TTS_MODEL = "gpt-4o-mini-tts"
+    # Sentences rendered concurrently ahead of playback
+    TTS_WORKERS = 2
+    CHUNK_FRAMES = 1024
+
+    def __init__(self, app):
+        """
+        Initialize the Speech Pipeline
+
+        Args:
+            app: The parent TextToMic application instance
+        """
+        self.app = app
+        self.active_job = None
+        self.last_metrics = None
+
+    @property
+    def is_active(self):
+        """True while a pipeline run is in progress."""
+        return self.active_job is not None and self.active_job.is_running
+
+    def stop(self):
+        """Cancel the active pipeline run, if any."""
+        if self.is_active:
+            self.active_job.cancel()
+
+    def run(self, text, job, voice, tone_instructions, device_indices, apply_ai, settings, metrics):
+        """
+        Run the pipeline to completion on the calling (worker) thread.
+
+        Args:
+            text: The transcribed text
+            job: The BackgroundJob this run belongs to
+            voice: OpenAI voice name
+            tone_instructions: Tone instructions passed to TTS
+            device_indices: Output device indices to play to
+            apply_ai: Whether to stream the text through the AI copyeditor
+            settings: Settings snapshot taken on the Tk thread
+            metrics: PipelineMetrics for this run
+
+        Returns:
+            Tuple of (final text, path of the combined audio for replay or None)
+        """
+        self.active_job = job
+        sentence_queue = queue.Queue()
+        rendered_queue = queue.Queue()
+        temp_dir = tempfile.mkdtemp(prefix="text-to-mic-pipeline-")
+        rendered_files = []
+
+        tts_thread = threading.Thread(target=self._tts_stage, name="pipeline-tts",
+                                      args=(job, sentence_queue, rendered_queue, voice, tone_instructions, temp_dir, metrics),
+                                      daemon=True)
+        playback_thread = threading.Thread(target=self._playback_stage, name="pipeline-playback",
+                                           args=(job, rendered_queue, device_indices, rendered_files, metrics),
+                                           daemon=True)
+        tts_thread.start()
+        playback_thread.start()
+
+        edited_parts = []
+        try:
+            try:
+                def queue_sentence(sentence):
+                    metrics.mark("first_sentence")
+                    sentence_queue.put(sentence)
+
+                if apply_ai:
+                    job.report_progress("Streaming AI copyedit...")
+                    # The edit appears in the input box as it streams in
+                    for delta in self.app.ai_editor.apply_ai_streaming(text, update_ui=True, on_sentence=queue_sentence,
+                                                                       settings=settings):
+                        job.check_cancelled()
+                        metrics.mark("first_edit_token")
+                        edited_parts.append(delta)
+                else:
+                    edited_parts.append(text)
+                    for sentence in SentenceBuffer.split(text):
+                        queue_sentence(sentence)
+            finally:
+                # Always let the downstream stages drain and exit
+                sentence_queue.put(None)
+                tts_thread.join()
+                playback_thread.join()
+
+            job.check_cancelled()
+            metrics.mark("finished")
+            self.last_metrics = metrics
+            print(metrics.report())
+
+            final_text = "".join(edited_parts).strip()
+            combined_path = self._combine_for_replay(rendered_files)
+            return final_text, combined_path
+        finally:
+            self.active_job = None
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _tts_stage(self, job, sentence_queue, rendered_queue, voice, tone_instructions, temp_dir, metrics):
+        """Render sentences to wav files, passing ordered futures on to playback."""
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.TTS_WORKERS,
+                                                         thread_name_prefix="pipeline-render")
+        try:
+            index = 0
+            while True:
+                sentence = sentence_queue.get()
+                if sentence is None or job.cancelled:
+                    break
+                path = os.path.join(temp_dir, f"sentence_{index:04d}.wav")
+                future = executor.submit(self._render_sentence, sentence, path, voice, tone_instructions, metrics)
+                rendered_queue.put(future)
+                index += 1
+        finally:
+            rendered_queue.put(None)
+            executor.shutdown(wait=False)
+
+    def _render_sentence(self, sentence, path, voice, tone_instructions, metrics):
+        print(f"Pipeline rendering: {sentence}")
+        response = self.app.rate_limiter.call(
+            self.app.client.audio.speech.create,
+            model=self.TTS_MODEL,
+            voice=voice,
+            input=sentence,
+            instructions=tone_instructions,
+            response_format='wav',
+            priority=RateLimiter.INTERACTIVE,
+            cost=RateLimiter.estimate_tokens(sentence)
+        )
+        response.stream_to_file(path)
+        metrics.mark("first_audio_rendered")
+        return path
+
+    def _playback_stage(self, job, rendered_queue, device_indices, rendered_files, metrics):
+        """Play rendered sentences in order to every output device."""
+        p = PortAudio.open()
+        streams = {}  # device index -> (stream, format signature)
+        try:
+            while True:
+                future = rendered_queue.get()
+                if future is None or job.cancelled:
+                    break
+                try:
+                    path = future.result()
+                except Exception as e:
+                    print(f"Pipeline TTS error: {e}")
+                    job.run_on_ui(self.app.show_job_status, f"Speech synthesis failed: {e}")
+                    continue
+                rendered_files.append(path)
+
+                if metrics.elapsed_ms("playback_started") is None:
+                    metrics.mark("playback_started")
+                    job.run_on_ui(self.app.set_pipeline_playing, True)
+
+                self._play_file(p, streams, path, device_indices, job)
+        except JobCancelled:
+            print("Pipeline playback cancelled")
+        except Exception as e:
+            print(f"Pipeline playback error: {e}")
+        finally:
+            for stream, _ in streams.values():
+                try:
+                    stream.stop_stream()
+                    stream.close()
+                except Exception as e:
+                    print(f"Error closing pipeline stream: {e}")
+            PortAudio.terminate(p)
+            # Drain anything left so render threads aren't waited on needlessly
+            while not rendered_queue.empty():
+                rendered_queue.get_nowait()
+            self.app.after(0, lambda: self.app.set_pipeline_playing(False))
+
+    def _play_file(self, p, streams, path, device_indices, job):
+        """Write one wav file to all devices, interleaving chunks between them."""
+        with wave.open(path, 'rb') as wf:
+            signature = (wf.getsampwidth(), wf.getnchannels(), wf.getframerate())
+            # Streams are kept open between sentences unless the format changes
+            for device_index in device_indices:
+                existing = streams.get(device_index)
+                if existing and existing[1] == signature:
+                    continue
+                if existing:
+                    existing[0].close()
+                stream = p.open(format=p.get_format_from_width(signature[0]), channels=signature[1],
+                                rate=signature[2], output=True, output_device_index=int(device_index),
+                                frames_per_buffer=self.CHUNK_FRAMES)
+                streams[device_index] = (stream, signature)
+
+            data = wf.readframes(self.CHUNK_FRAMES)
+            while data:
+                if job.cancelled:
+                    raise JobCancelled()
+                for device_index in device_indices:
+                    streams[device_index][0].write(data)
+                data = wf.readframes(self.CHUNK_FRAMES)
+
+    def _combine_for_replay(self, rendered_files):
+        """Join the rendered sentences into a single wav so Replay works as usual."""
+        if not rendered_files:
+            return None
+        # A file of its own, so a replay or another request never reads it half written
+        combined_path = self.app.new_temp_audio_path("replay")
+        try:
+            with wave.open(str(combined_path), 'wb') as out:
+                for i, path in enumerate(rendered_files):
+                    with wave.open(path, 'rb') as wf:
+                        if i == 0:
+                            out.setparams(wf.getparams())
+                        out.writeframes(wf.readframes(wf.getnframes()))
+            return combined_path
+        except Exception as e:
+            print(f"Could not combine pipeline audio for replay: {e}")
+            return None
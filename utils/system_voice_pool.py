@@ -0,0 +1,165 @@
+import concurrent.futures
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+
+import pyttsx3
+from pydub import AudioSegment
+
+from utils.sentence_buffer import SentenceBuffer
+
+
+# Per-process engine state, set up by _init_worker in each pool process
+_engine = None
+_voice_ids = {}
+_current_voice_id = None
+
+
+def _init_worker(rate):
+    """Create this process's own pyttsx3 engine."""
+    global _engine, _voice_ids, _current_voice_id
+    _engine = pyttsx3.init()
+    _engine.setProperty('rate', rate)
+    _voice_ids = {voice.name: voice.id for voice in _engine.getProperty('voices')}
+    _current_voice_id = _engine.getProperty('voice')
+
+
+def _render_chunk(text, voice_name, path):
+    """Render one piece of text to a wav file in a pool process."""
+    global _current_voice_id
+    voice_id = _voice_ids.get(voice_name)
+    if voice_id and voice_id != _current_voice_id:
+        _engine.setProperty('voice', voice_id)
+        _current_voice_id = voice_id
+    _engine.save_to_file(text, path)
+    _engine.runAndWait()
+    return path
+
+
+class SystemVoicePool:
+    """
+    Renders system voice speech in parallel across worker processes.
+
+    A pyttsx3 engine can only render one utterance at a time, so long texts
+    are split into sentence-aligned chunks that are spread across a pool of
+    processes, each with its own engine. Every render goes
+    to a uniquely named file in a private temp directory, and chunks are
+    merged back in order into a single wav for playback. Callers discard()
+    the merged file once it is no longer needed for replay.
+
+    The pool is started on first use; short texts are better served by the
+    single in-process SystemVoiceWorker, which has no process start-up cost.
+    """
+
+    # Texts longer than this are split into chunks and rendered in parallel
+    LONG_TEXT_CHARS = 400
+    CHUNK_CHARS = 300
+
+    def __init__(self, max_workers=None, rate=150):
+        """
+        Initialize the pool. Worker processes are started on first use.
+
+        Args:
+            max_workers: Number of worker processes (defaults to min(4, CPU count))
+            rate: Speaking rate passed to each engine
+        """
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.rate = rate
+        self.temp_dir = None
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def render_text(self, text, voice_name):
+        """
+        Render text in parallel chunks and merge them into one wav file.
+
+        Returns:
+            A Future resolving to the path of the merged wav file
+        """
+        chunks = self.split_into_chunks(text)
+        chunk_futures = [self._submit(chunk, voice_name) for chunk in chunks]
+        merged_path = self._new_path("speech")
+
+        result = concurrent.futures.Future()
+
+        def merge():
+            try:
+                paths = [future.result() for future in chunk_futures]
+                result.set_result(self.merge_files(paths, merged_path))
+            except Exception as e:
+                result.set_exception(e)
+
+        # Merging waits on the chunk futures, so do it off the caller's thread
+        threading.Thread(target=merge, name="system-voice-merge", daemon=True).start()
+        return result
+
+    def discard(self, path):
+        """Delete a merged render once it is no longer needed. Ignores files the pool didn't create."""
+        if not path or not self.temp_dir or os.path.dirname(os.path.abspath(path)) != os.path.abspath(self.temp_dir):
+            return
+        try:
+            os.remove(path)
+        except OSError as e:
+            # Still open for playback on Windows; shutdown() removes it later
+            print(f"Could not remove system voice render {path}: {e}")
+
+    def split_into_chunks(self, text):
+        """Group sentences into chunks of roughly CHUNK_CHARS characters."""
+        chunks = []
+        current = ""
+        for sentence in SentenceBuffer.split(text):
+            if current and len(current) + len(sentence) > self.CHUNK_CHARS:
+                chunks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}".strip()
+        if current:
+            chunks.append(current)
+        return chunks or [text]
+
+    def merge_files(self, paths, output_path):
+        """Concatenate wav files in order, then remove the pieces."""
+        combined = AudioSegment.empty()
+        for path in paths:
+            combined += AudioSegment.from_wav(path)
+        combined.export(output_path, format="wav")
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return output_path
+
+    def shutdown(self):
+        """Stop the worker processes and remove rendered files."""
+        with self._lock:
+            if self._executor:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            if self.temp_dir:
+                shutil.rmtree(self.temp_dir, ignore_errors=True)
+                self.temp_dir = None
+
+    def _submit(self, text, voice_name):
+        executor = self._ensure_started()
+        return executor.submit(_render_chunk, text, voice_name, self._new_path("chunk"))
+
+    def _new_path(self, prefix):
+        return os.path.join(self.temp_dir, f"{prefix}_{uuid.uuid4().hex}.wav")
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._executor is None:
+                self.temp_dir = tempfile.mkdtemp(prefix="text-to-mic-system-voice-")
+                # spawn everywhere so each process gets a clean engine, not a forked copy
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.rate,)
+                )
+                print(f"System voice pool started with {self.max_workers} processes")
+            return self._executor
@@ -0,0 +1,130 @@
+import concurrent.futures
+import platform
+import queue
+import threading
+
+import pyttsx3
+
+
+class SystemVoiceWorker:
+    """
+    Owns the pyttsx3 engine on a single long-lived daemon thread.
+
+    pyttsx3 engines must be driven from the thread that created them, so all
+    work is sent through a request queue and answered with a Future. The
+    engine is created on first use rather than at startup, voice names are
+    resolved through a dictionary built once, and the engine's voice is only
+    changed when a request asks for a different one.
+
+    On Windows the SAPI5 driver uses COM, which must be initialized on every
+    thread that uses it, so the worker thread initializes it for itself.
+    """
+
+    DEFAULT_RATE = 150
+    # Voice name shown when the system reports no voices; uses the engine default
+    DEFAULT_VOICE_NAME = "Default"
+
+    def __init__(self, rate=DEFAULT_RATE):
+        """
+        Initialize the worker. The thread and engine are started on first use.
+
+        Args:
+            rate: Speaking rate passed to the engine
+        """
+        self.rate = rate
+        self.voice_ids = {}
+        self._engine = None
+        self._current_voice_id = None
+        self._requests = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def list_voices(self):
+        """Return a Future for the names of the installed system voices."""
+        return self._submit(lambda: list(self.voice_ids))
+
+    def render(self, text, voice_name, path):
+        """
+        Render text to a wav file with the given system voice.
+
+        Args:
+            text: The text to speak
+            voice_name: Name of a system voice, or DEFAULT_VOICE_NAME
+            path: Output wav file path
+
+        Returns:
+            A Future resolving to path once the file is written
+        """
+        return self._submit(lambda: self._render(text, voice_name, path))
+
+    def shutdown(self):
+        """Stop the worker thread after any queued requests."""
+        if self._thread and self._thread.is_alive():
+            self._requests.put(None)
+
+    def _submit(self, fn):
+        self._ensure_started()
+        future = concurrent.futures.Future()
+        self._requests.put((fn, future))
+        return future
+
+    def _ensure_started(self):
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="system-voice", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        com = self._init_com()
+        try:
+            while True:
+                request = self._requests.get()
+                if request is None:
+                    break
+                fn, future = request
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if self._engine is None:
+                        self._init_engine()
+                    future.set_result(fn())
+                except Exception as e:
+                    print(f"System voice error: {e}")
+                    future.set_exception(e)
+        finally:
+            # The engine belongs to this thread's COM apartment, so it goes with it
+            self._engine = None
+            if com:
+                com.CoUninitialize()
+
+    @staticmethod
+    def _init_com():
+        """Initialize COM for the current thread on Windows. Returns the module used, or None."""
+        if platform.system() != 'Windows':
+            return None
+        try:
+            import comtypes as com
+        except ImportError:
+            try:
+                import pythoncom as com
+            except ImportError:
+                print("Neither comtypes nor pywin32 is available; system voices may fail to start")
+                return None
+        com.CoInitialize()
+        return com
+
+    def _init_engine(self):
+        self._engine = pyttsx3.init()
+        self._engine.setProperty('rate', self.rate)
+        self.voice_ids = {voice.name: voice.id for voice in self._engine.getProperty('voices')}
+        self._current_voice_id = self._engine.getProperty('voice')
+        print(f"System voice engine ready with {len(self.voice_ids)} voices")
+
+    def _render(self, text, voice_name, path):
+        voice_id = self.voice_ids.get(voice_name)
+        if voice_id and voice_id != self._current_voice_id:
+            self._engine.setProperty('voice', voice_id)
+            self._current_voice_id = voice_id
+        self._engine.save_to_file(text, str(path))
+        self._engine.runAndWait()
+        return path
@@ -9,12 +9,14 @@ import json
 import sys
 import time
 import requests
-import pyttsx3
 import tempfile
+import shutil
+import uuid
+import concurrent.futures
 
 from pystray import Icon as icon, MenuItem as item, Menu as menu
 from PIL import Image, ImageDraw, ImageTk
-from tkinter import ttk, messagebox, simpledialog, Menu, Frame, Canvas, Scrollbar
+from tkinter import ttk, messagebox, simpledialog, filedialog, Menu, Frame, Canvas, Scrollbar
 import customtkinter as ctk
 from openai import OpenAI
 from dotenv import load_dotenv
@@ -27,10 +29,22 @@ from utils.hotkey_manager import HotkeyManager
 from utils.resource_utils import ResourceUtils
 from utils.tone_presets_manager import TonePresetsManager
 from utils.presets_manager import PresetsManager
+from utils.bulk_ai_editor import BulkAIEditor
+from utils.rate_limiter import RateLimiter
+from utils.system_voice_worker import SystemVoiceWorker
+from utils.system_voice_pool import SystemVoicePool
+from utils.device_registry import DeviceRegistry
+from utils.portaudio import PortAudio
+from utils.device_capabilities import DeviceCapabilityProber
+from utils.latency_profiler import LatencyProfiler
 from utils.ai_editor_manager import AIEditorManager
 from utils.settings_manager import SettingsManager
 from utils.app_text import AppText
 from utils.version_checker import VersionChecker
+from utils.background_job import BackgroundJob
+from utils.preroll_recorder import PrerollRecorder
+from utils.transcription_manager import TranscriptionManager
+from utils.speech_pipeline import SpeechPipeline, PipelineMetrics
 
 # Modify the load environment variables to load from config/.env
 def load_env_file():
@@ -73,10 +87,11 @@ class TextToMic(tk.Tk):
         # Withdraw window temporarily to prevent flashing before everything is ready
         self.withdraw()
         
-        # Initialize system TTS engine
-        self.engine = pyttsx3.init()
-        self.engine.setProperty('rate', 150)
-        self.system_voices = self.engine.getProperty('voices')
+        # System TTS runs on its own worker thread; the engine starts on first use
+        self.system_voice_worker = SystemVoiceWorker()
+        self.system_voices = []  # Names of installed system voices, filled in once listed
+        # Long texts are split and rendered across several processes instead
+        self.system_voice_pool = SystemVoicePool()
 
         self.available_models = ["gpt-4o-mini", "gpt-4o", "gpt-4-turbo"]
         self.default_model = "gpt-4o-mini"
@@ -123,12 +138,23 @@ class TextToMic(tk.Tk):
         self.has_api_key = bool(self.api_key)
         
         if self.has_api_key:
-            self.client = OpenAI(api_key=self.api_key)
+            # Retries are left to the shared rate limiter so they don't stack
+            self.client = OpenAI(api_key=self.api_key, max_retries=0)
         
         # Initializing device index variables before they are used
         self.device_index = tk.StringVar(self)
         self.device_index_2 = tk.StringVar(self)
 
+        # Cached device list, rescanned in the background to pick up hotplugged devices
+        self.device_registry = DeviceRegistry()
+        self.device_registry.refresh()
+        self.device_registry.add_listener(lambda added, removed: self.after(0, self.on_devices_changed, added, removed))
+
+        # Supported formats per device, persisted so playback can convert up front
+        self.capability_prober = DeviceCapabilityProber()
+        self.capability_probe_job = None
+        self.latency_profiler = LatencyProfiler(self)
+
         self.available_devices = self.get_audio_devices()  # Load audio devices
         self.available_input_devices = self.get_input_devices() # Load input devices
 
@@ -138,17 +164,36 @@ class TextToMic(tk.Tk):
         
         # Initialize settings before creating menu
         settings = self.load_settings()
+
+        # One limiter shared by every OpenAI request so interactive speech is served first
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=settings.get("rate_limit_requests_per_minute", 500),
+            tokens_per_minute=settings.get("rate_limit_tokens_per_minute", 200000)
+        )
+
         self.banner_var = tk.BooleanVar()
         self.banner_var.set(settings.get("hide_banner", False))
         
         # Initialize auto_check_version before creating menu
         self.auto_check_version = tk.BooleanVar(value=settings.get("auto_check_version", True))
+
+        # Shortcut text shown on the buttons, kept current by on_hotkeys_changed
+        self.shortcuts = self.format_shortcuts(settings["hotkeys"])
         
         # Create the presets manager before initializing the GUI
         self.presets_manager = PresetsManager(self)
         
         # Create the AI Editor Manager
         self.ai_editor = AIEditorManager(self)
+
+        # Batch copyediting of the preset library
+        self.bulk_ai_editor = BulkAIEditor(self, self.presets_manager)
+
+        # Create the Transcription Manager
+        self.transcription_manager = TranscriptionManager(self)
+
+        # Create the overlapped speech-to-speech pipeline
+        self.speech_pipeline = SpeechPipeline(self)
         
         # Store reference to presets state 
         self.presets_collapsed = self.presets_manager.presets_collapsed
@@ -156,12 +201,36 @@ class TextToMic(tk.Tk):
         # Initialize the main frame as a class variable for version notification to work
         self.main_frame = None
 
+        # Generated speech gets a unique file here so overlapping requests never share one
+        self.temp_audio_dir = tempfile.mkdtemp(prefix="text-to-mic-audio-")
+
+        # Background transcription, AI edit and speech jobs (None when idle)
+        self.transcription_job = None
+        self.ai_edit_job = None
+        self.speech_job = None
+        self.playback_convert_job = None
+        self.job_status_message = ""
+        self.job_status_animating = False
+
+        # Optional always-on input capture for instant hotkey recording
+        self.preroll_recorder = None
+        self.preroll_capture_active = False
+
         # Create menu and initialize GUI after presets manager is created
         self.create_menu()
         self.initialize_gui()
         
         # Initialize our HotkeyManager
         self.hotkey_manager = HotkeyManager(self)
+        self.update_shortcut_menu_labels(settings["hotkeys"])
+        SettingsManager.subscribe("hotkeys.*", self.on_hotkeys_changed)
+
+        # Start the pre-roll recorder if enabled
+        if settings.get("preroll_enabled", False):
+            self.start_preroll_recorder()
+
+        # Release audio devices cleanly when the window is closed
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Initialize version checker
         self.version_checker = VersionChecker(self, self.version)
@@ -250,6 +319,8 @@ class TextToMic(tk.Tk):
         settings_menu.add_command(label="AI Copyediting", command=self.show_ai_editor_settings)
         settings_menu.add_command(label="Keyboard Shortcuts", command=self.show_hotkey_settings)  
         settings_menu.add_command(label="Manage Tones", command=self.show_tone_presets_manager)
+        settings_menu.add_command(label="Re-probe Audio Devices", command=lambda: self.probe_device_capabilities(force=True))
+        settings_menu.add_command(label="Profile Output Latency...", command=self.latency_profiler.show_dialog)
         settings_menu.add_separator()
         
         # Add presets toggle with checkbox
@@ -257,19 +328,37 @@ class TextToMic(tk.Tk):
         settings_menu.add_checkbutton(label="Show Presets", variable=self.presets_visible_var, command=self.toggle_presets_from_menu)
         
         settings_menu.add_checkbutton(label="Auto Check for Updates", variable=self.auto_check_version, command=self.toggle_auto_version_check)
+        self.preroll_var = tk.BooleanVar(value=settings.get("preroll_enabled", False))
+        settings_menu.add_checkbutton(label="Always-On Mic Pre-roll", variable=self.preroll_var, command=self.toggle_preroll)
+        self.pipelined_var = tk.BooleanVar(value=settings.get("pipelined_speech_to_speech", False))
+        settings_menu.add_checkbutton(label="Pipelined Speech-to-Speech", variable=self.pipelined_var, command=self.toggle_pipelined_mode)
         settings_menu.add_checkbutton(label="Hide Scorchsoft Banner", variable=self.banner_var, command=self.toggle_banner)
 
         # Playback menu
         playback_menu = Menu(self.menubar, tearoff=0)
         self.menubar.add_cascade(label="Actions", menu=playback_menu)
+        self.playback_menu = playback_menu
         
+        # Menu entries (index, label) that show a hotkey, relabelled when it changes.
+        # Indices are recorded as the entries are added so other items can be inserted freely
+        self.shortcut_menu_entries = {}
+
+        def add_shortcut_command(name, label, shortcut, command):
+            playback_menu.add_command(label=f"{label} [{shortcut}]", command=command)
+            self.shortcut_menu_entries[name] = (playback_menu.index(tk.END), label)
+
         # Add keyboard shortcuts to menu items
-        playback_menu.add_command(label=f"Replay [{replay_shortcut}]", command=self.play_last_audio)
+        add_shortcut_command("play_last_audio", "Replay", replay_shortcut, self.play_last_audio)
         playback_menu.add_command(label="Apply AI Copyedit", command=self.apply_ai_to_input)
+        playback_menu.add_command(label="AI Copyedit Presets...", command=self.bulk_ai_editor.show_dialog)
         playback_menu.add_separator()
-        playback_menu.add_command(label=f"Start/Stop Recording [{record_shortcut}]", command=self.handle_record_button_click)
-        playback_menu.add_command(label=f"Stop Recording [{stop_shortcut}]", command=lambda: self.stop_recording(auto_play=False))
-        playback_menu.add_command(label=f"Cancel Operation [{cancel_shortcut}]", command=self.stop_playback)
+        add_shortcut_command("record_start_stop", "Start/Stop Recording", record_shortcut, self.handle_record_button_click)
+        add_shortcut_command("stop_recording", "Stop Recording", stop_shortcut, lambda: self.stop_recording(auto_play=False))
+        playback_menu.add_command(label="Transcribe Audio File...", command=self.transcribe_audio_file)
+        add_shortcut_command("cancel_operation", "Cancel Operation", cancel_shortcut, self.cancel_operation)
+        playback_menu.add_separator()
+        playback_menu.add_command(label="Import Presets...", command=self.presets_manager.import_presets)
+        playback_menu.add_command(label="Export Presets...", command=self.presets_manager.export_presets)
 
         # Help menu
         help_menu = Menu(self.menubar, tearoff=0)
@@ -287,7 +376,8 @@ class TextToMic(tk.Tk):
         new_key = APIKeyManager.change_api_key(self)
         if new_key:
             self.api_key = new_key
-            self.client = OpenAI(api_key=self.api_key)
+            # Retries are left to the shared rate limiter so they don't stack
+            self.client = OpenAI(api_key=self.api_key, max_retries=0)
 
     def get_audio_file_path(self, filename):
         if platform.system() == 'Darwin':  # Check if the OS is macOS
@@ -413,9 +503,13 @@ class TextToMic(tk.Tk):
         
         voice_label = ttk.Label(voice_frame, text="Voice:", width=label_width)
         voice_label.grid(column=0, row=1, sticky=tk.W, pady=(0, 5))
-        voice_menu = ttk.OptionMenu(voice_frame, self.voice_var, self.voice_var.get(), *self.available_voices, command=self.on_voice_change)
-        voice_menu.grid(column=1, row=1, sticky="ew", pady=(0, 5))
-        voice_menu.config(width=dropdown_width, style='Compact.TMenubutton')
+        self.voice_menu = ttk.OptionMenu(voice_frame, self.voice_var, self.voice_var.get(), *self.available_voices, command=self.on_voice_change)
+        self.voice_menu.grid(column=1, row=1, sticky="ew", pady=(0, 5))
+        self.voice_menu.config(width=dropdown_width, style='Compact.TMenubutton')
+
+        # List system voices in the background and add them to the menu when ready
+        self.system_voice_worker.list_voices().add_done_callback(
+            lambda future: self.after(0, self.on_system_voices_loaded, future))
 
         # Tone selection with warning for basic version
         self.tone_var = tk.StringVar(value=self.current_tone_name)
@@ -448,31 +542,36 @@ class TextToMic(tk.Tk):
 
         input_label = ttk.Label(device_frame, text="Input Device (optional):", width=label_width)
         input_label.grid(column=0, row=1, sticky=tk.W, pady=(0, 5))
-        input_device_menu = ttk.OptionMenu(device_frame, self.input_device_index, self.input_device_index.get(), 
+        self.input_device_menu = ttk.OptionMenu(device_frame, self.input_device_index, self.input_device_index.get(), 
                                           *self.available_input_devices.keys(), 
                                           command=self.on_input_device_change)
-        input_device_menu.grid(column=1, row=1, sticky="ew", pady=(0, 5))
-        input_device_menu.config(width=dropdown_width, style='Compact.TMenubutton')
+        self.input_device_menu.grid(column=1, row=1, sticky="ew", pady=(0, 5))
+        self.input_device_menu.config(width=dropdown_width, style='Compact.TMenubutton')
 
         primary_label = ttk.Label(device_frame, text="Primary Playback Device:", width=label_width)
         primary_label.grid(column=0, row=2, sticky=tk.W, pady=(0, 5))
-        primary_device_menu = ttk.OptionMenu(device_frame, self.device_index, self.device_index.get(), 
+        self.primary_device_menu = ttk.OptionMenu(device_frame, self.device_index, self.device_index.get(), 
                                             *self.available_devices.keys(),
                                             command=self.on_primary_device_change)
-        primary_device_menu.grid(column=1, row=2, sticky="ew", pady=(0, 5))
-        primary_device_menu.config(width=dropdown_width, style='Compact.TMenubutton')
+        self.primary_device_menu.grid(column=1, row=2, sticky="ew", pady=(0, 5))
+        self.primary_device_menu.config(width=dropdown_width, style='Compact.TMenubutton')
 
         secondary_label = ttk.Label(device_frame, text="Secondary Playback Device (optional):", width=label_width)
         secondary_label.grid(column=0, row=3, sticky=tk.W, pady=(0, 5))
-        secondary_device_menu = ttk.OptionMenu(device_frame, self.device_index_2, self.device_index_2.get(), 
+        self.secondary_device_menu = ttk.OptionMenu(device_frame, self.device_index_2, self.device_index_2.get(), 
                                               "None", *self.available_devices.keys(),
                                               command=self.on_secondary_device_change)
-        secondary_device_menu.grid(column=1, row=3, sticky="ew", pady=(0, 5))
-        secondary_device_menu.config(width=dropdown_width, style='Compact.TMenubutton')
+        self.secondary_device_menu.grid(column=1, row=3, sticky="ew", pady=(0, 5))
+        self.secondary_device_menu.config(width=dropdown_width, style='Compact.TMenubutton')
 
         # Make sure device_frame columns expand properly
         device_frame.columnconfigure(1, weight=1)
 
+        # Start watching for hotplugged devices now the menus exist
+        self.device_registry.start_polling()
+        # Probe any devices we haven't seen before once the window is up
+        self.after(1000, self.probe_device_capabilities)
+
         # Text to Read section with proper layout
         text_read_frame = ttk.Frame(main_frame)
         text_read_frame.grid(column=0, row=4, columnspan=2, sticky="ew", pady=(10, 0))
@@ -519,16 +618,18 @@ class TextToMic(tk.Tk):
         self.editing_status = ttk.Label(status_frame, text=status_text, foreground="#888888", font=("Arial", 8, "italic"), background="white")
         self.editing_status.pack(side=tk.RIGHT, padx=5)
 
+        # Stop button shown only while a transcription or AI edit is running
+        self.job_stop_button = ttk.Button(status_frame, text="Stop", width=5, style='Compact.TButton', command=self.cancel_active_jobs)
+
         # Create a frame for the buttons to allow for better styling
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(column=0, row=6, columnspan=2, sticky="ew", pady=(0, 20))
         button_frame.columnconfigure(0, weight=1)
         button_frame.columnconfigure(1, weight=1)
 
-        # Get keyboard shortcuts from settings
-        settings = self.load_settings()
-        record_shortcut = "+".join(filter(None, settings["hotkeys"]["record_start_stop"]))
-        play_shortcut = "+".join(filter(None, settings["hotkeys"]["play_last_audio"]))
+        # Get keyboard shortcuts
+        record_shortcut = self.shortcuts["record_start_stop"]
+        play_shortcut = self.shortcuts["play_last_audio"]
 
         # Button configuration
         self.recording = False  # State to check if currently recording
@@ -746,24 +847,99 @@ class TextToMic(tk.Tk):
 
 
     def get_audio_devices(self):
-        p = pyaudio.PyAudio()
-        devices = {}
-        for i in range(p.get_device_count()):
-            info = p.get_device_info_by_index(i)
-            if info['maxOutputChannels'] > 0:  # Filter for output-capable devices
-                devices[info['name']] = i
-        p.terminate()
-        return devices
+        """Return output-capable devices as a name -> index dictionary."""
+        return dict(self.device_registry.output_devices)
     
     def get_input_devices(self):
-        p = pyaudio.PyAudio()
-        devices = {}
-        for i in range(p.get_device_count()):
-            info = p.get_device_info_by_index(i)
-            if info['maxInputChannels'] > 0:  # Filter for input-capable devices
-                devices[info['name']] = i
-        p.terminate()
-        return devices
+        """Return input-capable devices as a name -> index dictionary."""
+        return dict(self.device_registry.input_devices)
+
+    def is_audio_busy(self):
+        """True while any stream is open, so a device measurement would compete with real audio."""
+        return bool(getattr(self, 'recording', False) or getattr(self, 'is_playing', False)
+                    or (getattr(self, 'preroll_recorder', None) and self.preroll_recorder.is_running)
+                    or (hasattr(self, 'speech_pipeline') and self.speech_pipeline.is_active))
+
+    def on_devices_changed(self, added, removed):
+        """Update the device lists and menus after a device is plugged in or removed."""
+        self.available_devices = self.get_audio_devices()
+        self.available_input_devices = self.get_input_devices()
+        self.refresh_device_menus()
+        if added:
+            self.probe_device_capabilities()
+
+    def probe_device_capabilities(self, force=False):
+        """Probe device formats in the background; force re-probes devices already known."""
+        if self.capability_probe_job and self.capability_probe_job.is_running:
+            return
+        devices = dict(self.device_registry.devices_by_index)
+
+        def work(job):
+            return self.capability_prober.probe_devices(devices, force=force, progress=job.report_progress)
+
+        def on_complete(probed):
+            self.capability_probe_job = None
+            if force:
+                summary = "\n".join(f"{name}: {self.capability_prober.describe(name)}" for name in probed)
+                messagebox.showinfo("Audio Devices Probed", f"Probed {len(probed)} audio devices.\n\n{summary}")
+
+        def on_error(error):
+            self.capability_probe_job = None
+            print(f"Device capability probe failed: {error}")
+            if force:
+                messagebox.showerror("Probe Error", f"Failed to probe audio devices: {str(error)}")
+
+        self.capability_probe_job = BackgroundJob(
+            self, "device-probe", work,
+            on_complete=on_complete,
+            on_error=on_error
+        ).start()
+
+    def convert_for_device(self, file_path, target_format, output_path):
+        """Convert a wav file to a (sample rate, channels, sample width) a device supports. Safe off the Tk thread."""
+        sample_rate, channels, sample_width = target_format
+        print(f"Converting {file_path} to {sample_rate} Hz, {channels} ch, {sample_width * 8}-bit for playback")
+        sound = AudioSegment.from_file(file_path)
+        sound = sound.set_frame_rate(sample_rate).set_channels(channels).set_sample_width(sample_width)
+        sound.export(output_path, format="wav")
+        return output_path
+
+    def get_playback_conversions(self, file_paths, device_indices):
+        """
+        Work out which files need converting before their device can play them.
+
+        Only the wav headers are read, so this is cheap enough for the Tk thread.
+
+        Returns:
+            Dictionary of position in file_paths -> (file path, target format)
+        """
+        conversions = {}
+        for position, (file_path, device_index) in enumerate(zip(file_paths, device_indices)):
+            try:
+                with wave.open(str(file_path), 'rb') as wf:
+                    params = (wf.getframerate(), wf.getnchannels(), wf.getsampwidth())
+            except Exception:
+                continue  # Reported when playback tries to open it
+            device_name = (self.device_registry.get_info(int(device_index)) or {}).get('name')
+            target_format = self.capability_prober.get_playback_format(device_name, *params)
+            if target_format:
+                conversions[position] = (str(file_path), target_format)
+        return conversions
+
+    def refresh_device_menus(self):
+        """Rebuild the device dropdowns from the current device lists."""
+        # A selected device that was unplugged stays selected, so it works again once replugged
+        menus = [
+            (self.input_device_menu, self.input_device_index, list(self.available_input_devices), self.on_input_device_change),
+            (self.primary_device_menu, self.device_index, list(self.available_devices), self.on_primary_device_change),
+            (self.secondary_device_menu, self.device_index_2, ["None"] + list(self.available_devices), self.on_secondary_device_change),
+        ]
+        for option_menu, variable, options, callback in menus:
+            menu = option_menu["menu"]
+            menu.delete(0, "end")
+            for option in options:
+                menu.add_command(label=option,
+                                command=lambda value=option, var=variable, cb=callback: (var.set(value), cb(value)))
 
     
     def get_audio_file_path(self, filename):
@@ -800,10 +976,6 @@ class TextToMic(tk.Tk):
         if is_system_voice:
             # Use system TTS
             system_voice_name = selected_voice.replace("[System] ", "")
-            for voice in self.system_voices:
-                if voice.name == system_voice_name:
-                    self.engine.setProperty('voice', voice.id)
-                    break
             
             # Convert device names to indices
             primary_index = self.available_devices.get(self.device_index.get(), None)
@@ -813,28 +985,29 @@ class TextToMic(tk.Tk):
                 messagebox.showerror("Error", "Primary device not selected or unavailable.")
                 return
             
-            try:
-                # Create a proper temporary file with a simple name in current directory
-                temp_filename = "temp_speech_output.wav"
-                
-                # Generate audio using system TTS
-                self.engine.save_to_file(text, temp_filename)
-                self.engine.runAndWait()
-                
-                # Store as last audio file for replay
-                self.last_audio_file = temp_filename
-                
-                # Play the generated audio
-                if primary_index and secondary_index != "None" and secondary_index is not None:
-                    self.play_audio_multiplexed([temp_filename, temp_filename],
-                                              [primary_index, secondary_index])
-                else:
-                    self.play_audio_multiplexed([temp_filename],
-                                              [primary_index])
-                
-                # We'll leave the file for potential replay rather than deleting it immediately
-            except Exception as e:
-                messagebox.showerror("TTS Error", f"Failed to generate or play system voice: {str(e)}")
+            if primary_index and secondary_index != "None" and secondary_index is not None:
+                device_indices = [primary_index, secondary_index]
+            else:
+                device_indices = [primary_index]
+
+            # Generate audio off the Tk thread so the UI stays responsive, then play
+            # it back on the Tk thread. Long texts are rendered in parallel chunks.
+            # Each request renders to its own file so a newer one never overwrites audio still playing
+            if len(text) > SystemVoicePool.LONG_TEXT_CHARS:
+                future = self.system_voice_pool.render_text(text, system_voice_name)
+            else:
+                future = self.system_voice_worker.render(text, system_voice_name, self.new_temp_audio_path("speech"))
+
+            def render(job):
+                # The engine can't be interrupted, so wait in short steps to notice cancellation
+                while True:
+                    job.check_cancelled()
+                    try:
+                        return future.result(timeout=0.25)
+                    except concurrent.futures.TimeoutError:
+                        continue
+
+            self.start_speech_job(render, device_indices, "TTS Error", "Failed to generate or play system voice")
                 
         else:
             # Use OpenAI TTS
@@ -863,28 +1036,33 @@ class TextToMic(tk.Tk):
                 messagebox.showerror("Error", "Primary device not selected or unavailable.")
                 return
             
-            try:
-                response = self.client.audio.speech.create(
+            if primary_index and secondary_index != "None" and secondary_index is not None:
+                device_indices = [primary_index, secondary_index]
+            else:
+                device_indices = [primary_index]
+
+            # The request can wait on the rate limiter, so it runs off the Tk thread. Each
+            # request streams to its own file, so one that is replaced never overwrites
+            # audio that is being played
+            audio_file = self.new_temp_audio_path("speech")
+
+            def render(job):
+                response = self.rate_limiter.call(
+                    self.client.audio.speech.create,
                     model="gpt-4o-mini-tts",
                     voice=selected_voice,
                     input=text,
                     instructions=tone_instructions,
-                    response_format='wav'
+                    response_format='wav',
+                    priority=RateLimiter.INTERACTIVE,
+                    cost=RateLimiter.estimate_tokens(text),
+                    cancel_check=job.check_cancelled
                 )
+                job.check_cancelled()
+                response.stream_to_file(audio_file)
+                return audio_file
 
-                self.last_audio_file = self.get_audio_file_path("last_output.wav")
-                response.stream_to_file(str(self.last_audio_file))
-
-                #Play to either two or a single stream
-                if primary_index and secondary_index != "None" and secondary_index is not None:
-                    self.play_audio_multiplexed([self.last_audio_file, self.last_audio_file],
-                                                [primary_index, secondary_index])
-                else:
-                    self.play_audio_multiplexed([self.last_audio_file],
-                                                [primary_index])
-
-            except Exception as e:
-                messagebox.showerror("API Error", f"Failed to generate audio: {str(e)}")
+            self.start_speech_job(render, device_indices, "API Error", "Failed to generate audio")
 
 
     def resample_audio(self, file_path, target_sample_rate):
@@ -895,7 +1073,72 @@ class TextToMic(tk.Tk):
         return resampled_file_path
 
     def play_audio_multiplexed(self, file_paths, device_indices):
-        """Play audio files to multiple devices with better cancellation handling."""
+        """Play audio files to multiple devices, converting first for devices that can't play them as-is."""
+        conversions = self.get_playback_conversions(file_paths, device_indices)
+        if not conversions:
+            self._start_playback(file_paths, device_indices)
+            return
+
+        # Converting decodes the whole file, so it runs off the Tk thread, and each
+        # playback converts into its own files so a later one never overwrites audio being read
+        if self.playback_convert_job and self.playback_convert_job.is_running:
+            self.playback_convert_job.cancel()
+        outputs = {conversion: self.new_temp_audio_path("converted") for conversion in set(conversions.values())}
+
+        def work(job):
+            job.report_progress("Converting audio for playback")
+            for (file_path, target_format), output_path in outputs.items():
+                job.check_cancelled()
+                self.convert_for_device(file_path, target_format, output_path)
+            return outputs
+
+        def discard_outputs():
+            for output_path in outputs.values():
+                if os.path.exists(output_path):
+                    self.discard_temp_audio(output_path)
+
+        def on_complete(converted):
+            if self.playback_convert_job is not job:
+                discard_outputs()
+                return
+            self.playback_convert_job = None
+            self.clear_job_status()
+            play_paths = [converted[conversions[position]] if position in conversions else path
+                          for position, path in enumerate(file_paths)]
+            self._start_playback(play_paths, device_indices, temp_files=list(converted.values()))
+
+        def on_error(error):
+            discard_outputs()
+            if self.playback_convert_job is not job:
+                return
+            self.playback_convert_job = None
+            self.clear_job_status()
+            messagebox.showerror("Playback Error", f"Failed to convert audio for playback: {error}")
+
+        def on_cancel():
+            if self.playback_convert_job is job:
+                self.playback_convert_job = None
+                self.clear_job_status()
+
+        job = BackgroundJob(
+            self, "playback-convert", work,
+            on_complete=on_complete,
+            on_error=on_error,
+            on_progress=self.show_job_status,
+            on_cancel=on_cancel
+        )
+        self.playback_convert_job = job
+        job.start()
+
+    def _start_playback(self, file_paths, device_indices, temp_files=()):
+        """
+        Open a stream per device and start playing, with better cancellation handling.
+
+        Args:
+            file_paths: Files to play, already in a format each device supports
+            device_indices: Output device for each file
+            temp_files: Converted files to delete once playback stops
+        """
         # Stop any existing playback first
         if hasattr(self, 'is_playing') and self.is_playing:
             self.stop_playback()
@@ -903,8 +1146,9 @@ class TextToMic(tk.Tk):
             time.sleep(0.2)
         
         # Make p and streams accessible for stop_playback
+        self.current_playback_temp_files = list(temp_files)
         try:
-            self.current_playback_p = pyaudio.PyAudio()
+            self.current_playback_p = PortAudio.open()
             self.current_playback_streams = []
             self.is_playing = True
             
@@ -917,6 +1161,9 @@ class TextToMic(tk.Tk):
             return
         
         try:
+            # Buffer sizes chosen with the latency profiler, by device name
+            buffer_frames = self.load_settings().get("output_buffer_frames", {})
+
             # Open all files and start all streams
             for file_path, device_index in zip(file_paths, device_indices):
                 if not self.is_playing:
@@ -934,6 +1181,7 @@ class TextToMic(tk.Tk):
                         continue
                         
                     wf = wave.open(file_path_str, 'rb')
+                    device_name = (self.device_registry.get_info(int(device_index)) or {}).get('name')
                 except FileNotFoundError:
                     messagebox.showerror("File Not Found", f"Could not find audio file: {file_path_str}")
                     continue  # Skip this iteration and proceed with other files if any
@@ -959,7 +1207,8 @@ class TextToMic(tk.Tk):
                         channels=wf.getnchannels(),
                         rate=wf_frame_rate,  # Use audio file's rate for now
                         output=True,
-                        output_device_index=int(device_index)
+                        output_device_index=int(device_index),
+                        frames_per_buffer=buffer_frames.get(device_name, pyaudio.paFramesPerBufferUnspecified)
                     )
                     
                 except Exception as e:
@@ -1031,6 +1280,10 @@ class TextToMic(tk.Tk):
     def stop_playback(self):
         """Stop any active audio playback."""
         print("Attempting to stop playback")
+
+        # Pipelined speech-to-speech plays from its own worker thread
+        if hasattr(self, 'speech_pipeline'):
+            self.speech_pipeline.stop()
         
         # Set flag first to exit any playback loops
         self.is_playing = False
@@ -1058,6 +1311,11 @@ class TextToMic(tk.Tk):
                 
                 # Clear the list after processing all streams
                 self.current_playback_streams = []
+
+            # Converted copies are only made for one playback
+            for temp_file in getattr(self, 'current_playback_temp_files', []):
+                self.discard_temp_audio(temp_file)
+            self.current_playback_temp_files = []
             
             # Terminate PyAudio instance - do this last and carefully
             if hasattr(self, 'current_playback_p') and self.current_playback_p:
@@ -1075,7 +1333,7 @@ class TextToMic(tk.Tk):
         """Complete the termination of PyAudio in a separate step to avoid crashes."""
         try:
             if hasattr(self, 'current_playback_p') and self.current_playback_p:
-                self.current_playback_p.terminate()
+                PortAudio.terminate(self.current_playback_p)
                 self.current_playback_p = None
                 print("PyAudio terminated successfully")
         except Exception as e:
@@ -1107,7 +1365,7 @@ class TextToMic(tk.Tk):
             return
         
         wf = wave.open(file_path, 'rb')
-        p = pyaudio.PyAudio()
+        p = PortAudio.open()
         try:
             stream = p.open(format=p.get_format_from_width(wf.getsampwidth()),
                             channels=wf.getnchannels(),
@@ -1122,7 +1380,7 @@ class TextToMic(tk.Tk):
             stream.stop_stream()
             stream.close()
             wf.close()
-            p.terminate()
+            PortAudio.terminate(p)
 
             
     def show_ai_editor_settings(self):
@@ -1150,8 +1408,60 @@ class TextToMic(tk.Tk):
             )
             return
         
-        # If we have an API key and AI is enabled, proceed with the AI editing
-        self.ai_editor.apply_ai()
+        text = self.text_input.get("1.0", tk.END).strip()
+        if not text:
+            return
+
+        # A newer request supersedes an edit that is still running
+        if self.ai_edit_job and self.ai_edit_job.is_running:
+            self.ai_edit_job.cancel()
+
+        # If we have an API key and AI is enabled, stream the edit into the input box
+        # on a background job so hotkeys and playback stay responsive
+        def work(job):
+            job.report_progress("AI copyediting")
+            edited_parts = []
+            for delta in self.ai_editor.apply_ai_streaming(text, update_ui=True, settings=settings):
+                job.check_cancelled()
+                edited_parts.append(delta)
+            return "".join(edited_parts)
+
+        def on_complete(processed_text):
+            if self.ai_edit_job is not job:
+                return
+            self.ai_edit_job = None
+            self.clear_job_status()
+            self.set_input_text(processed_text)
+
+        def on_error(error):
+            if self.ai_edit_job is not job:
+                return
+            self.ai_edit_job = None
+            self.ai_editor.cancel_ui_stream()
+            self.clear_job_status()
+            self.set_input_text(text)
+            messagebox.showerror("AI Copyedit Error", f"Failed to apply AI copyedit: {str(error)}")
+
+        def on_cancel():
+            print("AI copyedit cancelled")
+            # A superseded edit leaves the input box to the job that replaced it
+            if self.ai_edit_job is not job:
+                return
+            # Put back the original text rather than leaving a partial edit
+            self.ai_edit_job = None
+            self.ai_editor.cancel_ui_stream()
+            self.clear_job_status()
+            self.set_input_text(text)
+
+        job = BackgroundJob(
+            self, "ai-edit", work,
+            on_complete=on_complete,
+            on_error=on_error,
+            on_progress=self.show_job_status,
+            on_cancel=on_cancel
+        )
+        self.ai_edit_job = job
+        job.start()
 
     def chat_gpt_settings(self):
         """Delegate to AIEditorManager"""
@@ -1166,12 +1476,18 @@ class TextToMic(tk.Tk):
         return self.ai_editor.apply_ai(input_text)
 
     def get_device_info(self, device_index):
-        p = pyaudio.PyAudio()
+        """Return PortAudio's info for a device index from the registry cache."""
+        device_info = self.device_registry.get_info(int(device_index))
+        if device_info is not None:
+            return device_info
+
+        # Not seen by the last scan - ask PortAudio directly
+        p = PortAudio.open()
         try:
             device_info = p.get_device_info_by_index(device_index)
             return device_info
         finally:
-            p.terminate()
+            PortAudio.terminate(p)
     
     def toggle_recording(self, auto_play=False):
         if not self.recording:
@@ -1215,20 +1531,29 @@ class TextToMic(tk.Tk):
         try:
             self.recording = True
             
-            # Get keyboard shortcuts from settings
-            settings = self.load_settings()
-            record_shortcut = "+".join(filter(None, settings["hotkeys"]["record_start_stop"]))
-            play_shortcut = "+".join(filter(None, settings["hotkeys"]["play_last_audio"]))
-            stop_shortcut = "+".join(filter(None, settings["hotkeys"]["stop_recording"]))
-            cancel_shortcut = "+".join(filter(None, settings["hotkeys"]["cancel_operation"]))
-            
             # Update CTkButton for recording state, keeping shortcuts visible
             self.record_button.configure(text=f"Stop and Insert", fg_color="#d32f2f")
-            self.submit_button.configure(text=f"Stop and Play ({record_shortcut})", fg_color="#d32f2f")
+            self.submit_button.configure(text=f"Stop and Play ({self.shortcuts['record_start_stop']})", fg_color="#d32f2f")
+
+            # With pre-roll enabled the input stream is already open, so just start
+            # capturing from the ring buffer (which includes the last few hundred ms)
+            if self.preroll_recorder and self.preroll_recorder.is_running_for(input_device_id):
+                self.frames = self.preroll_recorder.begin_capture()
+                self.recording_sample_rate = self.preroll_recorder.sample_rate
+                self.preroll_capture_active = True
+                self.p = None
+                self.stream = None
+                self.record_thread = None
+
+                if play_confirm_sound:
+                    # Don't block the hotkey thread while the confirmation sound plays
+                    threading.Thread(target=self.play_sound, args=('assets/pop.wav',), daemon=True).start()
+                return
 
             self.frames = []
+            self.recording_sample_rate = sample_rate
 
-            self.p = pyaudio.PyAudio()
+            self.p = PortAudio.open()
             self.stream = self.p.open(format=pyaudio.paInt16, channels=1, rate=sample_rate, input=True, frames_per_buffer=1024, input_device_index=input_device_id)
 
             if play_confirm_sound:
@@ -1248,34 +1573,37 @@ class TextToMic(tk.Tk):
 
     def stop_recording(self, cancel_save=False, auto_play=False):
         self.recording = False
+        if self.preroll_capture_active:
+            # The pre-roll stream stays open; just take the captured frames
+            self.preroll_capture_active = False
+            self.frames = self.preroll_recorder.end_capture()
+
         if hasattr(self, 'record_thread') and self.record_thread:
             self.record_thread.join()
+            self.record_thread = None
 
         if hasattr(self, 'stream') and self.stream:
             self.stream.stop_stream()
             self.stream.close()
+            self.stream = None
 
         if hasattr(self, 'p') and self.p:
-            self.p.terminate()
+            PortAudio.terminate(self.p)
+            self.p = None
 
         if cancel_save==False:
             self.save_recording(auto_play=auto_play)
         
-        # Get keyboard shortcuts from settings
-        settings = self.load_settings()
-        record_shortcut = "+".join(filter(None, settings["hotkeys"]["record_start_stop"]))
-        play_shortcut = "+".join(filter(None, settings["hotkeys"]["play_last_audio"]))
-        
         # Reset button appearance
-        self.record_button.configure(text=f"Record Mic ({record_shortcut})", fg_color="#058705")
-        self.submit_button.configure(text=f"Play Audio ({play_shortcut})", fg_color="#058705")
+        self.record_button.configure(text=f"Record Mic ({self.shortcuts['record_start_stop']})", fg_color="#058705")
+        self.submit_button.configure(text=f"Play Audio ({self.shortcuts['play_last_audio']})", fg_color="#058705")
 
     def save_recording(self, auto_play = False):
         file_path = "output.wav"
         wf = wave.open(file_path, 'wb')
         wf.setnchannels(1)
-        wf.setsampwidth(self.p.get_sample_size(pyaudio.paInt16))
-        wf.setframerate(44100)
+        wf.setsampwidth(pyaudio.get_sample_size(pyaudio.paInt16))
+        wf.setframerate(getattr(self, 'recording_sample_rate', 44100))
         wf.writeframes(b''.join(self.frames))
         wf.close()
         print("Recording saved.")
@@ -1285,46 +1613,207 @@ class TextToMic(tk.Tk):
         self.after(0, self.transcribe_audio, file_path, auto_play)
         
     def transcribe_audio(self, file_path, auto_play=False):
-        try:
-            with open(str(file_path), "rb") as audio_file:
-                transcription = self.client.audio.transcriptions.create(
-                    file=audio_file,
-                    model="gpt-4o-transcribe",
-                    response_format="json"
-                )
-
-            settings = self.load_settings()
-            
-            # Always update the text with the raw transcription first
-            self.text_input.delete("1.0", tk.END)
-            self.text_input.insert("1.0", transcription.text)
-
-            # Check if AI processing is enabled AND we have an API key
-            if settings["chat_gpt_completion"] and settings["auto_apply_ai_to_recording"] and self.has_api_key:
-                auto_apply_ai = True
-            else:
-                auto_apply_ai = False
+        """Transcribe an audio file as a cancellable background job."""
+        # Only one transcription at a time - a newer recording supersedes the old one
+        if self.transcription_job and self.transcription_job.is_running:
+            self.transcription_job.cancel()
 
-            print(f"auto_apply_ai: {auto_apply_ai}")
+        # Settings are read here on the Tk thread so the worker never needs to
+        settings = self.load_settings()
+        auto_apply_ai = bool(settings["chat_gpt_completion"] and settings["auto_apply_ai_to_recording"] and self.has_api_key)
+        print(f"auto_apply_ai: {auto_apply_ai}")
+
+        # In pipelined mode the AI edit, synthesis and playback overlap sentence by sentence
+        pipeline_devices = self.get_selected_output_indices()
+        use_pipeline = bool(auto_play and settings.get("pipelined_speech_to_speech", False)
+                            and not self.voice_var.get().startswith("[System]") and pipeline_devices)
+        if use_pipeline:
+            voice = self.voice_var.get()
+            tone_instructions = self.get_tone_instructions()
+            metrics = PipelineMetrics()
+
+        def work(job):
+            job.report_progress("Transcribing audio...")
+            transcription_text = self.transcription_manager.transcribe(file_path, settings, job)
+            job.check_cancelled()
+
+            # Always show the raw transcription first
+            job.run_on_ui(self.set_input_text, transcription_text)
+
+            # Short or already-clean text is used as-is without a round trip
+            apply_ai = auto_apply_ai and not self.ai_editor.should_bypass(transcription_text, settings)
+
+            if use_pipeline:
+                metrics.mark("transcribed")
+                edited_text, replay_path = self.speech_pipeline.run(
+                    transcription_text, job, voice, tone_instructions, pipeline_devices,
+                    apply_ai, settings, metrics
+                )
+                return edited_text or transcription_text, replay_path
 
-            # If AI processing is enabled, apply it and update the text input again
-            if auto_apply_ai:
+            # If AI processing is enabled, stream the edit into the input box before
+            # handing the text back, checking for cancellation as it arrives
+            if apply_ai:
                 print("applying ai")
-                # Set the update_ui parameter to True to ensure the text gets updated
-                play_text = self.ai_editor.apply_ai(transcription.text, update_ui=True)
+                job.report_progress("Applying AI copyedit")
+                edited_parts = []
+                for delta in self.ai_editor.apply_ai_streaming(transcription_text, update_ui=True, settings=settings):
+                    job.check_cancelled()
+                    edited_parts.append(delta)
+                play_text = "".join(edited_parts)
             else:
                 print("outputting without ai")
-                play_text = transcription.text
+                play_text = transcription_text
 
-            if auto_play:
+            return play_text, None
+
+        def on_complete(result):
+            if self.transcription_job is not job:
+                return
+            play_text, pipeline_audio_file = result
+            self.transcription_job = None
+            self.clear_job_status()
+            self.set_input_text(play_text)
+
+            if use_pipeline:
+                if pipeline_audio_file:
+                    self.set_last_audio_file(pipeline_audio_file)
+                first_audio_ms = metrics.elapsed_ms("playback_started")
+                if first_audio_ms is not None:
+                    self.editing_status.config(text=f"Speech-to-speech: audio started after {first_audio_ms:.0f} ms")
+                    self.after(5000, self.clear_job_status)
+            elif auto_play:
                 print(f"Triggering auto play with: {play_text} ")
                 # Use a slight delay to allow UI to update before playback starts
                 self.after(100, lambda: self.submit_text_helper(play_text=play_text))
-            
+
             print("Transcription Complete: The audio has been transcribed and the text has been placed in the input area.")
-        
-        except Exception as e:
-            print(f"Transcription error: An error occurred during transcription: {str(e)}")
+
+        def on_error(error):
+            if self.transcription_job is not job:
+                return
+            self.transcription_job = None
+            self.clear_job_status()
+            print(f"Transcription error: An error occurred during transcription: {str(error)}")
+
+        def on_cancel():
+            print("Transcription cancelled")
+            # A superseded transcription leaves the status and input box to the job that replaced it
+            if self.transcription_job is not job:
+                return
+            self.transcription_job = None
+            self.ai_editor.cancel_ui_stream()
+            self.clear_job_status()
+
+        job = BackgroundJob(
+            self, "transcription", work,
+            on_complete=on_complete,
+            on_error=on_error,
+            on_progress=self.show_job_status,
+            on_cancel=on_cancel
+        )
+        self.transcription_job = job
+        job.start()
+
+    def set_pipeline_playing(self, playing):
+        """Reflect pipelined speech-to-speech playback in the playback state and buttons."""
+        if playing:
+            self.is_playing = True
+            self.update_buttons_for_playback(True)
+        elif self.is_playing:
+            self.is_playing = False
+            self.update_buttons_for_playback(False)
+
+    def toggle_pipelined_mode(self):
+        """Enable or disable pipelined speech-to-speech and save the setting."""
+        self.update_settings({"pipelined_speech_to_speech": self.pipelined_var.get()})
+
+    def get_selected_output_indices(self):
+        """Return the selected output device indices, or None if no primary device is set."""
+        primary_index = self.available_devices.get(self.device_index.get(), None)
+        if primary_index is None:
+            return None
+        secondary_index = self.available_devices.get(self.device_index_2.get(), None) if self.device_index_2.get() != "None" else None
+        if secondary_index is not None:
+            return [primary_index, secondary_index]
+        return [primary_index]
+
+    def get_tone_instructions(self):
+        """Get the instructions for the selected tone preset, or an empty string."""
+        selected_tone_name = self.tone_var.get()
+        if selected_tone_name != "None" and selected_tone_name in self.tone_presets:
+            return self.tone_presets[selected_tone_name]
+        return ""
+
+    def transcribe_audio_file(self):
+        """Ask for an existing audio file and transcribe it into the text box."""
+        if not self.has_api_key:
+            messagebox.showerror("API Key Required",
+                    "An OpenAI API Key is required for speech to text or to use OpenAI voices.\n\n"
+                    "Please add your API key in Settings.")
+            return
+
+        file_path = filedialog.askopenfilename(
+            parent=self,
+            title="Select Audio File to Transcribe",
+            filetypes=[("Audio files", "*.wav *.mp3 *.m4a *.mp4 *.ogg *.flac *.webm"), ("All files", "*.*")]
+        )
+        if file_path:
+            self.transcribe_audio(file_path)
+
+    def cancel_operation(self):
+        """Cancel the current background job, or stop playback if nothing else is running."""
+        if not self.cancel_active_jobs():
+            self.stop_playback()
+
+    def get_active_jobs(self):
+        """Return the background jobs (transcription, AI edit, speech, conversion) that are still running."""
+        return [job for job in (self.transcription_job, self.ai_edit_job, self.speech_job, self.playback_convert_job)
+                if job and job.is_running]
+
+    def has_active_job(self):
+        """True if a transcription, AI edit, speech or playback conversion job is running."""
+        return bool(self.get_active_jobs())
+
+    def cancel_active_jobs(self):
+        """Cancel all running background jobs. Returns True if any were cancelled."""
+        jobs = self.get_active_jobs()
+        for job in jobs:
+            job.cancel()
+        return bool(jobs)
+
+    def set_input_text(self, text):
+        """Replace the contents of the text input box."""
+        self.text_input.delete("1.0", tk.END)
+        self.text_input.insert("1.0", text)
+
+    def show_job_status(self, message):
+        """Show the progress of a background job in the status area, with a Stop button."""
+        if hasattr(self, 'editing_status'):
+            self.job_status_message = f"{message.rstrip('.')} ({self.shortcuts['cancel_operation']} to cancel)"
+            self.editing_status.config(text=self.job_status_message)
+            if not self.job_stop_button.winfo_ismapped():
+                self.job_stop_button.pack(side=tk.RIGHT, padx=(0, 2), before=self.editing_status)
+            if not self.job_status_animating:
+                self.job_status_animating = True
+                self._animate_job_status(0)
+
+    def _animate_job_status(self, step):
+        """Cycle trailing dots on the status text while a job is busy."""
+        if not self.has_active_job():
+            self.job_status_animating = False
+            return
+        dots = "." * (step % 4)
+        self.editing_status.config(text=f"{self.job_status_message} {dots}")
+        self.after(400, self._animate_job_status, step + 1)
+
+    def clear_job_status(self):
+        """Restore the status area after a background job finishes."""
+        if self.has_active_job():
+            # Another job is still busy and owns the status area
+            return
+        self.job_stop_button.pack_forget()
+        self.ai_editor.update_status_display()
 
     def load_settings(self):
         """Load settings using the SettingsManager."""
@@ -1342,6 +1831,29 @@ class TextToMic(tk.Tk):
         """Get the settings file path using SettingsManager."""
         return SettingsManager.get_settings_file_path(filename)
 
+    def format_shortcuts(self, hotkeys):
+        """Return the button text for each hotkey, e.g. {"record_start_stop": "ctrl+shift+0"}."""
+        return {name: "+".join(filter(None, keys)) for name, keys in hotkeys.items()}
+
+    def on_hotkeys_changed(self, changes):
+        """Refresh the shortcut text on the buttons and menu when a hotkey changes."""
+        self.after(0, self.refresh_shortcut_labels)
+
+    def refresh_shortcut_labels(self):
+        hotkeys = self.load_settings()["hotkeys"]
+        self.shortcuts = self.format_shortcuts(hotkeys)
+        self.update_shortcut_menu_labels(hotkeys)
+        if self.recording:
+            self.submit_button.configure(text=f"Stop and Play ({self.shortcuts['record_start_stop']})")
+        else:
+            self.update_buttons_for_playback(self.is_playing)
+
+    def update_shortcut_menu_labels(self, hotkeys):
+        """Show the current hotkeys next to their Actions menu entries."""
+        for name, (index, label) in self.shortcut_menu_entries.items():
+            shortcut = self.hotkey_manager.format_shortcut(hotkeys[name])
+            self.playback_menu.entryconfigure(index, label=f"{label} [{shortcut}]")
+
     # Methods for tone preset management
     def show_tone_presets_manager(self):
         """Show the tone presets manager dialog."""
@@ -1462,11 +1974,9 @@ class TextToMic(tk.Tk):
     def update_buttons_for_playback(self, is_playing):
         """Update button text based on playback state."""
         try:
-            # Get keyboard shortcuts from settings
-            settings = self.load_settings()
-            record_shortcut = "+".join(filter(None, settings["hotkeys"]["record_start_stop"]))
-            play_shortcut = "+".join(filter(None, settings["hotkeys"]["play_last_audio"]))
-            cancel_shortcut = "+".join(filter(None, settings["hotkeys"]["cancel_operation"]))
+            record_shortcut = self.shortcuts["record_start_stop"]
+            play_shortcut = self.shortcuts["play_last_audio"]
+            cancel_shortcut = self.shortcuts["cancel_operation"]
             
             if is_playing:
                 # Set both buttons to show stop with cancel shortcut
@@ -1509,6 +2019,62 @@ class TextToMic(tk.Tk):
         settings = self.load_settings()
         settings["input_device"] = device_name
         self.save_settings_to_JSON(settings)
+
+        # Move the pre-roll capture over to the newly selected device
+        if self.preroll_recorder and not self.recording:
+            self.start_preroll_recorder()
+
+    def toggle_preroll(self):
+        """Enable or disable the always-on pre-roll capture and save the setting."""
+        enabled = self.preroll_var.get()
+        self.update_settings({"preroll_enabled": enabled})
+        if enabled:
+            self.start_preroll_recorder()
+        else:
+            self.stop_preroll_recorder()
+
+    def start_preroll_recorder(self):
+        """Start (or restart) pre-roll capture on the selected input device."""
+        # While pre-roll holds the input open the hotplug poll can't rescan devices,
+        # so rescan now, between closing the old stream and opening the new one
+        if self.preroll_recorder:
+            self.preroll_recorder.stop()
+        self.device_registry.refresh(only_when_idle=True)
+        input_device_id = self.get_input_devices().get(self.input_device_index.get())
+        if input_device_id is None:
+            print("Pre-roll not started: no input device selected")
+            return
+
+        settings = self.load_settings()
+        try:
+            device_info = self.get_device_info(input_device_id)
+            sample_rate = int(device_info['defaultSampleRate']) if device_info else 44100
+            if not self.preroll_recorder:
+                self.preroll_recorder = PrerollRecorder(settings.get("preroll_ms", 500))
+            self.preroll_recorder.start(input_device_id, sample_rate)
+        except Exception as e:
+            print(f"Error starting pre-roll recorder: {e}")
+            self.stop_preroll_recorder()
+
+    def stop_preroll_recorder(self):
+        """Stop pre-roll capture and release the input device."""
+        if self.preroll_recorder:
+            self.preroll_recorder.stop()
+            self.preroll_recorder = None
+        self.preroll_capture_active = False
+
+    def on_close(self):
+        """Release background resources before closing the window."""
+        if self.recording:
+            self.stop_recording(cancel_save=True)
+        self.stop_preroll_recorder()
+        self.system_voice_worker.shutdown()
+        self.system_voice_pool.shutdown()
+        shutil.rmtree(self.temp_audio_dir, ignore_errors=True)
+        self.device_registry.stop()
+        self.presets_manager.close()
+        SettingsManager.flush()
+        self.destroy()
         
     def on_primary_device_change(self, device_name):
         """Save the selected primary output device in settings."""
@@ -1577,8 +2143,8 @@ class TextToMic(tk.Tk):
         # Add system voices with [System] prefix
         try:
             if hasattr(self, 'system_voices') and self.system_voices:
-                for voice in self.system_voices:
-                    voices.append(f"[System] {voice.name}")
+                for voice_name in self.system_voices:
+                    voices.append(f"[System] {voice_name}")
             
             # If no system voices were found, add a default system voice
             if not voices:
@@ -1591,6 +2157,101 @@ class TextToMic(tk.Tk):
         
         return voices
 
+    def on_system_voices_loaded(self, future):
+        """Add the installed system voices to the voice menu once the worker has listed them."""
+        try:
+            self.system_voices = future.result()
+        except Exception as e:
+            print(f"Error loading system voices: {e}")
+            return
+
+        self.available_voices = self.get_available_voices()
+        menu = self.voice_menu["menu"]
+        menu.delete(0, "end")
+        for voice in self.available_voices:
+            menu.add_command(label=voice,
+                            command=lambda value=voice: (self.voice_var.set(value), self.on_voice_change()))
+
+        # The placeholder system voice may have been replaced by the real ones
+        if self.voice_var.get() not in self.available_voices:
+            self.voice_var.set(self.available_voices[0])
+            self.on_voice_change()
+
+    def start_speech_job(self, render, device_indices, error_title, error_message):
+        """
+        Generate speech on a background job and play it, replacing any request still pending.
+
+        Args:
+            render: Callable taking the job and returning the path of the rendered wav
+            device_indices: Output devices to play the result on
+            error_title: Title of the error dialog if rendering fails
+            error_message: Start of the error dialog message
+        """
+        if self.speech_job and self.speech_job.is_running:
+            self.speech_job.cancel()
+
+        def work(job):
+            job.report_progress("Generating speech")
+            return render(job)
+
+        def on_complete(audio_file):
+            if self.speech_job is not job:
+                self.discard_temp_audio(audio_file)
+                return
+            self.speech_job = None
+            self.clear_job_status()
+            # Store as last audio file for replay
+            self.set_last_audio_file(audio_file)
+            #Play to either two or a single stream
+            self.play_audio_multiplexed([audio_file] * len(device_indices), device_indices)
+
+        def on_error(error):
+            if self.speech_job is not job:
+                return
+            self.speech_job = None
+            self.clear_job_status()
+            messagebox.showerror(error_title, f"{error_message}: {str(error)}")
+
+        def on_cancel():
+            if self.speech_job is not job:
+                return
+            self.speech_job = None
+            self.clear_job_status()
+
+        job = BackgroundJob(
+            self, "speech", work,
+            on_complete=on_complete,
+            on_error=on_error,
+            on_progress=self.show_job_status,
+            on_cancel=on_cancel
+        )
+        self.speech_job = job
+        job.start()
+
+    def new_temp_audio_path(self, prefix):
+        """Return a unique wav path in the app's temp audio directory, which is removed on exit."""
+        return os.path.join(self.temp_audio_dir, f"{prefix}_{uuid.uuid4().hex}.wav")
+
+    def discard_temp_audio(self, path):
+        """Delete a generated audio file that is no longer needed. Other files are left alone."""
+        if not path:
+            return
+        if os.path.dirname(os.path.abspath(str(path))) == os.path.abspath(self.temp_audio_dir):
+            try:
+                os.remove(path)
+            except OSError as e:
+                # Still open for playback on Windows; removed with the directory on exit
+                print(f"Could not remove temp audio {path}: {e}")
+        else:
+            self.system_voice_pool.discard(str(path))
+
+    def set_last_audio_file(self, audio_file):
+        """Remember the file Replay plays, deleting a generated file it replaces."""
+        previous = getattr(self, 'last_audio_file', None)
+        self.last_audio_file = audio_file
+        if previous and str(previous) != str(audio_file):
+            self.discard_temp_audio(previous)
+
     def on_voice_change(self, *args):
         """Handle voice selection change."""
         selected_voice = self.voice_var.get()
@@ -0,0 +1,243 @@
+import concurrent.futures
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import wave
+from pathlib import Path
+
+from pydub import AudioSegment
+from pydub.silence import detect_silence
+
+from utils.lru_cache_store import LRUCacheStore
+from utils.rate_limiter import RateLimiter
+from utils.settings_manager import SettingsManager
+
+
+class TranscriptionManager:
+    """
+    Handles speech to text for recordings and imported audio files.
+
+    Short clips are uploaded in a single request. Long recordings are split on
+    silence into roughly TARGET_SEGMENT_SECONDS pieces which are transcribed in
+    parallel with a bounded thread pool, retried individually on failure and
+    merged back together in order. Requests go through the app's shared
+    RateLimiter, which also retries rate limit and server errors.
+
+    Results are cached by a fingerprint of the normalized PCM audio and the
+    model name, so re-transcribing an identical clip costs no upload.
+    """
+
+    MODEL = "gpt-4o-transcribe"
+    LONG_RECORDING_SECONDS = 120
+    TARGET_SEGMENT_SECONDS = 30
+    # How far either side of the target cut point to look for a silence
+    SPLIT_SEARCH_SECONDS = 10
+    MIN_SILENCE_MS = 300
+    MAX_WORKERS = 4
+    # Audio is normalized to this format before fingerprinting so that the same
+    # speech saved at a different rate or channel count still hits the cache
+    FINGERPRINT_FRAME_RATE = 16000
+    CACHE_PATH = Path("config") / "transcription_cache.json"
+
+    def __init__(self, app):
+        """
+        Initialize the Transcription Manager
+
+        Args:
+            app: The parent TextToMic application instance
+        """
+        self.app = app
+
+        settings = SettingsManager.load_settings()
+        self.cache = LRUCacheStore(
+            max_entries=settings.get("transcription_cache_size", 100),
+            persist_path=self.CACHE_PATH if settings.get("transcription_cache_persist", False) else None
+        )
+
+    def transcribe(self, file_path, settings, job=None):
+        """
+        Transcribe an audio file, using the segmented path for long audio.
+
+        The file is decoded at most once; the fingerprint, the duration and
+        the segments all come from the same AudioSegment.
+
+        Args:
+            file_path: Path to a recording or any audio file ffmpeg can decode
+            settings: Settings dictionary, read by the caller on the Tk thread
+            job: Optional BackgroundJob used for progress and cancellation
+
+        Returns:
+            The transcribed text
+        """
+        file_path = str(file_path)
+        use_cache = settings.get("transcription_cache_enabled", True)
+
+        audio = None
+        if use_cache:
+            self.configure_cache(settings)
+            audio = AudioSegment.from_file(file_path)
+            cache_key = self.fingerprint(audio)
+            cached_text = self.cache.get(cache_key)
+            if cached_text is not None:
+                print(f"Transcription cache hit for {file_path}")
+                return cached_text
+        else:
+            duration = self.read_wav_duration_seconds(file_path)
+            if duration is None:
+                audio = AudioSegment.from_file(file_path)
+        if audio is not None:
+            duration = len(audio) / 1000.0
+        print(f"Transcribing {file_path} ({duration:.1f}s)")
+
+        if duration < self.LONG_RECORDING_SECONDS:
+            text = self._transcribe_limited(file_path, job)
+        else:
+            text = self._transcribe_segmented(audio or AudioSegment.from_file(file_path), job)
+
+        if use_cache:
+            self.cache.put(cache_key, text)
+        return text
+
+    def configure_cache(self, settings):
+        """Apply the current cache size and persistence settings."""
+        self.cache.resize(settings.get("transcription_cache_size", 100))
+        persist_path = self.CACHE_PATH if settings.get("transcription_cache_persist", False) else None
+        if persist_path != self.cache.persist_path:
+            self.cache.set_persist_path(persist_path)
+
+    def fingerprint(self, audio):
+        """
+        Build the cache key for decoded audio.
+
+        The key is a SHA-256 of the AudioSegment converted to 16-bit mono PCM
+        at a fixed rate (so container headers and metadata don't matter) plus
+        the model.
+        """
+        normalized = audio.set_channels(1).set_frame_rate(self.FINGERPRINT_FRAME_RATE).set_sample_width(2)
+        digest = hashlib.sha256(normalized.raw_data).hexdigest()
+        return f"{self.MODEL}:{digest}"
+
+    def read_wav_duration_seconds(self, file_path):
+        """Read the duration of a plain PCM wav from its header, or None if it needs decoding."""
+        if file_path.lower().endswith(".wav"):
+            try:
+                with wave.open(file_path, "rb") as wf:
+                    return wf.getnframes() / float(wf.getframerate())
+            except (wave.Error, EOFError):
+                pass  # Not plain PCM
+        return None
+
+    def split_on_silence(self, audio):
+        """
+        Work out where to cut an AudioSegment into roughly equal pieces.
+
+        Each cut is placed in the middle of the silence nearest to the target
+        segment length, falling back to a hard cut if there is no silence nearby.
+
+        Returns:
+            List of (start_ms, end_ms) tuples covering the whole audio
+        """
+        total_ms = len(audio)
+        target_ms = self.TARGET_SEGMENT_SECONDS * 1000
+        search_ms = self.SPLIT_SEARCH_SECONDS * 1000
+
+        # Silence is relative to the loudness of the recording itself
+        silence_thresh = audio.dBFS - 16 if audio.dBFS != float("-inf") else -50
+        silences = detect_silence(audio, min_silence_len=self.MIN_SILENCE_MS,
+                                  silence_thresh=silence_thresh, seek_step=10)
+        silence_midpoints = [(start + end) // 2 for start, end in silences]
+
+        ranges = []
+        start = 0
+        while total_ms - start > target_ms + search_ms:
+            target = start + target_ms
+            candidates = [m for m in silence_midpoints if abs(m - target) <= search_ms and m > start]
+            cut = min(candidates, key=lambda m: abs(m - target)) if candidates else target
+            ranges.append((start, cut))
+            start = cut
+        ranges.append((start, total_ms))
+        return ranges
+
+    def _transcribe_segmented(self, audio, job=None):
+        ranges = self.split_on_silence(audio)
+        print(f"Long recording split into {len(ranges)} segments: {ranges}")
+
+        texts = [None] * len(ranges)
+        temp_dir = tempfile.mkdtemp(prefix="text-to-mic-segments-")
+        futures = {}
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.MAX_WORKERS,
+                                                         thread_name_prefix="transcribe-segment")
+        try:
+            segment_paths = []
+            for i, (start, end) in enumerate(ranges):
+                segment_path = os.path.join(temp_dir, f"segment_{i:04d}.wav")
+                audio[start:end].set_channels(1).export(segment_path, format="wav")
+                segment_paths.append(segment_path)
+
+            if job:
+                job.report_progress(f"Transcribing {len(ranges)} segments...")
+
+            futures = {
+                executor.submit(self._transcribe_limited, path, job): i
+                for i, path in enumerate(segment_paths)
+            }
+            pending = set(futures)
+            done_count = 0
+            while pending:
+                done, pending = concurrent.futures.wait(pending, timeout=0.25,
+                                                        return_when=concurrent.futures.FIRST_COMPLETED)
+                if job:
+                    job.check_cancelled()
+                for future in done:
+                    # Raises if the segment failed on every attempt
+                    texts[futures[future]] = future.result()
+                    done_count += 1
+                    if job:
+                        job.report_progress(f"Transcribed segment {done_count}/{len(ranges)}...")
+        finally:
+            # Uploads already in flight can't be interrupted, so on cancellation or failure
+            # they are left to finish in the background rather than holding up the job
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._remove_when_done(temp_dir, list(futures))
+
+        return " ".join(text.strip() for text in texts if text and text.strip())
+
+    @staticmethod
+    def _remove_when_done(temp_dir, futures):
+        """Delete the segment directory once every future using it has finished."""
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def on_done(future):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        if not futures:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        # Runs at once for futures that are already finished or cancelled
+        for future in futures:
+            future.add_done_callback(on_done)
+
+    def _transcribe_limited(self, file_path, job=None):
+        """Transcribe a single file through the shared rate limiter, which handles retries."""
+        if job:
+            job.check_cancelled()
+        return self.app.rate_limiter.call(
+            self._request_transcription, file_path,
+            priority=RateLimiter.NORMAL,
+            cancel_check=job.check_cancelled if job else None
+        )
+
+    def _request_transcription(self, file_path):
+        with open(file_path, "rb") as audio_file:
+            transcription = self.app.client.audio.transcriptions.create(
+                file=audio_file,
+                model=self.MODEL,
+                response_format="json"
+            )
+        return transcription.text